@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+#
+# iHSV Servo Tool
+# Copyright (C) 2018 Robert Budde
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+# Headless acquisition - polls the live data of a drive and streams it as csv or capture file
+# (see iHSV_Capture, can be opened with "Open Capture" in the servo tool). Needs no Qt.
+#
+#   python iHSV-Servo-Cli.py --list
+#   python iHSV-Servo-Cli.py --port /dev/ttyUSB0 --rate 100 --duration 60 > data.csv
+#   python iHSV-Servo-Cli.py --port /dev/ttyUSB0 --divisor "Real Torque Current=10" > data.csv
+#   python iHSV-Servo-Cli.py --port /dev/ttyUSB0 --channels "Pos Cmd,Real Pos" --format capture --output run.ihsvcap
+#   python iHSV-Servo-Cli.py --port simulator --motor v6 --duration 10 > data.csv
+
+import argparse
+import os
+import sys
+import time
+
+from iHSV_Properties import iHSV
+from iHSV_Modbus import RtuTiming, compile_read_plan, open_bus
+from iHSV_Acquisition import AcquisitionWorker
+from iHSV_Capture import CaptureWriter, CsvWriter
+from iHSV_Diagnostics import Diagnostics, read_name
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Headless acquisition of the live data of a JMC iHSV servo')
+    parser.add_argument('--port', help='serial port of the drive, e.g. /dev/ttyUSB0, COM3 or simulator')
+    parser.add_argument('--slave', type=int, default=1, help='modbus slave address of the drive (default: %(default)s)')
+    parser.add_argument('--motor', default='v5', choices=sorted(iHSV.supported_motor_versions.values()),
+                        help='motor version (default: %(default)s)')
+    parser.add_argument('--channels', help='comma separated channel names (default: all)')
+    parser.add_argument('--rate', type=float, default=100.0,
+                        help='poll rate in Hz - lowered to what the drive sustains (default: %(default)s)')
+    parser.add_argument('--divisor', action='append', default=[], metavar='NAME=N',
+                        help='read a channel only every N-th poll cycle (repeatable)')
+    parser.add_argument('--duration', type=float, help='seconds to acquire (default: until Ctrl+C)')
+    parser.add_argument('--format', default='csv', choices=['csv', 'capture'], help='output format (default: %(default)s)')
+    parser.add_argument('--output', default='-', help='output file, - for stdout (default: %(default)s, csv only)')
+    parser.add_argument('--diagnostics', metavar='FILE', help='write round trip/error statistics as json when done')
+    parser.add_argument('--list', action='store_true', help='list the channels of the motor version and exit')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    ihsv = iHSV(args.motor)
+    live_data = ihsv.get_live_data_list()
+
+    if args.list:
+        for regs, signed, name in live_data:
+            print('{0:<24} {1} {2}'.format(name, ' '.join('0x{0:04X}'.format(reg) for reg in regs), 'signed' if signed else 'unsigned'))
+        return 0
+
+    if args.port is None:
+        print('--port is required', file=sys.stderr)
+        return 2
+    if args.rate <= 0:
+        print('--rate has to be positive', file=sys.stderr)
+        return 2
+    if args.format == 'capture' and args.output == '-':
+        print('capture files can not be written to stdout, use --output', file=sys.stderr)
+        return 2
+
+    names = [name for _, _, name in live_data]
+    if args.channels:
+        selected = [name.strip() for name in args.channels.split(',')]
+        unknown = [name for name in selected if name not in names]
+        if unknown:
+            print('Unknown channels: {0} (available: {1})'.format(', '.join(unknown), ', '.join(names)), file=sys.stderr)
+            return 2
+        names = selected
+    divisors = {}
+    for option in args.divisor:
+        name, _, divisor = option.rpartition('=')
+        if name not in names or not divisor.isdigit() or int(divisor) < 1:
+            print('Invalid --divisor {0} (expected NAME=N with one of: {1})'.format(option, ', '.join(names)), file=sys.stderr)
+            return 2
+        divisors[name] = int(divisor)
+    channels = [(name, regs, signed, divisors.get(name, 1)) for regs, signed, name in live_data if name in names]
+    timing = RtuTiming.from_settings(ihsv.rs232)
+    plan = compile_read_plan(channels, timing)
+    for entry in plan:
+        for _, name in entry[2]:
+            if entry[4] < divisors.get(name, 1):
+                print('{0} is read at 1/{1} along with faster channels'.format(name, entry[4]), file=sys.stderr)
+
+    # also gets the bus errors, retries and wait times of the transport
+    diagnostics = Diagnostics()
+    try:
+        bus = open_bus(args.port, ihsv.rs232, args.slave, ihsv.mv, diagnostics=diagnostics)
+    except Exception as e:
+        print('Failed to open port: {0}'.format(e), file=sys.stderr)
+        return 1
+    try:
+        bus.read_register(0x80)
+    except Exception as e:
+        print('Device does not respond: {0}'.format(e), file=sys.stderr)
+        bus.close()
+        return 1
+
+    output = None
+    try:
+        if args.format == 'capture':
+            # all channels of the motor version are described, only the selected ones are read
+            recorder = CaptureWriter(args.output, ihsv.mv, live_data, plan)
+        else:
+            output = sys.stdout if args.output == '-' else open(args.output, 'w', newline='')
+            recorder = CsvWriter(output, plan, names)
+    except Exception as e:
+        print('Failed to open output: {0}'.format(e), file=sys.stderr)
+        bus.close()
+        return 1
+
+    # samples only go to the recorder - nothing consumes the worker's sample queue
+    for entry in plan:
+        diagnostics.expect(read_name(entry[0], entry[1]), timing.read_time(entry[1]) - timing.turnaround)
+    worker = AcquisitionWorker(bus.read_registers, plan, period=1.0 / args.rate, maxlen=1, diagnostics=diagnostics)
+    worker.set_recorder(recorder)
+    start = time.perf_counter()
+    worker.start()
+    try:
+        while args.duration is None or time.perf_counter() - start < args.duration:
+            if recorder.error is not None:
+                break
+            time.sleep(0.05)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        worker.stop()
+        recorder.close()
+        if output is not None and output is not sys.stdout:
+            output.close()
+        bus.close()
+
+    if isinstance(recorder.error, BrokenPipeError) and output is sys.stdout:
+        # the reader went away (e.g. "| head") - not an error, but keep python from complaining about stdout
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    elif recorder.error is not None:
+        print('Writing failed: {0}'.format(recorder.error), file=sys.stderr)
+        return 1
+
+    elapsed = time.perf_counter() - start
+    stats = worker.statistics()
+    print('{0} cycles in {1:.1f} s ({2:.1f} Hz, jitter {3:.2f} ms), {4} ticks dropped, {5} read errors, {6} records dropped'.format(
+        recorder.records, elapsed, recorder.records / elapsed, stats['jitter'] * 1000, stats['dropped'], worker.errors,
+        recorder.dropped), file=sys.stderr)
+    if args.diagnostics:
+        stats['round_trip'] = {read_name(*block): seconds for block, seconds in stats['round_trip'].items()}
+        diagnostics.export(args.diagnostics, motor_version=ihsv.mv, port=args.port, slave=args.slave, acquisition=stats)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -16,182 +16,210 @@
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 
+import time
+startupTime = time.perf_counter()
+
 from PyQt5.QtCore import *
 from PyQt5.QtGui import *
 from PyQt5.QtWidgets import *
-from PyQt5.QtSerialPort import QSerialPortInfo
-
-import pyqtgraph as pg
 
 from iHSV_Properties import iHSV
+from iHSV_Parameters import ParameterCache
+from iHSV_Diagnostics import Diagnostics, COUNT_EDGES, read_name
 
 import os
-import numpy as np
-import serial
-import minimalmodbus
+import random
+import sys
+import traceback
 
+# pyqtgraph, numpy, pyserial and the modbus/acquisition/capture modules are imported
+# where they are needed - the window shows up before they are loaded (see initDeferred)
 
-class ModBusDataCurveItem(pg.PlotCurveItem):
+importTime = time.perf_counter()
 
-    signalIsActive = pyqtSignal(pg.PlotCurveItem, name='IsActive')
-    signalAttachToAxis = pyqtSignal(pg.PlotCurveItem, name='AttachToAxis')
 
-    def __init__(self, name='None', registers=[], signed=False, settings=None):
-        super().__init__(connect="finite", name=name)
+class ParameterReadJob(QThread):
 
-        self.registers = registers
-        self.signed = signed
-        self.settings = settings
-        self.color = QColor(255, 255, 255)
-        self.widget = QWidget()
-        layout = QGridLayout(self.widget)
-        self.colorButton = QPushButton()
-        self.colorButton.setFixedWidth(20)
-        self.colorButton.setFixedHeight(20)
-        self.colorButton.clicked.connect(self.chooseColor)
-        self.label = QLabel(self.name())
-        self.activeCheckbox = QCheckBox('Active')
-        self.activeCheckbox.toggled.connect(self.setActive)
-        self.axisCheckbox = QCheckBox('2nd Y')
-        self.axisCheckbox.toggled.connect(self.attachToAxis)
-        layout.addWidget(self.colorButton, 0, 0, 1, 2)
-        layout.setColumnMinimumWidth(0, 30)
-        layout.addWidget(self.label, 0, 1, 1, 2)
-        layout.setColumnMinimumWidth(1, 150)
-        layout.setColumnStretch(1, 0.5)
-        layout.addWidget(self.activeCheckbox, 0, 2)
-        layout.addWidget(self.axisCheckbox, 1, 2)
-        layout.setColumnMinimumWidth(2, 50)
-        layout.setColumnStretch(2, 0.5)
+    signalGroupRead = pyqtSignal(str, name='GroupRead')
+    signalProgress = pyqtSignal(int, int, name='Progress')
 
-        self.readSettings()
+    def __init__(self, bus, cache, ihsv, groups):
+        super().__init__()
+        self.bus = bus
+        self.cache = cache
+        self.ihsv = ihsv
+        self.groups = groups
+        self.cancelled = False
 
-    def readSettings(self):
-        try:
-            self.setColor(self.settings.value(self.name() + "/Color", QColor(255,255,255)))
-            self.activeCheckbox.setChecked(self.settings.value(self.name() + "/Active", False, type=bool))
-            self.axisCheckbox.setChecked(self.settings.value(self.name() + "/2ndAxis", False, type=bool))
-        except:
-            pass
+    def cancel(self):
+        # takes effect after the request on the bus
+        self.cancelled = True
 
-    def writeSettings(self):
-        try:
-            self.settings.setValue(self.name() + "/Color", self.color)
-            self.settings.setValue(self.name() + "/Active", self.activeCheckbox.isChecked())
-            self.settings.setValue(self.name() + "/2ndAxis", self.axisCheckbox.isChecked())
-        except:
-            pass
+    def run(self):
+        for nbr, group in enumerate(self.groups):
+            # only read what is not cached (or stale)
+            addresses = [int(configDataInfo['Address'], 16) for configDataInfo in self.ihsv.get_parameter_list([group])]
+            addresses = self.cache.stale(addresses)
+            if addresses:
+                from iHSV_Modbus import PRIORITY_PARAMETER, read_registers_batched
+                # monitor reads of the same port wait meanwhile
+                self.cache.update(read_registers_batched(self.bus.prioritized(PRIORITY_PARAMETER), addresses,
+                                                         cancelled=lambda: self.cancelled))
+            if self.cancelled:
+                break
+            self.signalGroupRead.emit(group)
+            self.signalProgress.emit(nbr + 1, len(self.groups))
 
-    def setColor(self, color):
-        if color.isValid():
-            self.color = color
-            self.colorButton.setStyleSheet("QPushButton { background-color: %s }" % (color.name()))
-            pen = pg.mkPen(self.color, width=2)
-            self.setPen(pen)
 
-    def chooseColor(self):
-        color = QColorDialog.getColor(self.color)
-        self.setColor(color)
+class ComportComboBox(QComboBox):
+    """ Enumerates the serial ports when opened for the first time
+    """
 
-    def setActive(self):
-        self.setData()
-        self.signalIsActive.emit(self)
+    def __init__(self):
+        super().__init__()
+        self.enumerated = False
+
+    def showPopup(self):
+        if not self.enumerated:
+            self.enumeratePorts()
+        super().showPopup()
 
-    def isActive(self):
-        return self.activeCheckbox.isChecked()
+    def enumeratePorts(self):
+        from PyQt5.QtSerialPort import QSerialPortInfo
 
-    def attachToAxis(self):
-        self.signalAttachToAxis.emit(self)
+        current = self.currentText()
+        self.clear()
+        for comport in QSerialPortInfo.availablePorts():
+            port = comport.portName()
+            if os.path.exists(os.path.join("/dev", port)):
+                port = os.path.join("/dev", port)
+            self.addItem(port)
+        self.addItem('simulator')
+        if current:
+            self.setComport(current)
+        self.enumerated = True
+
+    def setComport(self, port):
+        # the last used port can be opened without enumerating all ports
+        if self.findText(port) < 0:
+            self.addItem(port)
+        self.setCurrentText(port)
+
+
+class Drive:
+    """ A drive (slave address) on a serial port with its curves and cached parameters
+    """
+
+    def __init__(self, port='', slave=1):
+        self.port = port
+        self.slave = slave
+        self.bus = None
+        # never connected - monitoring shows noise instead, e.g. to try out the plots
+        self.noise = True
+        self.curves = []
+        self.readPlan = None
+        # parameters are re-read if older than 5 minutes (e.g. changed on the drive's panel)
+        self.parameterCache = ParameterCache(max_age=300)
 
     @property
-    def On2ndAxis(self):
-        return self.axisCheckbox.isChecked()
-
-    def appendData(self, rawValues):
-        if len(rawValues) == 2:
-            value = (rawValues[0] << 16) | rawValues[1]
-            if (0x80000000 & value): 
-                value = - (0x0100000000 - value)
-        elif self.signed:
-            value = rawValues[0]
-            if (0x8000 & value): 
-                value = - (0x010000 - value)
-        else:
-            value = rawValues[0]
-
-        if (self.yData is None):
-            self.setData([value])
-            self.setPos(0, 0)
-        elif (len(self.yData) <= 1000):
-            self.setData(np.append(self.yData, value))
-            self.setPos(-len(self.yData)+1, 0)
-        else:
-            self.yData = np.roll(self.yData,-1)
-            self.yData[-1] = value
-            # avoid copying data - xData etc. remain the same
-            self.path = None # required to trigger path update
-            self.update()
-            self.sigPlotChanged.emit(self)
+    def connected(self):
+        return self.bus is not None
 
-    def getRegisters(self):
-        return self.registers
+    def readRegisters(self, start, count):
+        # called from the acquisition thread
+        bus = self.bus
+        if bus is not None:
+            return bus.read_registers(start, count)
+        if not self.noise:
+            # closed while being polled - a gap, not made-up samples
+            raise IOError('Port closed')
+        return [int(random.gauss(0, 100)) & 0xFFFF for _ in range(count)]
 
 
 class MainWindow(QMainWindow):
 
+    signalInitialized = pyqtSignal(name='Initialized')
+
     def __init__(self):
         super(MainWindow, self).__init__()
 
         self.setWindowTitle("iHSV57 Servo Tool")
 
         self.settings = QSettings("IBB", "iHSV57 Servo Tool")
-        self.connected = False
 
         self.motorversion = 'v5'
         self.ihsv = iHSV(self.motorversion)
+        self.busTiming = None
+        self.drives = [Drive()]
+        # port: acquisition worker while monitoring
+        self.acquisitions = {}
+        self.recordingDrive = None
+        self.capture = None
+        self.parameterJob = None
+        # cancelled jobs finishing their request on the bus
+        self.cancelledParameterJobs = []
+        self.diagnostics = Diagnostics()
+        self.monitorPeriod = 0.01
+        self.monitorStart = 0
+        self.monitorTime = 0
+        # hands the samples to the curves and redraws them - at the refresh rate, not the sample rate
+        self.monitorTimer = QTimer()
+        self.monitorTimer.timeout.connect(self.updateCurves)
+        self.plot = None
+        self.curves = []
 
         ## Create some widgets to be placed inside
         self.cbSelectMotorVersion = QComboBox()
-        self.cbSelectComport = QComboBox()
+        self.cbSelectDrive = QComboBox()
+        self.pbAddDrive = QPushButton('Add Drive')
+        self.pbAddDrive.clicked.connect(self.addDrive)
+        self.pbRemoveDrive = QPushButton('Remove Drive')
+        self.pbRemoveDrive.clicked.connect(self.removeDrive)
+        self.cbSelectComport = ComportComboBox()
+        self.sbSlave = QSpinBox()
+        self.sbSlave.setPrefix('Slave: ')
+        self.sbSlave.setRange(1, 247)
         self.pbOpenCloseComport = QPushButton('Open Comport')
         self.pbOpenCloseComport.clicked.connect(self.openCloseComport)
         self.pbReadParams = QPushButton('Read Parameters')
         self.cbSelectParameterGroup = QComboBox()
         self.pbReadParams.clicked.connect(self.readParams)
+        self.pbReadAllParams = QPushButton('Read All Groups')
+        self.pbReadAllParams.clicked.connect(self.readAllParams)
+        self.parameterProgress = QProgressBar()
+        self.parameterProgress.setMaximumWidth(200)
+        self.parameterProgress.hide()
+        self.monitorStatus = QLabel()
         self.pbStartStopMonitor = QPushButton('Start Monitor')
         self.pbStartStopMonitor.setFixedHeight(100)
         self.pbStartStopMonitor.clicked.connect(self.startStopMonitor)
+        self.pbStartStopRecording = QPushButton('Record')
+        self.pbStartStopRecording.clicked.connect(self.startStopRecording)
+        self.pbOpenCapture = QPushButton('Open Capture')
+        self.pbOpenCapture.clicked.connect(self.openCapture)
+        self.sbHistory = QSpinBox()
+        self.sbHistory.setPrefix('History: ')
+        self.sbHistory.setSuffix(' s')
+        self.sbHistory.setRange(10, 4 * 3600)
+        self.sbHistory.setValue(10)
+        self.sbHistory.valueChanged.connect(self.setHistory)
+        self.sbRefreshRate = QSpinBox()
+        self.sbRefreshRate.setPrefix('Refresh: ')
+        self.sbRefreshRate.setSuffix(' fps')
+        self.sbRefreshRate.setRange(1, 60)
+        self.sbRefreshRate.setValue(30)
+        self.sbRefreshRate.valueChanged.connect(self.setRefreshRate)
 
         self.ParamTable = QTableWidget(1, 1, self)
+        self.ParamTable.cellChanged.connect(self.writeParams)
 
-        pg.setConfigOptions(antialias=False)
-        self.plot = pg.PlotWidget()
-        self.plot.setDownsampling(mode='peak')
-        self.plot.setClipToView(True)
-        self.plot.setXRange(-100, 0)
-        self.plot.setYRange(-200, 200)
-        self.plot.setLimits(xMin=-1000, xMax=0, minXRange=20, maxXRange=1000)
-        self.plot.setLabel('bottom', text='Time', units='s')
-        self.plot.getAxis('bottom').setScale(0.01)
-        self.plot.showAxis('right')
-
-        self.plot2ndAxis = pg.ViewBox()
-        self.plot.scene().addItem(self.plot2ndAxis)
-        self.plot.getAxis('right').linkToView(self.plot2ndAxis)
-        self.plot2ndAxis.setXLink(self.plot)
-        self.plot2ndAxis.setYRange(-10, 10)
-
-        def updateViews():
-            self.plot2ndAxis.setGeometry(self.plot.getViewBox().sceneBoundingRect())
-            self.plot2ndAxis.linkedViewChanged(self.plot.getViewBox(), self.plot2ndAxis.XAxis)
-
-        updateViews()
-        self.plot.getViewBox().sigResized.connect(updateViews)
+        # the plot is created by initDeferred
+        self.plotContainer = QWidget()
+        self.plotLayout = QVBoxLayout(self.plotContainer)
+        self.plotLayout.setContentsMargins(0, 0, 0, 0)
 
         self.vbox = QVBoxLayout()
 
-        self.getDataPlots()
-
         self.groupBox = QGroupBox('Data plots')
         self.vbox.addStretch(1)
         self.groupBox.setLayout(self.vbox)
@@ -203,54 +231,208 @@ class MainWindow(QMainWindow):
         layout = QGridLayout(self.widget)
 
         ## Add widgets to the layout in their proper positions
-        layout.addWidget(self.plot, 0, 0, 1, 2)  # plot goes on top, spanning 2 columns
+        layout.addWidget(self.plotContainer, 0, 0, 1, 2)  # plot goes on top, spanning 2 columns
         layout.addWidget(self.groupBox, 0, 2)  # legend to the right
         layout.setColumnMinimumWidth(0, 200)
         layout.setColumnStretch(1, 1)
         layout.setColumnMinimumWidth(1, 200)
         layout.setColumnMinimumWidth(2, 250)
         layout.addWidget(self.cbSelectMotorVersion, 1, 0)  # MotorVersion-combobox goes in upper-left
-        layout.addWidget(self.cbSelectComport, 2, 0)   # comport-combobox goes in 2nd upper-left
-        layout.addWidget(self.pbOpenCloseComport, 3, 0)   # open/close button goes in middle-left
-        layout.addWidget(self.cbSelectParameterGroup, 4, 0)  # parameter-group-combobox
-        layout.addWidget(self.pbReadParams, 5, 0)
-        layout.addWidget(self.pbStartStopMonitor, 6, 0)
-        layout.addWidget(self.ParamTable, 1, 1, 6, 2)  # list widget goes in bottom-left
+        layout.addWidget(self.cbSelectDrive, 2, 0)  # drive-combobox, the rows below apply to the selected drive
+        driveButtons = QHBoxLayout()
+        driveButtons.addWidget(self.pbAddDrive)
+        driveButtons.addWidget(self.pbRemoveDrive)
+        layout.addLayout(driveButtons, 3, 0)
+        portSettings = QHBoxLayout()
+        portSettings.addWidget(self.cbSelectComport, 1)  # comport-combobox and slave address
+        portSettings.addWidget(self.sbSlave)
+        layout.addLayout(portSettings, 4, 0)
+        layout.addWidget(self.pbOpenCloseComport, 5, 0)   # open/close button goes in middle-left
+        layout.addWidget(self.cbSelectParameterGroup, 6, 0)  # parameter-group-combobox
+        layout.addWidget(self.pbReadParams, 7, 0)
+        layout.addWidget(self.pbReadAllParams, 8, 0)
+        plotSettings = QHBoxLayout()
+        plotSettings.addWidget(self.sbHistory)
+        plotSettings.addWidget(self.sbRefreshRate)
+        layout.addLayout(plotSettings, 9, 0)
+        layout.addWidget(self.pbStartStopMonitor, 10, 0)
+        layout.addWidget(self.pbStartStopRecording, 11, 0)
+        layout.addWidget(self.pbOpenCapture, 12, 0)
+        layout.addWidget(self.ParamTable, 1, 1, 12, 2)  # list widget goes in bottom-left
 
         self.setCentralWidget(self.widget)
 
         self.createActions()
+        self.createDiagnosticsDock()
 
         self.cbSelectMotorVersion.addItems(self.ihsv.get_supported_motor_versions())
 
         self.cbSelectMotorVersion.currentTextChanged.connect(self.onMotorVersionChange)
+        self.cbSelectParameterGroup.currentTextChanged.connect(self.onParameterGroupChange)
+
+        self.readSettings()
+
+        self.cbSelectDrive.currentIndexChanged.connect(self.onDriveChange)
+        self.cbSelectComport.currentTextChanged.connect(self.onDrivePortChange)
+        self.sbSlave.valueChanged.connect(self.onDrivePortChange)
+
+        # everything needing the plot or the parameter database waits for initDeferred
+        self.deferredWidgets = [self.cbSelectMotorVersion, self.cbSelectDrive, self.pbAddDrive, self.pbRemoveDrive,
+                                self.cbSelectParameterGroup, self.pbReadParams, self.pbReadAllParams,
+                                self.pbStartStopMonitor, self.pbStartStopRecording, self.pbOpenCapture]
+        for widget in self.deferredWidgets:
+            widget.setEnabled(False)
+
+        self.statusBar().addPermanentWidget(self.parameterProgress)
+        self.statusBar().addPermanentWidget(self.monitorStatus)
+        self.statusBar().addPermanentWidget(self.pbDiagnostics)
+        self.statusBar().showMessage("Loading...")
+        # runs once the event loop has shown the window
+        QTimer.singleShot(0, self.initDeferred)
+
+    def initDeferred(self):
+        # the window has been shown at this point
+        self.shownTime = time.perf_counter()
+        self.createPlot()
 
         ## Call function to create initally the widgets depending on motorversion
         self.onMotorVersionChange()
 
-        comports = QSerialPortInfo.availablePorts()
-        for comport in comports:
-            port = comport.portName()
-            if os.path.exists(os.path.join("/dev", port)):
-                port = os.path.join("/dev", port)
-            self.cbSelectComport.addItem(port)
-
-        self.readSettings()
-        
+        for widget in self.deferredWidgets:
+            widget.setEnabled(True)
+        self.onDriveChange()
         self.statusBar().showMessage("Ready", 2000)
+        self.signalInitialized.emit()
+
+    def createPlot(self):
+        import pyqtgraph as pg
+        from iHSV_Plot import PlotWidget
+
+        pg.setConfigOptions(antialias=False)
+        self.plot = PlotWidget(diagnostics=self.diagnostics)
+        self.plot.setDownsampling(mode='peak')
+        self.plot.setClipToView(True)
+        self.plot.setXRange(-1, 0)
+        self.plot.setYRange(-200, 200)
+        self.plot.setLimits(xMin=-self.sbHistory.value(), xMax=0, minXRange=0.2, maxXRange=self.sbHistory.value())
+        self.plot.setLabel('bottom', text='Time', units='s')
+        self.plot.showAxis('right')
+
+        self.plot2ndAxis = pg.ViewBox()
+        self.plot.scene().addItem(self.plot2ndAxis)
+        self.plot.getAxis('right').linkToView(self.plot2ndAxis)
+        self.plot2ndAxis.setXLink(self.plot)
+        self.plot2ndAxis.setYRange(-10, 10)
+
+        def updateViews():
+            self.plot2ndAxis.setGeometry(self.plot.getViewBox().sceneBoundingRect())
+            self.plot2ndAxis.linkedViewChanged(self.plot.getViewBox(), self.plot2ndAxis.XAxis)
+
+        updateViews()
+        self.plot.getViewBox().sigResized.connect(updateViews)
+        self.plot.sigXRangeChanged.connect(self.updatePlotData)
+
+        self.plotLayout.addWidget(self.plot)
 
     def onMotorVersionChange(self):
         self.motorversion = self.ihsv.supported_motor_versions[str(self.cbSelectMotorVersion.currentText())]
         self.ihsv = iHSV(self.motorversion)
+        from iHSV_Modbus import RtuTiming
+        self.busTiming = RtuTiming.from_settings(self.ihsv.rs232)
 
         self.getDataPlots()
 
+        self.cancelParameterJob()
+        for drive in self.drives:
+            drive.parameterCache.clear()
+        self.cbSelectParameterGroup.blockSignals(True)
         self.cbSelectParameterGroup.clear()
         self.cbSelectParameterGroup.addItems(self.ihsv.get_parameter_group_list())
+        self.cbSelectParameterGroup.blockSignals(False)
 
         self.createParameterTable()
+        self.showParams()
+
+    def onParameterGroupChange(self):
+        self.showParams()
+
+    def currentDrive(self):
+        return self.drives[max(self.cbSelectDrive.currentIndex(), 0)]
+
+    def driveName(self, index):
+        return 'Drive {0}'.format(index + 1)
+
+    def driveLabel(self, index):
+        drive = self.drives[index]
+        return '{0}: {1} #{2}'.format(self.driveName(index), drive.port or '-', drive.slave)
+
+    def updateDriveList(self):
+        self.cbSelectDrive.blockSignals(True)
+        index = self.cbSelectDrive.currentIndex()
+        self.cbSelectDrive.clear()
+        self.cbSelectDrive.addItems([self.driveLabel(index) for index in range(len(self.drives))])
+        self.cbSelectDrive.setCurrentIndex(min(max(index, 0), len(self.drives) - 1))
+        self.cbSelectDrive.blockSignals(False)
+
+    def onDriveChange(self):
+        # show the port settings and parameters of the selected drive
+        drive = self.currentDrive()
+        for widget in (self.cbSelectComport, self.sbSlave):
+            widget.blockSignals(True)
+        if drive.port:
+            self.cbSelectComport.setComport(drive.port)
+        self.sbSlave.setValue(drive.slave)
+        for widget in (self.cbSelectComport, self.sbSlave):
+            widget.blockSignals(False)
+            # can not be changed while connected
+            widget.setEnabled(not drive.connected)
+        self.pbOpenCloseComport.setText('Close Comport' if drive.connected else 'Open Comport')
+        self.pbRemoveDrive.setEnabled(len(self.drives) > 1)
+        if self.plot is not None:
+            self.showParams()
+
+    def onDrivePortChange(self):
+        drive = self.currentDrive()
+        if drive.connected:
+            return
+        drive.port = self.cbSelectComport.currentText()
+        drive.slave = self.sbSlave.value()
+        self.cbSelectDrive.setItemText(self.cbSelectDrive.currentIndex(), self.driveLabel(self.cbSelectDrive.currentIndex()))
+        # drives are grouped by port for polling
+        self.restartAcquisition()
+
+    def addDrive(self):
+        # next slave address on the port of the selected drive - most likely another axis on the same rs485 bus
+        port = self.currentDrive().port
+        slave = max(drive.slave for drive in self.drives if drive.port == port) + 1
+        self.drives.append(Drive(port, min(slave, 247)))
+        self.updateDriveList()
+        self.getDataPlots()
+        self.cbSelectDrive.setCurrentIndex(len(self.drives) - 1)
+        self.restartAcquisition()
+
+    def removeDrive(self):
+        if len(self.drives) < 2:
+            return
+        if self.currentDrive().connected:
+            self.openCloseComport()
+        self.drives.remove(self.currentDrive())
+        self.updateDriveList()
+        self.getDataPlots()
+        self.onDriveChange()
+        self.restartAcquisition()
 
     def getDataPlots(self):
+        if self.recordingDrive is not None:
+            self.startStopRecording()
+        from iHSV_Plot import ModBusDataCurveItem
+
+        # detach the curves being replaced
+        for curve in self.curves:
+            if curve in self.plot.listDataItems():
+                self.plot.removeItem(curve)
+            elif curve in self.plot2ndAxis.addedItems:
+                self.plot2ndAxis.removeItem(curve)
         self.curves = []
 
         # remove all widgets from vbox layout
@@ -260,18 +442,94 @@ class MainWindow(QMainWindow):
             except AttributeError:
                 pass
 
-        for liveDataInfo in self.ihsv.get_live_data_list():
-            regs = liveDataInfo[0]
-            curve = ModBusDataCurveItem(liveDataInfo[2], regs, liveDataInfo[1], settings=self.settings)
-            curve.signalAttachToAxis.connect(self.attachCurve)
-            curve.attachToAxis()
-            self.curves += [curve]
-            self.vbox.addWidget(curve.widget)
+        for index, drive in enumerate(self.drives):
+            # the first drive's curves keep their plain names
+            name = self.driveName(index) if index else ''
+            drive.curves = []
+            drive.readPlan = None
+            for liveDataInfo in self.ihsv.get_live_data_list():
+                regs = liveDataInfo[0]
+                curve = ModBusDataCurveItem(liveDataInfo[2], regs, liveDataInfo[1], settings=self.settings, history=self.historySamples(), drive=name)
+                curve.signalAttachToAxis.connect(self.attachCurve)
+                curve.signalIsActive.connect(self.invalidateReadPlan)
+                curve.signalIsActive.connect(self.updatePlotData)
+                curve.signalDivisorChanged.connect(self.invalidateReadPlan)
+                curve.attachToAxis()
+                drive.curves += [curve]
+                self.vbox.addWidget(curve.widget)
+            self.curves += drive.curves
+
+        self.invalidateReadPlan()
+
+    def historySamples(self):
+        return int(self.sbHistory.value() / self.monitorPeriod)
+
+    def setHistory(self):
+        if self.plot is None:
+            # not initialized yet - the plot and the curves are created with the current value
+            return
+        self.plot.setLimits(xMin=-self.sbHistory.value(), maxXRange=self.sbHistory.value())
+        for curve in self.curves:
+            curve.setHistory(self.historySamples())
+
+    def setRefreshRate(self):
+        self.monitorTimer.setInterval(round(1000 / self.sbRefreshRate.value()))
+
+    def updatePlotData(self):
+        if self.capture is not None:
+            self.updateCapturePlot()
+            return
+        for curve in self.curves:
+            if curve.isActive():
+                curve.updatePlotData(self.monitorTime)
+
+    def updateCapturePlot(self):
+        # load the visible window of each active curve from the memory-mapped capture
+        xMin, xMax = self.plot.getViewBox().viewRange()[0]
+        shown = self.currentDrive().curves
+        for curve in self.curves:
+            if curve in shown and curve.isActive() and curve.name() in self.capture.channels:
+                curve.setData(*self.capture.window(curve.name(), xMin, xMax))
+                curve.setPos(0, 0)
+            else:
+                curve.setData()
+
+    def openCapture(self):
+        path, _ = QFileDialog.getOpenFileName(self, 'Open Capture', self.settings.value("capturedir", ""), 'iHSV Capture (*.ihsvcap)')
+        if not path:
+            return
+        self.settings.setValue("capturedir", os.path.dirname(path))
+        try:
+            from iHSV_Capture import CaptureReader
+            capture = CaptureReader(path)
+            motorversion = {short: long for long, short in self.ihsv.supported_motor_versions.items()}[capture.motor_version]
+        except Exception as e:
+            print(e)
+            self.statusBar().showMessage("Failed to open capture", 2000)
+            return
+        if self.acquisitions:
+            self.startStopMonitor()
+
+        # same curves (colors, axis) as monitoring the drive - shown on the selected drive's curves
+        self.cbSelectMotorVersion.setCurrentText(motorversion)
+        self.capture = capture
+        tMin, tMax = capture.time_range()
+        self.plot.setLimits(xMin=tMin, xMax=max(tMax, tMin + 0.2), maxXRange=max(tMax - tMin, 0.2))
+        self.plot.setXRange(max(tMin, tMax - 10), tMax)
+        self.updatePlotData()
+        self.statusBar().showMessage("Opened capture {0} ({1} samples)".format(path, len(capture)), 5000)
+
+    def closeCapture(self):
+        self.capture = None
+        self.plot.setLimits(xMin=-self.sbHistory.value(), xMax=0, maxXRange=self.sbHistory.value())
+        self.plot.setXRange(-1, 0)
+        for curve in self.curves:
+            curve.clearData()
 
     def createParameterTable(self):
         header = self.ihsv.get_selected_motor_parameter()
         self.ParamTable.setColumnCount(len(header))
-        self.ParamTable.setRowCount(20)
+        self.ParamTable.setRowCount(0)
         self.ParamTable.setHorizontalHeaderLabels(header)
         self.ParamTable.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
         self.ParamTable.verticalHeader().setVisible(False)
@@ -296,75 +554,152 @@ class MainWindow(QMainWindow):
             print('Error attaching curve')
 
     def openCloseComport(self):
-        if not self.connected:
+        drive = self.currentDrive()
+        if not drive.connected:
+            if not self.cbSelectComport.currentText():
+                self.cbSelectComport.enumeratePorts()
+            drive.port = self.cbSelectComport.currentText()
+            drive.slave = self.sbSlave.value()
+            # drives on the same port (rs485) share its connection
+            shared = [other.bus for other in self.drives if other.connected and other.port == drive.port]
             try:
-                self.servo = minimalmodbus.Instrument(self.cbSelectComport.currentText(), 1)
-                self.servo.serial.baudrate = self.ihsv.get_rs232_settings('baudrate')
-                self.servo.serial.bytesize = self.ihsv.get_rs232_settings('bytesize')
-                self.servo.serial.parity   = self.ihsv.get_rs232_settings('parity')
-                self.servo.serial.stopbits = self.ihsv.get_rs232_settings('stopbits')
-                self.servo.serial.timeout  = self.ihsv.get_rs232_settings('timeout')
+                from iHSV_Modbus import open_bus
+                if shared:
+                    bus = shared[0].slave(drive.slave)
+                else:
+                    bus = open_bus(drive.port, self.ihsv.rs232, drive.slave, self.motorversion, self.diagnostics)
             except Exception as e:
                 print(e)
                 self.statusBar().showMessage("Failed to open port", 2000)
                 return
             try:
-                if not self.servo.serial.isOpen():
-                    self.servo.serial.open()
-                self.servo.read_register(0x80)
+                bus.read_register(0x80)
                 self.statusBar().showMessage("Port opened successfully", 2000)
-                self.pbOpenCloseComport.setText('Close Comport')
-                self.connected = True
             except Exception as e:
                 print(e)
-                self.servo.serial.close()
+                if not shared:
+                    bus.close()
                 self.statusBar().showMessage("Device does not respond", 2000)
                 return
+            # might be another drive
+            drive.parameterCache.clear()
+            drive.bus = bus
+            drive.noise = False
+            self.updateAcquisitionTargets()
         else:
-            if (self.pbStartStopMonitor.text() == 'Stop Monitor'):
-                self.startStopMonitor()
-            try:
-                self.servo.serial.close()
-                self.statusBar().showMessage("Port closed", 2000)
-            except Exception as e:
-                print(e)
-                pass
-            self.pbOpenCloseComport.setText('Open Comport')
-            self.connected = False
+            if self.recordingDrive is drive:
+                self.startStopRecording()
+            self.cancelParameterJob()
+            bus, drive.bus = drive.bus, None
+            # not polled anymore
+            self.updateAcquisitionTargets()
+            if not any(other.connected and other.port == drive.port for other in self.drives):
+                try:
+                    # waits for a request still on the bus
+                    bus.close()
+                    self.statusBar().showMessage("Port closed", 2000)
+                except Exception as e:
+                    print(e)
+                    pass
+        self.cbSelectDrive.setItemText(self.cbSelectDrive.currentIndex(), self.driveLabel(self.cbSelectDrive.currentIndex()))
+        self.onDriveChange()
 
     def readParams(self):
-        if not self.connected:
-            return
-        try:
-            self.ParamTable.cellChanged.disconnect(self.writeParams)
-        except Exception as e:
-            print(e)
-            pass
-        self.statusBar().showMessage("Loading System Params...", 2000)
-        par_list = self.ihsv.get_parameter_list([self.cbSelectParameterGroup.currentText()])
-        self.ParamTable.setRowCount(len(par_list))
-        row = 0
+        # explicit refresh of the selected group
+        self.showParams([self.cbSelectParameterGroup.currentText()], refresh=True)
 
+    def readAllParams(self):
+        if self.parameterJob is not None and len(self.parameterJob.groups) > 1:
+            self.parameterJob.cancel()
+            return
+        self.showParams(self.ihsv.get_parameter_group_list(), refresh=True)
+        if self.parameterJob is not None:
+            self.pbReadAllParams.setText('Cancel Reading')
+
+    def showParams(self, groups=None, refresh=False):
+        # show cached values at once, read the stale ones in the background
+        if groups is None:
+            groups = [self.cbSelectParameterGroup.currentText()]
+        self.cancelParameterJob()
+
+        self.beginParamTableUpdate()
+        self.ParamTable.setRowCount(0)
         # lists to store address and decimal factor of each row -> necessary for writeParams
         self.ParamTable.addressList = []
         self.ParamTable.decimalList = []
+        for group in groups:
+            self.addParamRows(group)
+        self.endParamTableUpdate()
+        self.ParamTable.resizeRowsToContents()
+
+        drive = self.currentDrive()
+        if refresh:
+            drive.parameterCache.invalidate(self.ParamTable.addressList)
+        if drive.connected and drive.parameterCache.stale(self.ParamTable.addressList):
+            self.startParameterJob(groups)
+
+    def startParameterJob(self, groups):
+        self.statusBar().showMessage("Loading System Params...", 2000)
+
+        # groups are read in the background and their values shown as they arrive
+        drive = self.currentDrive()
+        self.parameterJob = ParameterReadJob(drive.bus, drive.parameterCache, self.ihsv, groups)
+        self.parameterJob.signalGroupRead.connect(self.updateParamValues)
+        self.parameterJob.signalProgress.connect(self.showParameterProgress)
+        self.parameterJob.finished.connect(self.parameterJobFinished)
+        self.parameterProgress.setRange(0, len(groups))
+        self.parameterProgress.setValue(0)
+        self.parameterProgress.show()
+        self.parameterJob.start()
+
+    def showParameterProgress(self, done, total):
+        self.parameterProgress.setValue(done)
+        self.statusBar().showMessage("Loading System Params ({0}/{1})...".format(done, total), 2000)
+
+    def parameterJobFinished(self):
+        if self.sender() is not self.parameterJob:
+            # a cancelled job finishing after a new one was started
+            if self.sender() in self.cancelledParameterJobs:
+                self.cancelledParameterJobs.remove(self.sender())
+            return
+        cancelled = self.parameterJob.cancelled
+        self.parameterJob = None
+        self.parameterProgress.hide()
+        self.pbReadAllParams.setText('Read All Groups')
+        if cancelled:
+            self.statusBar().showMessage("Loading System Params cancelled!", 2000)
+        else:
+            self.statusBar().showMessage("Loading System Params done!", 2000)
+
+    def cancelParameterJob(self):
+        # not waited for - the job stops after its request on the bus and its values are not shown anymore
+        if self.parameterJob is not None:
+            job, self.parameterJob = self.parameterJob, None
+            job.cancel()
+            job.signalGroupRead.disconnect()
+            job.signalProgress.disconnect()
+            self.cancelledParameterJobs.append(job)
+            self.parameterProgress.hide()
+            self.pbReadAllParams.setText('Read All Groups')
+
+    def addParamRows(self, group):
+        par_list = self.ihsv.get_parameter_list([group])
+        row = self.ParamTable.rowCount()
+        self.ParamTable.setRowCount(row + len(par_list))
+
         for configDataInfo in par_list:
             reg = int(configDataInfo['Address'], 16)
             self.ParamTable.addressList.append(reg)
-            val = self.servo.read_register(reg)
 
             # move decimal point
             if 'decimal_place' in configDataInfo.keys():
-                decimal = int(configDataInfo['decimal_place'])
-                if decimal != 0:
-                    val /= 10**int(configDataInfo['decimal_place'])
-                self.ParamTable.decimalList.append(decimal)
+                self.ParamTable.decimalList.append(int(configDataInfo['decimal_place']))
             else:
                 self.ParamTable.decimalList.append(0)
 
-            configDataInfo['Value'] = val
             for col, par in enumerate(self.ihsv.get_selected_motor_parameter()):
-                item = QTableWidgetItem(str(configDataInfo[par]))
+                # values are filled in by setParamValue
+                item = QTableWidgetItem('' if par == 'Value' else str(configDataInfo[par]))
                 if par != 'Value':
                     # item.setBackground(QColor('lightgrey'))
                     item.setFlags(Qt.ItemIsEditable)
@@ -377,13 +712,58 @@ class MainWindow(QMainWindow):
                     item.setTextAlignment(Qt.AlignLeft | Qt.AlignTop)
 
                 self.ParamTable.setItem(row, col, item)
+            self.setParamValue(row)
             row += 1
-        self.ParamTable.resizeRowsToContents()
-        self.ParamTable.cellChanged.connect(self.writeParams)
-        self.statusBar().showMessage("Loading System Params done!", 2000)
+
+    def setParamValue(self, row):
+        item = self.ParamTable.item(row, self.ihsv.get_selected_motor_parameter().index('Value'))
+        reg = self.ParamTable.addressList[row]
+        cache = self.currentDrive().parameterCache
+        val = cache.get(reg)
+        if val is None:
+            item.setText('')
+            item.setToolTip('')
+            return
+
+        # move decimal point
+        decimal = self.ParamTable.decimalList[row]
+        if decimal != 0:
+            val /= 10**decimal
+        item.setText(str(val))
+        item.setTextAlignment(Qt.AlignRight | Qt.AlignTop)
+
+        # stale values are shown grey until they are read again
+        age = cache.age(reg)
+        if cache.is_stale(reg):
+            item.setForeground(QColor('grey'))
+            item.setToolTip('Stale - read {0:.0f} s ago'.format(age))
+        else:
+            item.setForeground(self.ParamTable.palette().text())
+            item.setToolTip('Read {0:.0f} s ago'.format(age))
+
+    def updateParamValues(self):
+        self.beginParamTableUpdate()
+        for row in range(self.ParamTable.rowCount()):
+            self.setParamValue(row)
+        self.endParamTableUpdate()
+
+    def beginParamTableUpdate(self):
+        # no writeParams for values set here and no resizing to contents for every single cell
+        self.ParamTable.blockSignals(True)
+        header = self.ParamTable.horizontalHeader()
+        self.paramTableResizeModes = [header.sectionResizeMode(col) for col in range(header.count())]
+        for col in range(header.count()):
+            header.setSectionResizeMode(col, QHeaderView.Interactive)
+
+    def endParamTableUpdate(self):
+        header = self.ParamTable.horizontalHeader()
+        for col, mode in enumerate(self.paramTableResizeModes):
+            header.setSectionResizeMode(col, mode)
+        self.ParamTable.blockSignals(False)
 
     def writeParams(self, row, column):
-        if not self.connected:
+        drive = self.currentDrive()
+        if not drive.connected:
             return
         if self.ParamTable.horizontalHeaderItem(column).text() != 'Value':
             return
@@ -399,57 +779,286 @@ class MainWindow(QMainWindow):
             self.statusBar().showMessage("Failed to convert Config Value...", 2000)
             return
         reg = self.ParamTable.addressList[row]
-        self.servo.write_register(reg, value, functioncode=6)
-        self.statusBar().showMessage("Writing {0} to 0x{1:02x} done!".format(value, reg), 5000)
+        try:
+            # goes ahead of the monitor's reads
+            waited = drive.bus.write_register(reg, value)
+        except Exception as e:
+            print(e)
+            # the drive may or may not have taken the value
+            drive.parameterCache.invalidate([reg])
+            self.statusBar().showMessage("Writing {0} to 0x{1:02x} failed!".format(value, reg), 5000)
+            return
+        # cached as the drive returns it on a read - negative values as unsigned 16 bit
+        drive.parameterCache.update({reg: value & 0xFFFF})
+        self.statusBar().showMessage("Writing {0} to 0x{1:02x} done! (waited {2:.1f} ms for the bus)".format(value, reg, waited * 1000), 5000)
+
+    def invalidateReadPlan(self):
+        for drive in self.drives:
+            # recordings always read all curves - the plan stays the same
+            if drive is not self.recordingDrive:
+                drive.readPlan = None
+        self.updateAcquisitionTargets()
+
+    def getReadPlan(self, drive):
+        if drive.readPlan is None:
+            # list of (start, count, [(slice, curve), ...], decoder) entries for all active curves
+            # (all curves while recording)
+            from iHSV_Modbus import compile_read_plan
+            recording = drive is self.recordingDrive
+            channels = [(curve, curve.getRegisters(), curve.signed, curve.divisor) for curve in drive.curves if curve.isActive() or recording]
+            drive.readPlan = compile_read_plan(channels, self.busTiming)
+            divisors = {curve: entry[4] for entry in drive.readPlan for _, curve in entry[2]}
+            for curve in drive.curves:
+                curve.setReadDivisor(divisors.get(curve))
+        return drive.readPlan
+
+    def drivesByPort(self):
+        # drives sharing a port are polled round-robin in the order of their slave addresses
+        ports = {}
+        for drive in sorted(self.drives, key=lambda drive: drive.slave):
+            ports.setdefault(drive.port, []).append(drive)
+        return ports
+
+    def updateAcquisitionTargets(self):
+        for port, drives in self.drivesByPort().items():
+            # drives closed after being connected are left out
+            drives = [drive for drive in drives if drive.connected or drive.noise]
+            if port in self.acquisitions:
+                self.acquisitions[port].set_targets([(drive.readRegisters, self.getReadPlan(drive)) for drive in drives])
+                for drive in drives:
+                    for entry in self.getReadPlan(drive):
+                        # pure transfer time on the wire - the rest of a round trip is the drive and the pc
+                        self.diagnostics.expect(read_name(entry[0], entry[1]), self.busTiming.read_time(entry[1]) - self.busTiming.turnaround)
+
+    def startAcquisition(self):
+        # one acquisition thread per serial port - the ports are polled concurrently
+        from iHSV_Acquisition import AcquisitionWorker
+        for port, drives in self.drivesByPort().items():
+            self.acquisitions[port] = AcquisitionWorker(period=self.monitorPeriod, diagnostics=self.diagnostics)
+        self.updateAcquisitionTargets()
+        for worker in self.acquisitions.values():
+            worker.start()
+
+    def stopAcquisition(self):
+        for worker in self.acquisitions.values():
+            worker.stop()
+        self.acquisitions = {}
+
+    def restartAcquisition(self):
+        # after the drives or their ports changed - the curves keep their data
+        if not self.acquisitions:
+            return
+        if self.recordingDrive is not None:
+            self.startStopRecording()
+        self.stopAcquisition()
+        self.startAcquisition()
 
     def updateCurves(self):
         try:
-            # get dictionary of active curves and their registers
-            curves_regs = {curve: curve.getRegisters() for curve in self.curves if curve.isActive()}
-            #print(curves_regs)
-            if (len(curves_regs) == 0):
-                return
-
-            # get list of all registers that need to be read
-            regs_list = sorted([reg for regs in curves_regs.values() for reg in regs])
-            #print(regs_list)
-
-            # get list of aggregated lists (tolerate gaps of up to 2 regs)
-            regs_aggr = np.split(regs_list, np.where(np.diff(regs_list) > 3)[0]+1)
-            # intermediate step to fill in gaps if gaps were allowed
-            regs_aggr = [range(regs_range[0], regs_range[-1]+1) for regs_range in regs_aggr]
-            #print(regs_aggr)
-
-            # use aggregated regs to read all values and create dictionary with reg:value pairs
-            if self.connected:
-                regs_values = dict([reg_value for regs in regs_aggr for reg_value in zip(regs, self.servo.read_registers(int(regs[0]), len(regs)))])
-            else:
-                regs_values = dict([reg_value for regs in regs_aggr for reg_value in zip(regs, [int(value*100) for value in np.random.randn(len(regs))])])
-            #print(regs_values)
-
-            # iterate active curves and use associated regs to look up values
-            for curve,regs in curves_regs.items():
-                values = [regs_values[reg] for reg in regs] 
-                curve.appendData(values)
-        except:
+            # hand the samples queued by the acquisition threads to the curves
+            samples = [sample for worker in self.acquisitions.values() for sample in worker.get_samples()]
+            self.diagnostics.record('queue depth', len(samples), COUNT_EDGES)
+
+            with self.diagnostics.time('decode'):
+                # collect the samples of each plan entry to decode them all at once
+                blocks = {}
+                for timestamp, entry, values in samples:
+                    block = blocks.setdefault(id(entry), (entry, [], [], []))
+                    if values is None:
+                        # failed or late read - a break in the curves at its time
+                        block[3].append(len(block[1]))
+                        values = [0] * entry[1]
+                    block[1].append(timestamp - self.monitorStart)
+                    block[2].append(values)
+
+                for entry, timestamps, words, gaps in blocks.values():
+                    curves, decoder = entry[2], entry[3]
+                    values = decoder.decode(words)
+                    values[gaps] = float('nan')
+                    for column, (_, curve) in enumerate(curves):
+                        if curve.isActive():
+                            curve.appendData(timestamps, values[:, column])
+                            if gaps:
+                                self.diagnostics.count('gaps: ' + curve.label.text(), len(gaps))
+            if samples:
+                self.monitorTime = max(self.monitorTime, max(sample[0] for sample in samples) - self.monitorStart)
+            if samples and not self.isMinimized():
+                # all curves at once, drawn with the next repaint - nothing to draw while minimized
+                with self.diagnostics.time('setData'):
+                    self.updatePlotData()
+        except Exception as e:
+            self.diagnostics.error('update', e)
             print('Error updating data')
+            traceback.print_exc()
 
     def startStopMonitor(self):
         if (self.pbStartStopMonitor.text() == 'Start Monitor'):
-            self.monitorTimer = QTimer()
-            self.monitorTimer.timeout.connect(self.updateCurves)
-            self.monitorTimer.start(10)
-            self.pbStartStopMonitor.setText('Stop Monitor')
-            self.statusBar().showMessage("Monitor started", 2000)
+            if self.capture is not None:
+                self.closeCapture()
             #print(self.curves)
             for curve in self.curves:
-                curve.setData()
+                curve.clearData()
+            self.monitorStart = time.perf_counter()
+            self.monitorTime = 0
+            self.startAcquisition()
+            self.setRefreshRate()
+            self.monitorTimer.start()
+            self.monitorStatusTimer = QTimer()
+            self.monitorStatusTimer.timeout.connect(self.showMonitorStatus)
+            self.monitorStatusTimer.start(1000)
+            self.pbStartStopMonitor.setText('Stop Monitor')
+            self.statusBar().showMessage("Monitor started", 2000)
         else:
+            if self.recordingDrive is not None:
+                self.startStopRecording()
             self.monitorTimer.stop()
+            self.monitorStatusTimer.stop()
+            self.stopAcquisition()
             self.statusBar().showMessage("Monitor stopped", 2000)
             self.pbStartStopMonitor.setText('Start Monitor')
 
+    def showMonitorStatus(self):
+        # rate actually achieved per port - the pollers slow down to what the bus sustains
+        status = []
+        details = []
+        for port, worker in sorted(self.acquisitions.items()):
+            stats = worker.statistics()
+            text = '{0:.1f} Hz, jitter {1:.1f} ms, {2} dropped'.format(stats['rate'], stats['jitter'] * 1000, stats['dropped'])
+            status.append(port + ': ' + text if len(self.acquisitions) > 1 else text)
+            details.append('{0}: period {1:.1f} ms, cycle {2:.1f} ms, {3} errors'.format(
+                port or '-', stats['period'] * 1000, (stats['cycle_time'] or 0) * 1000, worker.errors))
+            for (start, count), seconds in sorted(stats['round_trip'].items()):
+                details.append('    0x{0:04X} ({1} regs): {2:.1f} ms'.format(start, count, seconds * 1000))
+        self.monitorStatus.setText(' | '.join(status))
+        self.monitorStatus.setToolTip('\n'.join(details))
+
+    def createDiagnosticsDock(self):
+        self.diagnosticsTree = QTreeWidget()
+        self.diagnosticsTree.setHeaderLabels(['Name', 'Count', 'Mean', 'p50', 'p95', 'Max', 'Model'])
+        self.diagnosticsTree.setRootIsDecorated(False)
+        pbReset = QPushButton('Reset')
+        pbReset.clicked.connect(self.resetDiagnostics)
+        pbExport = QPushButton('Export...')
+        pbExport.clicked.connect(self.exportDiagnostics)
+
+        widget = QWidget()
+        layout = QGridLayout(widget)
+        layout.addWidget(self.diagnosticsTree, 0, 0, 1, 2)
+        layout.addWidget(pbReset, 1, 0)
+        layout.addWidget(pbExport, 1, 1)
+
+        self.diagnosticsDock = QDockWidget('Diagnostics', self)
+        self.diagnosticsDock.setObjectName('Diagnostics')
+        self.diagnosticsDock.setWidget(widget)
+        self.addDockWidget(Qt.RightDockWidgetArea, self.diagnosticsDock)
+        self.diagnosticsDock.hide()
+        self.pbDiagnostics = QToolButton()
+        self.pbDiagnostics.setDefaultAction(self.diagnosticsDock.toggleViewAction())
+
+        self.diagnosticsTimer = QTimer(self)
+        self.diagnosticsTimer.timeout.connect(self.updateDiagnostics)
+        self.diagnosticsTimer.start(1000)
+
+    def updateDiagnostics(self):
+        if not self.diagnosticsDock.isVisible():
+            return
+        snapshot = self.diagnostics.snapshot()
+
+        def ms(value):
+            return '' if value is None else '{0:.2f} ms'.format(value * 1000)
+
+        rows = []
+        for name, histogram in snapshot['histograms'].items():
+            if histogram['edges'] is COUNT_EDGES:
+                values = ['' if histogram[key] is None else '{0:.1f}'.format(histogram[key]) for key in ('mean', 'p50', 'p95', 'max')]
+            else:
+                values = [ms(histogram[key]) for key in ('mean', 'p50', 'p95', 'max')]
+            rows.append([name, str(histogram['count'])] + values + [ms(snapshot['expected'].get(name))])
+        for name, count in snapshot['counters'].items():
+            rows.append([name, str(count)])
+        for name, message in snapshot['last_errors'].items():
+            rows.append(['last ' + name + ': ' + message])
+
+        self.diagnosticsTree.clear()
+        for row in rows:
+            item = QTreeWidgetItem(row)
+            for column in range(1, len(row)):
+                item.setTextAlignment(column, Qt.AlignRight)
+            if len(row) == 1:
+                item.setFirstColumnSpanned(True)
+            self.diagnosticsTree.addTopLevelItem(item)
+        for column in range(self.diagnosticsTree.columnCount()):
+            self.diagnosticsTree.resizeColumnToContents(column)
+
+    def resetDiagnostics(self):
+        self.diagnostics.clear()
+        # keep the model of the blocks being read
+        self.updateAcquisitionTargets()
+        self.updateDiagnostics()
+
+    def exportDiagnostics(self):
+        path, _ = QFileDialog.getSaveFileName(self, 'Export Diagnostics', self.settings.value("capturedir", ""), 'Diagnostics (*.json)')
+        if not path:
+            return
+        drives = [{'port': drive.port, 'slave': drive.slave, 'connected': drive.connected} for drive in self.drives]
+        workers = {port: worker.statistics() for port, worker in self.acquisitions.items()}
+        for statistics in workers.values():
+            statistics['round_trip'] = {read_name(*block): seconds for block, seconds in statistics['round_trip'].items()}
+        try:
+            self.diagnostics.export(path, motor_version=self.motorversion, drives=drives, acquisition=workers,
+                                    monitor_period=self.monitorPeriod, python=sys.version, qt=QT_VERSION_STR)
+        except Exception as e:
+            print(e)
+            self.statusBar().showMessage("Exporting diagnostics failed", 2000)
+            return
+        self.statusBar().showMessage("Diagnostics exported to {0}".format(path), 5000)
+
+    def startStopRecording(self):
+        if self.recordingDrive is None:
+            if not self.currentDrive().connected:
+                # would record noise
+                self.statusBar().showMessage("Open the comport of the drive to record", 2000)
+                return
+            path, _ = QFileDialog.getSaveFileName(self, 'Record to', self.settings.value("capturedir", ""), 'iHSV Capture (*.ihsvcap)')
+            if not path:
+                return
+            self.settings.setValue("capturedir", os.path.dirname(path))
+            if not self.acquisitions:
+                self.startStopMonitor()
+
+            # read all curves of the selected drive while recording
+            drive = self.currentDrive()
+            self.recordingDrive = drive
+            drive.readPlan = None
+            plan = self.getReadPlan(drive)
+            try:
+                from iHSV_Capture import CaptureWriter
+                recorder = CaptureWriter(path, self.motorversion, self.ihsv.get_live_data_list(), plan)
+            except Exception as e:
+                print(e)
+                self.recordingDrive = None
+                self.invalidateReadPlan()
+                self.statusBar().showMessage("Failed to open capture file", 2000)
+                return
+            self.updateAcquisitionTargets()
+            self.acquisitions[drive.port].set_recorder(recorder)
+            self.pbStartStopRecording.setText('Stop Recording')
+            self.statusBar().showMessage("Recording {0} to {1}".format(self.driveName(self.drives.index(drive)), path), 2000)
+        else:
+            recorder = self.acquisitions[self.recordingDrive.port].set_recorder(None)
+            self.recordingDrive = None
+            self.invalidateReadPlan()
+            recorder.close()
+            self.pbStartStopRecording.setText('Record')
+            self.statusBar().showMessage("Recorded {0} samples ({1} dropped)".format(recorder.records, recorder.dropped), 5000)
+
     def closeEvent(self, event):
+        if self.acquisitions:
+            self.startStopMonitor()
+        self.cancelParameterJob()
+        # a running QThread must not be destroyed on exit - this waits for one request at most
+        for job in self.cancelledParameterJobs:
+            job.wait()
         self.writeSettings()
         event.accept()
 
@@ -461,20 +1070,43 @@ class MainWindow(QMainWindow):
         self.settings = QSettings("IBB", "iHSV57 Servo Tool")
         self.move(self.settings.value("pos", QPoint(100, 100)))
         self.resize(self.settings.value("size", QSize(800, 600)))
-        self.cbSelectComport.setCurrentText(self.settings.value("comport", self.cbSelectComport.currentText()))
+        comport = self.settings.value("comport", "")
+        if comport:
+            self.cbSelectComport.setComport(comport)
+        # the first drive is stored as "comport" (slave 1) - further drives as lists
+        self.drives = [Drive(comport, self.settings.value("slave", 1, type=int))]
+        ports = self.settings.value("drivePorts", [], type=list)
+        slaves = self.settings.value("driveSlaves", [], type=list)
+        for port, slave in zip(ports, slaves):
+            self.drives.append(Drive(port, int(slave)))
+        self.updateDriveList()
+        self.sbHistory.setValue(self.settings.value("history", self.sbHistory.value(), type=int))
+        self.sbRefreshRate.setValue(self.settings.value("refreshrate", self.sbRefreshRate.value(), type=int))
 
     def writeSettings(self):
         self.settings.setValue("pos", self.pos())
         self.settings.setValue("size", self.size())
-        self.settings.setValue("comport", self.cbSelectComport.currentText())
+        self.settings.setValue("comport", self.drives[0].port)
+        self.settings.setValue("slave", self.drives[0].slave)
+        self.settings.setValue("drivePorts", [drive.port for drive in self.drives[1:]])
+        self.settings.setValue("driveSlaves", [str(drive.slave) for drive in self.drives[1:]])
+        self.settings.setValue("history", self.sbHistory.value())
+        self.settings.setValue("refreshrate", self.sbRefreshRate.value())
         for curve in self.curves:
             curve.writeSettings()
 
 
 if __name__ == '__main__':
-    import sys
-
     app = QApplication(sys.argv)
     mainWin = MainWindow()
     mainWin.show()
+
+    if '--benchmark-startup' in sys.argv:
+        # time until the window shows up and until it is ready to use, then quit
+        def printStartupTimes():
+            print('Startup: imports {0:.3f} s, window shown {1:.3f} s, ready {2:.3f} s'.format(
+                importTime - startupTime, mainWin.shownTime - startupTime, time.perf_counter() - startupTime))
+            app.quit()
+
+        mainWin.signalInitialized.connect(printStartupTimes, Qt.QueuedConnection)
     sys.exit(app.exec_())
@@ -0,0 +1,195 @@
+#
+# iHSV Servo Tool
+# Copyright (C) 2018 Robert Budde
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import collections
+import math
+import statistics
+import sys
+import threading
+import time
+
+from iHSV_Diagnostics import read_name
+
+
+# adaptive polling runs at the measured cycle time plus this margin
+ADAPTIVE_HEADROOM = 1.1
+
+# a sample arriving more than this many of its poll intervals after the previous one is late
+GAP_INTERVALS = 3
+
+
+def _average(average, value):
+    # exponential moving average, starting with the first value
+    return value if average is None else average + 0.1 * (value - average)
+
+
+class AcquisitionWorker(threading.Thread):
+    """ Polls read plans on its own thread and queues timestamped samples
+
+    Each sample is a (timestamp, entry, values) tuple per plan entry - the timestamp is
+    taken (time.perf_counter) when the response arrived, entry is the plan entry that was
+    read and values are the raw register words. Gaps are queued as samples without values
+    (None) - at the time a read failed, or between two samples of an entry that are more than
+    GAP_INTERVALS poll intervals apart (late, e.g. after retries or while the bus was busy).
+    Plan entries are only read in the cycles they are due (see iHSV_Modbus.compile_read_plan).
+    Samples are handed over through a deque (append/popleft are atomic), so the consumer
+    never blocks the poll loop. An optional recorder (see iHSV_Capture.CaptureWriter) gets
+    the raw words of every poll cycle of its plan - (None, None) for entries not read.
+    Several drives sharing a serial port are polled one after another within each cycle - one
+    (read_registers, plan) target per drive, see set_targets().
+
+    The round trip time of every read block and of whole cycles is measured. With adaptive
+    set, the poll period follows the measured cycle time (never below the requested period)
+    instead of overrunning the schedule - see statistics() for the rate actually achieved.
+    Round trip times, cycle times, dropped ticks and errors also go to diagnostics (see
+    iHSV_Diagnostics.Diagnostics) if given.
+    """
+
+    def __init__(self, read_registers=None, plan=None, period=0.01, maxlen=100000, adaptive=True, window=200, diagnostics=None):
+        super().__init__(daemon=True)
+        self.targets = [] if read_registers is None else [(read_registers, plan)]
+        self.min_period = period
+        self.period = period
+        self.adaptive = adaptive
+        self.diagnostics = diagnostics
+        self.samples = collections.deque(maxlen=maxlen)
+        self.errors = 0
+        # ticks skipped because a cycle took longer than the period
+        self.dropped = 0
+        # (start, count): averaged round trip time of the read
+        self.round_trip = {}
+        # id(entry): time of its last sample (None after a failed read)
+        self._last_sample = {}
+        self.cycle_time = None
+        self.cycle = 0
+        self._cycle_starts = collections.deque(maxlen=window)
+        self._statistics_lock = threading.Lock()
+        self.recorder = None
+        self._recorder_lock = threading.Lock()
+        self._stop_event = threading.Event()
+
+    def set_plan(self, plan):
+        # picked up with the next poll
+        self.set_targets([(self.targets[0][0], plan)])
+
+    def set_targets(self, targets):
+        # list of (read_registers, plan) - picked up with the next poll
+        self.targets = targets
+        self.round_trip = {}
+        self._last_sample = {}
+
+    def set_recorder(self, recorder):
+        # returns the previous recorder - it is not used anymore once this returns
+        with self._recorder_lock:
+            previous, self.recorder = self.recorder, recorder
+        return previous
+
+    def stop(self, timeout=1.0):
+        self._stop_event.set()
+        if self.is_alive():
+            self.join(timeout)
+
+    def statistics(self):
+        """ Returns a dict with the achieved rate (Hz), jitter (standard deviation of the cycle intervals, s),
+        dropped ticks, the current period and the average cycle and block round trip times (s)
+        """
+        with self._statistics_lock:
+            starts = list(self._cycle_starts)
+        intervals = [b - a for a, b in zip(starts, starts[1:])]
+        return {
+            'rate': len(intervals) / (starts[-1] - starts[0]) if intervals else 0.0,
+            'jitter': statistics.pstdev(intervals) if intervals else 0.0,
+            'dropped': self.dropped,
+            'period': self.period,
+            'cycle_time': self.cycle_time,
+            'round_trip': dict(self.round_trip),
+        }
+
+    def get_samples(self):
+        samples = []
+        try:
+            while True:
+                samples.append(self.samples.popleft())
+        except IndexError:
+            pass
+        return samples
+
+    def run(self):
+        next_poll = time.perf_counter()
+        while not self._stop_event.is_set():
+            cycle_start = time.perf_counter()
+            failed = False
+            for read_registers, plan in self.targets:
+                plan = plan or []
+                results = []
+                for entry in plan:
+                    if len(entry) > 4 and self.cycle % entry[4] != entry[5]:
+                        # slow channels - not due in this cycle
+                        results.append((None, None))
+                        continue
+                    request = time.perf_counter()
+                    try:
+                        values = read_registers(entry[0], entry[1])
+                    except Exception as e:
+                        self.errors += 1
+                        failed = True
+                        if self.diagnostics is not None:
+                            self.diagnostics.error('read', e)
+                        print('Error reading registers 0x{0:04X}: {1}'.format(entry[0], e), file=sys.stderr)
+                        self.samples.append((time.perf_counter(), entry, None))
+                        self._last_sample[id(entry)] = None
+                        results.append((None, None))
+                        continue
+                    timestamp = time.perf_counter()
+                    previous = self._last_sample.get(id(entry))
+                    interval = self.period * (entry[4] if len(entry) > 4 else 1)
+                    if previous is not None and timestamp - previous > GAP_INTERVALS * interval:
+                        self.samples.append(((previous + timestamp) / 2, entry, None))
+                    self._last_sample[id(entry)] = timestamp
+                    block = (entry[0], entry[1])
+                    self.round_trip[block] = _average(self.round_trip.get(block), timestamp - request)
+                    if self.diagnostics is not None:
+                        self.diagnostics.record(read_name(*block), timestamp - request)
+                    self.samples.append((timestamp, entry, values))
+                    results.append((timestamp, values))
+
+                with self._recorder_lock:
+                    if self.recorder is not None and self.recorder.plan is plan:
+                        self.recorder.append(results)
+
+            self.cycle += 1
+            with self._statistics_lock:
+                self._cycle_starts.append(cycle_start)
+            if self.diagnostics is not None:
+                self.diagnostics.record('poll cycle', time.perf_counter() - cycle_start)
+            if not failed:
+                # timeouts say nothing about the sustainable rate
+                self.cycle_time = _average(self.cycle_time, time.perf_counter() - cycle_start)
+                if self.adaptive:
+                    self.period = max(self.min_period, self.cycle_time * ADAPTIVE_HEADROOM)
+
+            next_poll += self.period
+            delay = next_poll - time.perf_counter()
+            if delay < 0:
+                # overrun - skip the ticks missed instead of trying to catch up
+                missed = math.ceil(-delay / self.period)
+                self.dropped += missed
+                if self.diagnostics is not None:
+                    self.diagnostics.count('dropped ticks', missed)
+                next_poll += missed * self.period
+                delay += missed * self.period
+            self._stop_event.wait(delay)
@@ -0,0 +1,205 @@
+#
+# iHSV Servo Tool
+# Copyright (C) 2018 Robert Budde
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+import numpy as np
+
+
+class RingBuffer:
+    """ Fixed-capacity, preallocated ring buffer with a zero-copy view of its contents
+
+    Every value is stored twice (at index and index + capacity), so the most recent
+    values are always available as one contiguous slice - appending is O(1) and never
+    allocates.
+    """
+
+    def __init__(self, capacity, dtype=float):
+        self.capacity = capacity
+        self._data = np.zeros(2 * capacity, dtype=dtype)
+        self._index = 0
+        self._len = 0
+
+    def __len__(self):
+        return self._len
+
+    def clear(self):
+        self._index = 0
+        self._len = 0
+
+    def append(self, value):
+        self._data[self._index] = value
+        self._data[self._index + self.capacity] = value
+        self._index = (self._index + 1) % self.capacity
+        if self._len < self.capacity:
+            self._len += 1
+
+    def extend(self, values):
+        values = np.asarray(values)[-self.capacity:]
+        n = len(values)
+        if n == 0:
+            return
+        # split at the wrap around, each part written to both halves
+        first = min(n, self.capacity - self._index)
+        for offset, part in ((self._index, values[:first]), (0, values[first:])):
+            self._data[offset:offset + len(part)] = part
+            self._data[offset + self.capacity:offset + self.capacity + len(part)] = part
+        self._index = (self._index + n) % self.capacity
+        self._len = min(self._len + n, self.capacity)
+
+    def view(self):
+        # oldest to newest - valid until the next append
+        end = self._index + self.capacity
+        return self._data[end - self._len:end]
+
+
+def _nanmin(a, b):
+    # NaN (gap) only if both are
+    return b if a != a or b < a else a
+
+
+def _nanmax(a, b):
+    return b if a != a or b > a else a
+
+
+class _PyramidLevel:
+
+    def __init__(self, size, capacity):
+        # number of raw samples per bucket
+        self.size = size
+        self.t = RingBuffer(capacity)
+        self.lo = RingBuffer(capacity)
+        self.hi = RingBuffer(capacity)
+        # bucket in progress
+        self.count = 0
+        self.pending_t0 = self.pending_t1 = None
+        self.pending_lo = self.pending_hi = None
+
+    def clear(self):
+        self.t.clear()
+        self.lo.clear()
+        self.hi.clear()
+        self.count = 0
+
+
+class HistoryBuffer:
+    """ Timestamped sample history with full resolution for recent values and a min/max pyramid for older ones
+
+    The most recent samples are kept as they are, the whole history is additionally kept in
+    levels of min/max buckets (each level decimating the previous one by factor) until the
+    coarsest level fits into max_points. render() picks the finest level showing the visible
+    time range with at most max_points points, so zooming out never touches all samples.
+    NaN values mark gaps - buckets holding nothing but gaps stay NaN.
+    """
+
+    def __init__(self, capacity, recent=65536, factor=8, max_points=4000):
+        self.capacity = capacity
+        self.factor = factor
+        self.max_points = max_points
+        self.count = 0
+
+        self.levels = []
+        size, points = 1, capacity
+        while points > max_points:
+            size *= factor
+            buckets = -(-capacity // size)
+            self.levels.append(_PyramidLevel(size, buckets))
+            points = 2 * buckets
+
+        # raw samples have to cover at least the bucket in progress of the coarsest level
+        raw = min(capacity, max(recent, size))
+        self.raw_t = RingBuffer(raw)
+        self.raw = RingBuffer(raw)
+
+    def __len__(self):
+        return min(self.count, self.capacity)
+
+    def clear(self):
+        self.count = 0
+        self.raw_t.clear()
+        self.raw.clear()
+        for level in self.levels:
+            level.clear()
+
+    def append(self, t, value):
+        self.raw_t.append(t)
+        self.raw.append(value)
+        self.count += 1
+
+        t0 = t1 = t
+        lo = hi = value
+        for level in self.levels:
+            if level.count == 0:
+                level.pending_t0, level.pending_lo, level.pending_hi = t0, lo, hi
+            else:
+                level.pending_lo = _nanmin(level.pending_lo, lo)
+                level.pending_hi = _nanmax(level.pending_hi, hi)
+            level.pending_t1 = t1
+            level.count += 1
+            if level.count < self.factor:
+                break
+            # bucket completed - store it (at its center) and carry it into the next level
+            level.t.append((level.pending_t0 + level.pending_t1) / 2)
+            level.lo.append(level.pending_lo)
+            level.hi.append(level.pending_hi)
+            level.count = 0
+            t0, t1 = level.pending_t0, level.pending_t1
+            lo, hi = level.pending_lo, level.pending_hi
+
+    def extend(self, t, values):
+        for sample_t, value in zip(t, values):
+            self.append(sample_t, value)
+
+    def render(self, t0=None, t1=None):
+        """ Returns (t, y) arrays covering the time range t0..t1
+        """
+        raw_t = self.raw_t.view()
+        n_raw = len(raw_t)
+        if n_raw == 0:
+            return raw_t, self.raw.view()
+        t0 = raw_t[0] if t0 is None else t0
+        t1 = raw_t[-1] if t1 is None else t1
+
+        i0 = np.searchsorted(raw_t, t0)
+        i1 = np.searchsorted(raw_t, t1, side='right')
+        raw_covers = i0 > 0 or self.count <= n_raw
+        if (raw_covers and i1 - i0 <= self.max_points) or not self.levels:
+            # zero-copy views of the visible raw samples (plus one on each side to continue the line)
+            i0, i1 = max(i0 - 1, 0), i1 + 1
+            return raw_t[i0:i1], self.raw.view()[i0:i1]
+
+        # estimate the number of samples in the range from the recent sample rate
+        span = min(t1, raw_t[-1]) - t0
+        rate = (n_raw - 1) / (raw_t[-1] - raw_t[0]) if raw_t[-1] > raw_t[0] else 0.0
+        samples = span * rate
+        level = self.levels[-1]
+        for candidate in self.levels:
+            if 2 * samples / candidate.size <= self.max_points:
+                level = candidate
+                break
+
+        # buckets overlapping t0..t1 (plus one on each side to continue the line)
+        level_t = level.t.view()
+        b0 = max(np.searchsorted(level_t, t0) - 1, 0)
+        b1 = min(np.searchsorted(level_t, t1, side='right') + 1, len(level_t))
+        lo = level.lo.view()[b0:b1]
+        hi = level.hi.view()[b0:b1]
+
+        # raw samples newer than the last completed bucket (if visible)
+        tail = self.count - (self.count // level.size) * level.size if b1 == len(level_t) else 0
+        t = np.concatenate((np.repeat(level_t[b0:b1], 2), raw_t[n_raw - tail:]))
+        y = np.concatenate((np.column_stack((lo, hi)).ravel(), self.raw.view()[n_raw - tail:]))
+        return t, y
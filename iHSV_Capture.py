@@ -0,0 +1,354 @@
+#
+# iHSV Servo Tool
+# Copyright (C) 2018 Robert Budde
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+import collections
+import datetime
+import json
+import math
+import os
+import queue
+import struct
+import threading
+import time
+import warnings
+
+import numpy as np
+
+from iHSV_Modbus import BlockDecoder
+
+
+# capture file layout:
+#   magic, header length (uint32, little endian), json header (padded to 8 bytes),
+#   fixed size records - per read block its timestamp (f8, NaN if the read failed or the block
+#   was not due - see divisors in the header) and its raw register words (u2)
+CAPTURE_MAGIC = b'iHSVCAP1'
+
+# records per bucket of the min/max envelope kept for zoomed out windows
+ENVELOPE_ROWS = 256
+
+
+def capture_dtype(blocks):
+    return np.dtype([field for i, (start, count) in enumerate(blocks)
+                     for field in (('t%d' % i, '<f8'), ('w%d' % i, '<u2', (count,)))])
+
+
+class CaptureWriter:
+    """ Streams raw register blocks and timestamps of every poll cycle to an append-only file
+
+    Records are collected in preallocated chunks which are handed over to a writer thread when
+    full or after flush_interval. At most max_pending chunks wait for the disk - if it can not
+    keep up, chunks are dropped (and counted) instead of blocking the poll loop. If writing
+    fails, error is set and all further chunks are dropped.
+    """
+
+    def __init__(self, path, motor_version, live_data, plan, chunk=1024, flush_interval=1.0, max_pending=64):
+        self.plan = plan
+        self.blocks = [(entry[0], entry[1]) for entry in plan]
+        self.divisors = [entry[4] if len(entry) > 4 else 1 for entry in plan]
+        self.dtype = capture_dtype(self.blocks)
+        self.start = time.perf_counter()
+        self.records = 0
+        self.dropped = 0
+        self.error = None
+
+        header = {
+            'motor_version': motor_version,
+            'created': datetime.datetime.now().isoformat(),
+            'channels': [{'name': name, 'registers': list(regs), 'signed': signed} for regs, signed, name in live_data],
+            'blocks': self.blocks,
+            'divisors': self.divisors,
+        }
+        header = json.dumps(header).encode()
+        header += b' ' * (-(len(CAPTURE_MAGIC) + 4 + len(header)) % 8)
+
+        self.file = open(path, 'wb')
+        self.file.write(CAPTURE_MAGIC + struct.pack('<I', len(header)) + header)
+        self.file.flush()
+
+        self.chunk_size = chunk
+        self.flush_interval = flush_interval
+        self._new_chunk()
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._thread = threading.Thread(target=self._write, daemon=True)
+        self._thread.start()
+
+    def _new_chunk(self):
+        self._chunk = np.zeros(self.chunk_size, dtype=self.dtype)
+        self._fill = 0
+        self._handoff = time.perf_counter()
+
+    def _hand_over(self):
+        try:
+            self._queue.put_nowait(self._chunk[:self._fill])
+        except queue.Full:
+            self.dropped += self._fill
+        self._new_chunk()
+
+    def append(self, results):
+        """ Stores one poll cycle - a (timestamp, words) tuple per plan block (None, None if the read failed)
+        """
+        record = self._chunk[self._fill]
+        for i, (timestamp, words) in enumerate(results):
+            if timestamp is None:
+                record['t%d' % i] = np.nan
+            else:
+                record['t%d' % i] = timestamp - self.start
+                record['w%d' % i] = words
+        self._fill += 1
+        self.records += 1
+        if self._fill == self.chunk_size or time.perf_counter() - self._handoff > self.flush_interval:
+            self._hand_over()
+
+    def _write(self):
+        while True:
+            chunk = self._queue.get()
+            if chunk is None:
+                break
+            if self.error is not None:
+                self.dropped += len(chunk)
+                continue
+            try:
+                chunk.tofile(self.file)
+                self.file.flush()
+            except OSError as e:
+                self.error = e
+                self.dropped += len(chunk)
+
+    def close(self):
+        # called from the thread calling append() (or after it stopped)
+        if self._fill:
+            self._hand_over()
+        self._queue.put(None)
+        self._thread.join()
+        self.file.close()
+
+
+class CsvWriter:
+    """ Writes the decoded channels of every poll cycle as csv lines to a text file
+
+    Same interface as CaptureWriter - poll cycles are queued by append() and decoded and written
+    in batches by a writer thread every flush_interval. Each line holds the time of the cycle
+    (its first successful read) and the values of the channels in the given order, empty fields
+    for failed reads. The file is not closed by close(). If writing fails (e.g. a closed pipe),
+    error is set and nothing is written anymore.
+    """
+
+    def __init__(self, file, plan, names, flush_interval=0.1):
+        self.file = file
+        self.plan = plan
+        self.names = list(names)
+        # per plan entry the csv columns of its decoded values
+        self.columns = [[self.names.index(key) for _, key in entry[2]] for entry in plan]
+        self.start = time.perf_counter()
+        self.records = 0
+        self.dropped = 0
+        self.error = None
+        self.flush_interval = flush_interval
+
+        self.file.write(','.join(['time'] + self.names) + '\n')
+        self.file.flush()
+
+        self._pending = collections.deque()
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._write, daemon=True)
+        self._thread.start()
+
+    def append(self, results):
+        """ Queues one poll cycle - a (timestamp, words) tuple per plan block (None, None if the read failed)
+        """
+        self._pending.append(results)
+        self.records += 1
+
+    def _write_pending(self):
+        cycles = []
+        try:
+            while True:
+                cycles.append(self._pending.popleft())
+        except IndexError:
+            pass
+        if not cycles:
+            return
+
+        t = np.full(len(cycles), np.nan)
+        values = np.full((len(cycles), len(self.names)), np.nan)
+        for i, entry in enumerate(self.plan):
+            rows = [row for row, results in enumerate(cycles) if results[i][0] is not None]
+            if not rows:
+                continue
+            # decode the words of all cycles at once
+            values[np.ix_(rows, self.columns[i])] = entry[3].decode([cycles[row][i][1] for row in rows])
+            first = [row for row in rows if np.isnan(t[row])]
+            t[first] = [cycles[row][i][0] - self.start for row in first]
+
+        lines = []
+        for row_t, row in zip(t.tolist(), values.tolist()):
+            fields = ['' if math.isnan(row_t) else '{0:.6f}'.format(row_t)]
+            fields += ['' if math.isnan(value) else '{0:d}'.format(int(value)) for value in row]
+            lines.append(','.join(fields) + '\n')
+        try:
+            self.file.write(''.join(lines))
+            self.file.flush()
+        except OSError as e:
+            self.error = e
+
+    def _write(self):
+        while not self._stop_event.wait(self.flush_interval) and self.error is None:
+            self._write_pending()
+
+    def close(self):
+        # called from the thread calling append() (or after it stopped)
+        self._stop_event.set()
+        self._thread.join()
+        if self.error is None:
+            self._write_pending()
+
+
+class CaptureReader:
+    """ Memory-mapped access to a capture file written by CaptureWriter
+
+    Opening a capture only reads its header - records are loaded by the operating system
+    when window() touches them, so even multi-GB captures open instantly.
+    """
+
+    def __init__(self, path, max_rows=2000000):
+        with open(path, 'rb') as f:
+            if f.read(len(CAPTURE_MAGIC)) != CAPTURE_MAGIC:
+                raise ValueError('Not an iHSV capture file')
+            length, = struct.unpack('<I', f.read(4))
+            self.header = json.loads(f.read(length).decode())
+
+        self.motor_version = self.header['motor_version']
+        self.blocks = [tuple(block) for block in self.header['blocks']]
+        self.divisors = self.header.get('divisors', [1] * len(self.blocks))
+        self.dtype = capture_dtype(self.blocks)
+        # rows decoded at once while building an envelope
+        self.max_rows = max_rows
+        # name: (t, min, max) per ENVELOPE_ROWS records - built on first use
+        self.envelopes = {}
+
+        offset = len(CAPTURE_MAGIC) + 4 + length
+        rows = (os.path.getsize(path) - offset) // self.dtype.itemsize
+        if rows > 0:
+            # ignore a partially written last record
+            self.records = np.memmap(path, dtype=self.dtype, mode='r', offset=offset, shape=(rows,))
+        else:
+            self.records = np.zeros(0, dtype=self.dtype)
+
+        # name: (block index, word offset, decoder)
+        self.channels = {}
+        for channel in self.header['channels']:
+            regs = channel['registers']
+            for i, (start, count) in enumerate(self.blocks):
+                if start <= regs[0] < start + count:
+                    decoder = BlockDecoder([(0, len(regs), channel['signed'])])
+                    self.channels[channel['name']] = (i, regs[0] - start, decoder)
+                    break
+
+    def __len__(self):
+        return len(self.records)
+
+    def _time(self, row):
+        # time of a record - the first block that was read successfully
+        while row < len(self.records):
+            for i in range(len(self.blocks)):
+                t = self.records[row]['t%d' % i]
+                if not np.isnan(t):
+                    return t
+            row += 1
+        return np.inf
+
+    def _search(self, t):
+        # index of the first record at or after t (binary search touching only a few pages)
+        lo, hi = 0, len(self.records)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._time(mid) < t:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def time_range(self):
+        if len(self.records) == 0:
+            return 0.0, 0.0
+        last = len(self.records) - 1
+        while last > 0 and np.isinf(self._time(last)):
+            last -= 1
+        return self._time(0), self._time(last)
+
+    def _decode(self, name, r0, r1):
+        # (t, y) of records r0:r1 - NaN if the read failed or the channel was not due
+        block, offset, decoder = self.channels[name]
+        rows = self.records[r0:r1]
+        t = np.array(rows['t%d' % block])
+        y = decoder.decode(rows['w%d' % block][:, offset:offset + decoder.channels[0][1]])[:, 0]
+        y[np.isnan(t)] = np.nan
+        return t, y
+
+    @staticmethod
+    def _reduce(t, low, high, n):
+        # (mean t, min, max) of buckets of n samples - buckets without a sample are NaN
+        pad = -len(t) % n
+        t, low, high = (np.append(a, np.full(pad, np.nan)).reshape(-1, n) for a in (t, low, high))
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            return np.nanmean(t, axis=1), np.nanmin(low, axis=1), np.nanmax(high, axis=1)
+
+    def _envelope(self, name):
+        if name not in self.envelopes:
+            # the whole capture in contiguous chunks - every sample counts, spikes included
+            chunk = max(self.max_rows // ENVELOPE_ROWS, 1) * ENVELOPE_ROWS
+            parts = []
+            for r0 in range(0, len(self.records), chunk):
+                t, y = self._decode(name, r0, min(r0 + chunk, len(self.records)))
+                parts.append(self._reduce(t, y, y, ENVELOPE_ROWS))
+            self.envelopes[name] = tuple(np.concatenate(part) for part in zip(*parts)) if parts else (np.zeros(0),) * 3
+        return self.envelopes[name]
+
+    def window(self, name, t0, t1, max_points=4000):
+        """ Returns (t, y) of a channel between t0 and t1 - as min/max envelope if there are more than max_points samples
+        """
+        divisor = self.divisors[self.channels[name][0]]
+        r0 = max(self._search(t0) - 1, 0)
+        r1 = min(self._search(t1) + 1, len(self.records))
+        buckets = max_points // 2
+
+        envelope = (r1 - r0) // divisor > max_points
+        if envelope and r1 - r0 >= buckets * ENVELOPE_ROWS:
+            # zoomed out - merge the buckets of the envelope
+            b0, b1 = r0 // ENVELOPE_ROWS, -(-r1 // ENVELOPE_ROWS)
+            t, low, high = (a[b0:b1] for a in self._envelope(name))
+            t, low, high = self._reduce(t, low, high, -(-len(t) // buckets))
+        else:
+            t, low = self._decode(name, r0, r1)
+            high = low
+            if envelope:
+                t, low, high = self._reduce(t, low, high, -(-len(t) // buckets))
+        if divisor > 1:
+            # slow channels - most records (buckets) do not hold a sample, failed reads are not shown
+            read = ~np.isnan(t)
+            t, low, high = t[read], low[read], high[read]
+
+        # failed reads (buckets of failed reads only) are shown as gaps at the time they were due
+        failed = np.isnan(t)
+        if failed.any() and not failed.all():
+            index = np.arange(len(t))
+            t[failed] = np.interp(index[failed], index[~failed], t[~failed])
+        if not envelope:
+            return t, low
+        return np.repeat(t, 2), np.column_stack((low, high)).ravel()
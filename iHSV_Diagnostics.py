@@ -0,0 +1,163 @@
+#
+# iHSV Servo Tool
+# Copyright (C) 2018 Robert Budde
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import bisect
+import collections
+import contextlib
+import json
+import threading
+import time
+
+
+# bucket edges for durations: 10 us .. ~10 s, doubling
+DURATION_EDGES = [10e-6 * 2 ** i for i in range(21)]
+# bucket edges for counts (e.g. queue depth)
+COUNT_EDGES = [0, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000]
+
+# modbus exceptions (see iHSV_Modbus) and what they usually mean
+ERROR_NAMES = {
+    'NoResponseError': 'timeout (no response)',
+    'InvalidResponseError': 'invalid response (CRC, framing)',
+    'CrcError': 'CRC error (noise on the line)',
+    'IncompleteResponseError': 'incomplete response (bytes lost)',
+    'UnexpectedResponseError': 'unexpected response (late answer, other slave)',
+    'SlaveReportedException': 'rejected by drive',
+    'IllegalRequestError': 'rejected by drive (illegal request)',
+    'SlaveDeviceBusyError': 'drive busy',
+    'SerialException': 'serial port',
+}
+
+
+def read_name(start, count):
+    # histogram of the round trip times of a read block
+    return 'read 0x{0:04X}+{1}'.format(start, count)
+
+
+class Histogram:
+    """ Counts values into fixed buckets - bucket i holds values up to edges[i], the last one everything above
+    """
+
+    def __init__(self, edges=DURATION_EDGES):
+        self.edges = edges
+        self.buckets = [0] * (len(edges) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = None
+
+    def add(self, value):
+        self.buckets[bisect.bisect_left(self.edges, value)] += 1
+        self.count += 1
+        self.total += value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else None
+
+    def percentile(self, q):
+        # upper edge of the bucket holding the q-th percentile (the maximum for the last bucket)
+        if not self.count:
+            return None
+        rank = q / 100 * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank and n:
+                return min(self.edges[i], self.max) if i < len(self.edges) else self.max
+        return self.max
+
+    def as_dict(self):
+        return {
+            'count': self.count,
+            'mean': self.mean,
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+            'p99': self.percentile(99),
+            'max': self.max,
+            'edges': self.edges,
+            'buckets': self.buckets,
+        }
+
+
+class Diagnostics:
+    """ Counters and histograms of the acquisition and rendering, safe to update from any thread
+
+    Durations are recorded in seconds with time(), counts (e.g. queue depths) with record(). Errors
+    are counted per exception type, the last message of each type is kept. expected holds modeled
+    durations (e.g. the pure transfer time of a read) to compare the measurements with.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        with self.lock:
+            self.started = time.time()
+            self.histograms = {}
+            self.counters = collections.Counter()
+            self.last_errors = {}
+            self.expected = {}
+
+    def record(self, name, value, edges=DURATION_EDGES):
+        with self.lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram(edges)
+            histogram.add(value)
+
+    @contextlib.contextmanager
+    def time(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def expect(self, name, value):
+        with self.lock:
+            self.expected[name] = value
+
+    def count(self, name, n=1):
+        with self.lock:
+            self.counters[name] += n
+
+    def error(self, source, exception):
+        name = type(exception).__name__
+        with self.lock:
+            self.counters['{0} errors: {1}'.format(source, ERROR_NAMES.get(name, name))] += 1
+            self.last_errors[name] = str(exception)
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                'started': time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self.started)),
+                'duration': time.time() - self.started,
+                'histograms': {name: histogram.as_dict() for name, histogram in sorted(self.histograms.items())},
+                'counters': dict(sorted(self.counters.items())),
+                'last_errors': dict(self.last_errors),
+                'expected': dict(self.expected),
+            }
+
+    def export(self, path, **extra):
+        """ Writes a snapshot (and extra information, e.g. settings) as json
+        """
+        data = self.snapshot()
+        data.update(extra)
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2, default=str)
@@ -0,0 +1,606 @@
+#
+# iHSV Servo Tool
+# Copyright (C) 2018 Robert Budde
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+import concurrent.futures
+import itertools
+import math
+import struct
+import threading
+import time
+
+import numpy as np
+import serial
+
+
+# maximum number of registers a single "read holding registers" request may return
+MAX_READ_COUNT = 125
+
+# time the drive needs to answer a request plus host side latency (usb-serial adapter,
+# operating system) - not part of the modbus framing but paid once per request
+DEFAULT_TURNAROUND = 0.003
+
+# allowance on top of the expected transaction time before a response counts as lost - covers
+# the latency timer of usb-serial adapters (16 ms by default) and a busy drive
+TIMEOUT_MARGIN = 0.025
+
+# attempts after a lost or garbled response
+DEFAULT_RETRIES = 2
+
+
+class RtuTiming:
+    """ Bus time model of modbus rtu transactions at a given serial configuration
+    """
+
+    def __init__(self, baudrate, bytesize=8, parity=serial.PARITY_NONE, stopbits=1, turnaround=DEFAULT_TURNAROUND):
+        self.baudrate = baudrate
+        self.turnaround = turnaround
+        # start bit + data bits + optional parity bit + stop bits
+        self.bits_per_char = 1 + bytesize + (0 if parity == serial.PARITY_NONE else 1) + stopbits
+
+    @classmethod
+    def from_settings(cls, rs232, **kwargs):
+        return cls(rs232['baudrate'], rs232['bytesize'], rs232['parity'], rs232['stopbits'], **kwargs)
+
+    @property
+    def char_time(self):
+        return self.bits_per_char / self.baudrate
+
+    @property
+    def silence(self):
+        # inter-frame silence of 3.5 chars - fixed to 1.75 ms above 19200 baud
+        if self.baudrate > 19200:
+            return 0.00175
+        return 3.5 * self.char_time
+
+    def transaction_time(self, request_len, response_len):
+        return (request_len + response_len) * self.char_time + 2 * self.silence + self.turnaround
+
+    def read_time(self, count):
+        # request: slave, function, start (2), count (2), crc (2)
+        # response: slave, function, byte count, 2 bytes per register, crc (2)
+        return self.transaction_time(8, 5 + 2 * count)
+
+
+def plan_reads(registers, timing, max_count=MAX_READ_COUNT):
+    """ Returns the list of (start, count) blocks covering all registers with the lowest total bus time
+
+    Gaps between registers are read along (and discarded) whenever an additional request
+    would cost more than transferring the unused registers. Registers may be given as single
+    addresses or as (first, last) spans which will never be split across two blocks.
+    """
+    spans = sorted((reg, reg) if isinstance(reg, int) else tuple(reg) for reg in registers)
+    if not spans:
+        return []
+
+    # merge overlapping spans
+    merged = [list(spans[0])]
+    for first, last in spans[1:]:
+        if first <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], last)
+        else:
+            merged.append([first, last])
+
+    # best[j]: lowest time to read merged[:j], begin[j]: index of the first span of the last block
+    best = [0.0] + [float('inf')] * len(merged)
+    begin = [0] * (len(merged) + 1)
+    for j, (_, last) in enumerate(merged):
+        for i in range(j, -1, -1):
+            count = last - merged[i][0] + 1
+            if count > max_count:
+                break
+            cost = best[i] + timing.read_time(count)
+            if cost < best[j + 1]:
+                best[j + 1] = cost
+                begin[j + 1] = i
+        if best[j + 1] == float('inf'):
+            raise ValueError('Registers 0x{0:04X}-0x{1:04X} exceed a single read'.format(*merged[j]))
+
+    blocks = []
+    j = len(merged)
+    while j > 0:
+        i = begin[j]
+        blocks.append((merged[i][0], merged[j - 1][1] - merged[i][0] + 1))
+        j = i
+    return blocks[::-1]
+
+
+class BlockDecoder:
+    """ Decodes raw register words of a read block into channel values
+
+    channels is a list of (offset, width, signed) tuples - 32 bit values span two registers
+    (high word first) and are always two's complement, 16 bit values only if signed.
+    decode() takes the words of one block (count,) or of many blocks (n, count) at once and
+    returns float values (channels,) or (n, channels).
+    """
+
+    def __init__(self, channels):
+        self.channels = channels
+        # dtype: (channel indices, word columns) - channels of one type are decoded at once
+        self.columns = {}
+        for i, (offset, width, signed) in enumerate(channels):
+            if width == 2:
+                dtype = '>i4'
+            else:
+                dtype = '>i2' if signed else '>u2'
+            index, columns = self.columns.setdefault(dtype, ([], []))
+            index.append(i)
+            columns.extend(range(offset, offset + width))
+
+    def decode(self, words):
+        words = np.asarray(words, dtype='>u2')
+        values = np.empty(words.shape[:-1] + (len(self.channels),))
+        for dtype, (index, columns) in self.columns.items():
+            # gather the words of all channels of one type and reinterpret them at once
+            values[..., index] = np.ascontiguousarray(words[..., columns]).view(dtype)
+        return values
+
+
+def _spread_phases(plan, timing, horizon):
+    # each slow read goes to the phase with the least bus time in its busiest cycle - entries are
+    # [start, count, channels, divisor, phase], returns the (busiest, average) cycle time
+    load = np.zeros(horizon)
+    for entry in sorted(plan, key=lambda entry: -entry[1]):
+        divisor = entry[3]
+        if divisor > 1:
+            entry[4] = min(range(divisor), key=lambda phase: load[phase::divisor].max())
+        load[entry[4]::divisor] += timing.read_time(entry[1])
+    # rounded - options differing by the order of the additions only are equal
+    return round(load.max(), 9), round(load.mean(), 9)
+
+
+def compile_read_plan(channels, timing, max_count=MAX_READ_COUNT):
+    """ Compiles a read plan for a list of (key, registers, signed[, divisor]) channels
+
+    Returns a list of (start, count, [(slice, key), ...], decoder, divisor, phase) entries - each
+    entry is one read_registers call, the slices map the returned words onto the channels and
+    the decoder turns them into the channel values (in the same order).
+    The registers of a channel have to be consecutive. Channels with a divisor n > 1 are only
+    read every n-th poll cycle (in cycles where cycle % n == phase), their phases are chosen to
+    spread the slow reads over the cycles. Slower channels within a block read for faster ones
+    anyway come along with it. Other slow blocks either get a request of their own or extend a
+    faster block - whichever keeps the busiest poll cycle shorter (then the average one).
+    The divisor of an entry is the one it is read at, it may be lower than that of its channels.
+    """
+    groups = {}
+    for channel in channels:
+        divisor = channel[3] if len(channel) > 3 else 1
+        groups.setdefault(max(int(divisor), 1), []).append(channel[:3])
+
+    horizon = 1
+    for divisor in groups:
+        horizon = min(horizon * divisor // math.gcd(horizon, divisor), 3600)
+
+    # entries hold the channels with their registers until all channels are placed
+    plan = []
+    for divisor, group in sorted(groups.items()):
+        left = []
+        for key, regs, signed in group:
+            covering = [entry for entry in plan if entry[0] <= regs[0] and regs[-1] < entry[0] + entry[1]]
+            if covering:
+                covering[0][2].append((key, regs, signed))
+            else:
+                left.append((key, regs, signed))
+        spans = [(regs[0], regs[-1]) for _, regs, _ in left]
+        for start, count in plan_reads(spans, timing, max_count):
+            members = [channel for channel in left if start <= channel[1][0] < start + count]
+            options = [plan + [[start, count, members, divisor, 0]]]
+            for i, entry in enumerate(plan):
+                first, end = min(entry[0], start), max(entry[0] + entry[1], start + count)
+                if end - first <= max_count:
+                    options.append(plan[:i] + [[first, end - first, entry[2] + members, entry[3], 0]] + plan[i + 1:])
+            plan = min(options, key=lambda option: _spread_phases(option, timing, horizon))
+    _spread_phases(plan, timing, horizon)
+
+    entries = []
+    for start, count, members, divisor, phase in plan:
+        slices, decoder = [], []
+        for key, regs, signed in members:
+            offset = regs[0] - start
+            slices.append((slice(offset, offset + len(regs)), key))
+            decoder.append((offset, len(regs), signed))
+        entries.append((start, count, slices, BlockDecoder(decoder), divisor, phase))
+    return entries
+
+
+def contiguous_blocks(addresses, max_count=MAX_READ_COUNT):
+    """ Returns the (start, count) blocks of consecutive addresses
+    """
+    blocks = []
+    for reg in sorted(set(addresses)):
+        if blocks and reg == blocks[-1][0] + blocks[-1][1] and blocks[-1][1] < max_count:
+            blocks[-1][1] += 1
+        else:
+            blocks.append([reg, 1])
+    return [tuple(block) for block in blocks]
+
+
+def read_registers_batched(bus, addresses, max_count=MAX_READ_COUNT, cancelled=None):
+    """ Reads all addresses with one read_registers call per block of consecutive addresses
+
+    Returns a dict address: value. Blocks the drive rejects as illegal are read register by
+    register, addresses rejected on their own map to None. On a timeout or a bad response the
+    whole block maps to None, on a port error all remaining addresses do. cancelled (callable)
+    is checked before every request - once it returns True the remaining addresses map to None.
+    """
+    values = dict.fromkeys(addresses)
+    for start, count in contiguous_blocks(addresses, max_count):
+        if cancelled is not None and cancelled():
+            break
+        try:
+            values.update(zip(range(start, start + count), bus.read_registers(start, count)))
+            continue
+        except IllegalRequestError as e:
+            if count == 1:
+                print('Error reading register 0x{0:04X}: {1}'.format(start, e))
+                continue
+        except serial.SerialException as e:
+            print('Error reading registers from 0x{0:04X}: {1}'.format(start, e))
+            break
+        except ModbusException as e:
+            # retried by the transport already - another try per register would not fare better
+            print('Error reading registers 0x{0:04X}-0x{1:04X}: {2}'.format(start, start + count - 1, e))
+            continue
+        for reg in range(start, start + count):
+            if cancelled is not None and cancelled():
+                break
+            try:
+                values[reg] = bus.read_register(reg)
+            except IllegalRequestError as e:
+                print('Error reading register 0x{0:04X}: {1}'.format(reg, e))
+            except (ModbusException, serial.SerialException) as e:
+                print('Error reading register 0x{0:04X}: {1}'.format(reg, e))
+                break
+    return values
+
+
+# request priorities - lower goes first, requests of the same priority in order
+PRIORITY_WRITE = 0
+PRIORITY_PARAMETER = 1
+PRIORITY_POLL = 2
+
+PRIORITY_NAMES = {PRIORITY_WRITE: 'write', PRIORITY_PARAMETER: 'parameter read', PRIORITY_POLL: 'monitor read'}
+
+
+class ModbusException(IOError):
+    pass
+
+
+class NoResponseError(ModbusException):
+    pass
+
+
+class InvalidResponseError(ModbusException):
+    pass
+
+
+class CrcError(InvalidResponseError):
+    pass
+
+
+class IncompleteResponseError(InvalidResponseError):
+    pass
+
+
+class UnexpectedResponseError(InvalidResponseError):
+    pass
+
+
+class SlaveReportedException(ModbusException):
+    pass
+
+
+class IllegalRequestError(SlaveReportedException):
+    pass
+
+
+class SlaveDeviceBusyError(SlaveReportedException):
+    pass
+
+
+# exception code: (exception, message)
+SLAVE_EXCEPTIONS = {
+    1: (IllegalRequestError, 'Slave reported illegal function'),
+    2: (IllegalRequestError, 'Slave reported illegal data address'),
+    3: (IllegalRequestError, 'Slave reported illegal data value'),
+    4: (SlaveReportedException, 'Slave reported device failure'),
+    6: (SlaveDeviceBusyError, 'Slave reported device busy'),
+}
+
+
+def crc16(data):
+    crc = 0xFFFF
+    for byte in data:
+        crc ^= byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
+    return struct.pack('<H', crc)
+
+
+def read_request(slave, start, count):
+    """ Returns the frame reading count holding registers (function 3)
+    """
+    frame = struct.pack('>BBHH', slave, 3, start, count)
+    return frame + crc16(frame)
+
+
+def write_request(slave, reg, value):
+    """ Returns the frame writing a single register (function 6)
+    """
+    frame = struct.pack('>BBHH', slave, 6, reg, value & 0xFFFF)
+    return frame + crc16(frame)
+
+
+class ResponseParser:
+    """ Collects the response to a request as it arrives
+
+    missing is the number of bytes still expected - an exception response is recognized by
+    its function code and complete after 5 bytes. result() checks the frame and returns the
+    register values (None for writes) or raises the matching ModbusException.
+    """
+
+    def __init__(self, request):
+        self.request = request
+        self.buffer = bytearray()
+        if request[1] in (3, 4):
+            self.length = 5 + 2 * struct.unpack('>H', request[4:6])[0]
+        else:
+            self.length = 8
+        # every response is at least as long as an exception response
+        self.missing = 5
+
+    def feed(self, data):
+        self.buffer += data
+        length = 5 if len(self.buffer) >= 2 and self.buffer[1] & 0x80 else self.length
+        self.missing = max(length - len(self.buffer), 0)
+
+    def result(self):
+        frame = bytes(self.buffer)
+        if not frame:
+            raise NoResponseError('No communication with the instrument (no answer)')
+        if self.missing:
+            raise IncompleteResponseError('Incomplete response: {0} of {1} bytes'.format(len(frame), len(frame) + self.missing))
+        if crc16(frame[:-2]) != frame[-2:]:
+            raise CrcError('CRC mismatch in response {0}'.format(frame.hex()))
+        slave, function = self.request[0], self.request[1]
+        if frame[0] != slave or frame[1] & 0x7F != function:
+            raise UnexpectedResponseError('Response from slave {0} function {1} to a request to slave {2} function {3}'.format(
+                frame[0], frame[1] & 0x7F, slave, function))
+        if frame[1] & 0x80:
+            exception, message = SLAVE_EXCEPTIONS.get(frame[2], (SlaveReportedException, 'Slave reported error code {0}'.format(frame[2])))
+            raise exception(message)
+        if function in (3, 4):
+            if frame[2] != self.length - 5:
+                raise UnexpectedResponseError('Wrong byte count {0} in response'.format(frame[2]))
+            return list(struct.unpack('>{0}H'.format(frame[2] // 2), frame[3:-2]))
+        if frame[:6] != self.request[:6]:
+            raise UnexpectedResponseError('Write response does not echo the request')
+        return None
+
+
+class RtuTransport:
+    """ Modbus rtu master on a serial port shared by several threads
+
+    Requests from any thread go into one queue and are sent one at a time, by priority (see
+    PRIORITY_WRITE etc.) and in order within a priority, by an asyncio event loop on its own
+    thread. The next request is picked while the current one is on the bus. The loop keeps the
+    inter-frame silence of the baudrate and parses responses as they arrive - e.g. an exception
+    response is taken as soon as it is complete instead of waiting for the timeout.
+    submit() returns a concurrent.futures.Future of the response - its wait attribute is the
+    time the request was queued before it went on the bus. A write waits for the request on
+    the bus at most. Wait times per priority also go to diagnostics (see iHSV_Diagnostics) if given.
+
+    A response counts as lost once it is TIMEOUT_MARGIN later than the transfer of request and
+    response at the baudrate would take (see timeout()) - the timeout of the port only bounds it.
+    Requests with a lost, garbled or unexpected response or a busy drive are sent again right
+    away, up to retries times; every failed attempt goes to diagnostics by its exception type.
+    """
+
+    def __init__(self, connection, turnaround=DEFAULT_TURNAROUND, diagnostics=None, retries=DEFAULT_RETRIES):
+        self.serial = connection
+        self.diagnostics = diagnostics
+        self.retries = retries
+        self.max_timeout = connection.timeout
+        self.attempts = 0
+        self.failures = 0
+        self.timing = RtuTiming(connection.baudrate, connection.bytesize, connection.parity, connection.stopbits, turnaround)
+        self._sequence = itertools.count()
+        self._closed = False
+        self._lock = threading.Lock()
+        # end of the last frame on the bus
+        self._last_frame = 0.0
+        # blocking serial calls - keeps the loop free to queue requests meanwhile
+        self._io = concurrent.futures.ThreadPoolExecutor(1)
+        self._loop = asyncio.new_event_loop()
+        self._queue = None
+        started = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(started,), daemon=True)
+        self._thread.start()
+        started.wait()
+
+    def _run(self, started):
+        asyncio.set_event_loop(self._loop)
+        self._queue = asyncio.PriorityQueue()
+        self._server = self._loop.create_task(self._serve())
+        started.set()
+        self._loop.run_forever()
+
+    def submit(self, request, priority=PRIORITY_POLL):
+        future = concurrent.futures.Future()
+        with self._lock:
+            if self._closed:
+                future.set_exception(serial.SerialException('Port is closed'))
+            else:
+                item = (priority, next(self._sequence), time.perf_counter(), request, future)
+                self._loop.call_soon_threadsafe(self._queue.put_nowait, item)
+        return future
+
+    def transact(self, request, priority=PRIORITY_POLL):
+        return self.submit(request, priority).result()
+
+    def close(self):
+        """ Fails the queued requests, waits for the one on the bus and closes the port
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            # runs after all requests submitted so far are queued
+            self._loop.call_soon_threadsafe(self._shutdown)
+        self._thread.join()
+        self._io.shutdown(wait=True)
+        self._loop.close()
+        self.serial.close()
+
+    def _shutdown(self):
+        while not self._queue.empty():
+            *_, future = self._queue.get_nowait()
+            if future.set_running_or_notify_cancel():
+                future.set_exception(serial.SerialException('Port is closed'))
+        # ahead of everything - ends the server once the request on the bus is done
+        self._queue.put_nowait((-1, -1, 0.0, None, None))
+        self._server.add_done_callback(lambda task: self._loop.stop())
+
+    async def _serve(self):
+        while True:
+            priority, _, submitted, request, future = await self._queue.get()
+            if request is None:
+                return
+            if not future.set_running_or_notify_cancel():
+                continue
+            future.wait = time.perf_counter() - submitted
+            if self.diagnostics is not None:
+                self.diagnostics.record('bus wait: ' + PRIORITY_NAMES.get(priority, str(priority)), future.wait)
+            try:
+                future.set_result(await self._attempt(request))
+            except Exception as e:
+                future.set_exception(e)
+
+    def timeout(self, request_len, response_len):
+        timeout = self.timing.transaction_time(request_len, response_len) + TIMEOUT_MARGIN
+        return timeout if self.max_timeout is None else min(timeout, self.max_timeout)
+
+    async def _attempt(self, request):
+        for attempt in range(self.retries + 1):
+            self.attempts += 1
+            try:
+                return await self._transact(request)
+            except (NoResponseError, InvalidResponseError, SlaveDeviceBusyError) as e:
+                self.failures += 1
+                if self.diagnostics is not None:
+                    self.diagnostics.error('bus', e)
+                if attempt == self.retries:
+                    raise
+                if self.diagnostics is not None:
+                    self.diagnostics.count('bus retries')
+            except ModbusException as e:
+                # the drive rejected the request - asking again will not help
+                self.failures += 1
+                if self.diagnostics is not None:
+                    self.diagnostics.error('bus', e)
+                raise
+
+    async def _call(self, function, *args):
+        return await self._loop.run_in_executor(self._io, function, *args)
+
+    def _send(self, request, timeout):
+        # drop anything left from a late response
+        self.serial.reset_input_buffer()
+        if self.serial.timeout != timeout:
+            self.serial.timeout = timeout
+        self.serial.write(request)
+
+    async def _transact(self, request):
+        delay = self._last_frame + self.timing.silence - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        parser = ResponseParser(request)
+        try:
+            # whole milliseconds - the port is only reconfigured when the timeout changes
+            timeout = math.ceil(self.timeout(len(request), parser.length) * 1000) / 1000
+            await self._call(self._send, request, timeout)
+            if request[0] == 0:
+                # broadcast - no response
+                return None
+            while parser.missing:
+                data = await self._call(self.serial.read, parser.missing)
+                if not data:
+                    break
+                parser.feed(data)
+        finally:
+            self._last_frame = time.perf_counter()
+        return parser.result()
+
+
+class ModbusBus:
+    """ One drive on an RtuTransport - blocking calls, safe to use from any thread
+
+    Drives on the same serial port (rs485) share the transport - see slave(). Reads are queued
+    with the priority of the bus (see prioritized()), writes ahead of all reads.
+    """
+
+    def __init__(self, transport, address=1, priority=PRIORITY_POLL):
+        self.transport = transport
+        self.address = address
+        self.priority = priority
+
+    def slave(self, address):
+        """ Returns a bus for another drive on the same serial port
+        """
+        return ModbusBus(self.transport, address, self.priority)
+
+    def prioritized(self, priority):
+        """ Returns a bus for the same drive reading with another priority
+        """
+        return ModbusBus(self.transport, self.address, priority)
+
+    def read_register(self, reg):
+        return self.read_registers(reg, 1)[0]
+
+    def read_registers(self, start, count):
+        return self.transport.transact(read_request(self.address, start, count), self.priority)
+
+    def write_register(self, reg, value):
+        """ Returns the time the write waited for the bus (s)
+        """
+        future = self.transport.submit(write_request(self.address, reg, value), PRIORITY_WRITE)
+        future.result()
+        return future.wait
+
+    def close(self):
+        # closes the port - for all drives on it
+        self.transport.close()
+
+
+def open_bus(port, rs232, slave=1, motor_version='v5', diagnostics=None):
+    """ Opens port with the drive's rs232 settings and returns the bus of the drive at address slave
+
+    The port 'simulator' connects to simulated drives of motor_version (see iHSV_Simulator).
+    """
+    if port == 'simulator':
+        from iHSV_Simulator import simulated_port
+        connection = simulated_port(motor_version)
+        connection.open()
+    else:
+        connection = serial.Serial(port)
+    try:
+        for setting in ('baudrate', 'bytesize', 'parity', 'stopbits', 'timeout'):
+            setattr(connection, setting, rs232[setting])
+    except Exception:
+        connection.close()
+        raise
+    return ModbusBus(RtuTransport(connection, diagnostics=diagnostics), slave)
@@ -0,0 +1,192 @@
+#
+# iHSV Servo Tool
+# Copyright (C) 2018 Robert Budde
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+
+import importlib
+import importlib.util
+import os
+import pickle
+import threading
+import time
+
+
+class ParameterCache:
+    """ Parameter values of the drive keyed by register address
+
+    Values are filled by reads and updated by writes, each with the time it was read or
+    written. A value is stale if it was never read, has been invalidated (e.g. a write
+    failed) or is older than max_age seconds.
+    """
+
+    def __init__(self, max_age=None):
+        self.max_age = max_age
+        # address: [value, timestamp, valid]
+        self.entries = {}
+        self.lock = threading.Lock()
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def update(self, values):
+        # dict address: value - None values (failed reads) are not cached
+        now = time.monotonic()
+        with self.lock:
+            for address, value in values.items():
+                if value is not None:
+                    self.entries[address] = [value, now, True]
+
+    def invalidate(self, addresses=None):
+        with self.lock:
+            for address in self.entries if addresses is None else addresses:
+                if address in self.entries:
+                    self.entries[address][2] = False
+
+    def get(self, address):
+        entry = self.entries.get(address)
+        return None if entry is None else entry[0]
+
+    def age(self, address):
+        entry = self.entries.get(address)
+        return None if entry is None else time.monotonic() - entry[1]
+
+    def is_stale(self, address):
+        entry = self.entries.get(address)
+        if entry is None or not entry[2]:
+            return True
+        return self.max_age is not None and time.monotonic() - entry[1] > self.max_age
+
+    def stale(self, addresses):
+        return [address for address in addresses if self.is_stale(address)]
+
+
+# bump whenever the layout of the compiled parameter database changes
+DATABASE_FORMAT = 1
+
+
+def _database_cache_path(table_path, motor_version):
+    return os.path.join(os.path.dirname(table_path), '__pycache__', 'iHSV_ParameterTable.{0}.pickle'.format(motor_version))
+
+
+def compile_parameter_database(groups):
+    """ Compiles the parameter groups of one motor version (see iHSV_ParameterTable) into an indexed store
+
+    Parameters are stored as tuples of their fields (None if a parameter lacks a field),
+    ordered by group and indexed by address, code and group.
+    """
+    fields = []
+    for pars in groups.values():
+        for par in pars.values():
+            fields.extend(field for field in par if field not in fields)
+
+    rows, codes, by_group, by_address, by_code = [], [], {}, {}, {}
+    for group, pars in groups.items():
+        first = len(rows)
+        for code, par in pars.items():
+            par = dict(par)
+            if 'decimal_place' in par:
+                try:
+                    int(par['decimal_place'])
+                except ValueError:
+                    par['decimal_place'] = "0"
+            by_address[int(par['Address'], 16)] = len(rows)
+            by_code[code] = len(rows)
+            codes.append(code)
+            rows.append(tuple(par.get(field) for field in fields))
+        by_group[group] = (first, len(rows))
+
+    return {
+        'fields': tuple(fields),
+        'rows': tuple(rows),
+        'codes': tuple(codes),
+        'by_group': by_group,
+        'by_address': by_address,
+        'by_code': by_code,
+    }
+
+
+def load_parameter_database(motor_version):
+    """ Returns the compiled parameter database of a motor version
+
+    The compiled databases are cached (pickled) in __pycache__ next to iHSV_ParameterTable and
+    only rebuilt - for all motor versions at once - if the table has changed.
+    """
+    table_path = importlib.util.find_spec('iHSV_ParameterTable').origin
+    stat = os.stat(table_path)
+    key = (DATABASE_FORMAT, stat.st_mtime_ns, stat.st_size)
+
+    try:
+        with open(_database_cache_path(table_path, motor_version), 'rb') as f:
+            cached_key, database = pickle.load(f)
+        if cached_key == key:
+            return database
+    except Exception:
+        pass
+
+    # parse the table (slow) and compile all versions
+    motor_parameter = importlib.import_module('iHSV_ParameterTable').motor_parameter
+    databases = {mv: compile_parameter_database(groups) for mv, groups in motor_parameter.items()}
+    for mv, database in databases.items():
+        path = _database_cache_path(table_path, mv)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path + '.tmp', 'wb') as f:
+                pickle.dump((key, database), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(path + '.tmp', path)
+        except OSError as e:
+            print('Failed to cache parameter database: {0}'.format(e))
+    return databases[motor_version]
+
+
+class ParameterDatabase:
+    """ Lazily loaded, indexed parameter definitions of one motor version
+
+    Lookups by address, code and group are dictionary lookups - the parameter dicts handed
+    out are built once and shared, they must not be modified.
+    """
+
+    def __init__(self, motor_version):
+        self.motor_version = motor_version
+        self._database = None
+        self._parameters = {}
+
+    @property
+    def database(self):
+        if self._database is None:
+            self._database = load_parameter_database(self.motor_version)
+        return self._database
+
+    def _parameter(self, index):
+        if index not in self._parameters:
+            row = self.database['rows'][index]
+            self._parameters[index] = {field: value for field, value in zip(self.database['fields'], row) if value is not None}
+        return self._parameters[index]
+
+    def get_groups(self):
+        return list(self.database['by_group'])
+
+    def get_group(self, group):
+        first, stop = self.database['by_group'][group]
+        return [self._parameter(index) for index in range(first, stop)]
+
+    def get_parameter(self, address):
+        index = self.database['by_address'].get(address)
+        return None if index is None else self._parameter(index)
+
+    def get_parameter_by_code(self, code):
+        index = self.database['by_code'].get(code)
+        return None if index is None else self._parameter(index)
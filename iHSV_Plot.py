@@ -0,0 +1,181 @@
+#
+# iHSV Servo Tool
+# Copyright (C) 2018 Robert Budde
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+from PyQt5.QtCore import *
+from PyQt5.QtGui import *
+from PyQt5.QtWidgets import *
+
+import numpy as np
+import pyqtgraph as pg
+
+from iHSV_Buffers import HistoryBuffer
+
+
+class ModBusDataCurveItem(pg.PlotCurveItem):
+
+    signalIsActive = pyqtSignal(pg.PlotCurveItem, name='IsActive')
+    signalAttachToAxis = pyqtSignal(pg.PlotCurveItem, name='AttachToAxis')
+    signalDivisorChanged = pyqtSignal(pg.PlotCurveItem, name='DivisorChanged')
+
+    def __init__(self, name='None', registers=[], signed=False, settings=None, history=1000, drive=''):
+        super().__init__(connect="finite", name=name)
+
+        # curves of further drives are labeled (and their settings stored) with the drive's name
+        self.drive = drive
+        self.settingsKey = drive + '/' + name if drive else name
+        self.registers = registers
+        self.signed = signed
+        self.settings = settings
+        self.buffer = HistoryBuffer(history)
+        # NaN samples (failed or late reads) - drawn as breaks in the line
+        self.gaps = 0
+        self.color = QColor(255, 255, 255)
+        self.widget = QWidget()
+        layout = QGridLayout(self.widget)
+        self.colorButton = QPushButton()
+        self.colorButton.setFixedWidth(20)
+        self.colorButton.setFixedHeight(20)
+        self.colorButton.clicked.connect(self.chooseColor)
+        self.label = QLabel(drive + ': ' + name if drive else name)
+        self.activeCheckbox = QCheckBox('Active')
+        self.activeCheckbox.toggled.connect(self.setActive)
+        self.axisCheckbox = QCheckBox('2nd Y')
+        self.axisCheckbox.toggled.connect(self.attachToAxis)
+        # sampled every n-th poll cycle - slow signals leave the bus time to the fast ones
+        self.divisorSpinbox = QSpinBox()
+        self.divisorSpinbox.setPrefix('Rate: 1/')
+        self.divisorSpinbox.setRange(1, 1000)
+        self.divisorSpinbox.setToolTip('Sample every n-th poll cycle')
+        self.divisorSpinbox.valueChanged.connect(self.setDivisor)
+        layout.addWidget(self.colorButton, 0, 0, 1, 2)
+        layout.setColumnMinimumWidth(0, 30)
+        layout.addWidget(self.label, 0, 1, 1, 2)
+        layout.setColumnMinimumWidth(1, 150)
+        layout.setColumnStretch(1, 0.5)
+        layout.addWidget(self.activeCheckbox, 0, 2)
+        layout.addWidget(self.axisCheckbox, 1, 2)
+        layout.addWidget(self.divisorSpinbox, 1, 1)
+        layout.setColumnMinimumWidth(2, 50)
+        layout.setColumnStretch(2, 0.5)
+
+        self.readSettings()
+
+    def readSettings(self):
+        try:
+            self.setColor(self.settings.value(self.settingsKey + "/Color", QColor(255,255,255)))
+            self.activeCheckbox.setChecked(self.settings.value(self.settingsKey + "/Active", False, type=bool))
+            self.axisCheckbox.setChecked(self.settings.value(self.settingsKey + "/2ndAxis", False, type=bool))
+            self.divisorSpinbox.setValue(self.settings.value(self.settingsKey + "/Divisor", 1, type=int))
+        except:
+            pass
+
+    def writeSettings(self):
+        try:
+            self.settings.setValue(self.settingsKey + "/Color", self.color)
+            self.settings.setValue(self.settingsKey + "/Active", self.activeCheckbox.isChecked())
+            self.settings.setValue(self.settingsKey + "/2ndAxis", self.axisCheckbox.isChecked())
+            self.settings.setValue(self.settingsKey + "/Divisor", self.divisorSpinbox.value())
+        except:
+            pass
+
+    def setColor(self, color):
+        if color.isValid():
+            self.color = color
+            self.colorButton.setStyleSheet("QPushButton { background-color: %s }" % (color.name()))
+            pen = pg.mkPen(self.color, width=2)
+            self.setPen(pen)
+
+    def chooseColor(self):
+        color = QColorDialog.getColor(self.color)
+        self.setColor(color)
+
+    def setActive(self):
+        self.clearData()
+        self.signalIsActive.emit(self)
+
+    def isActive(self):
+        return self.activeCheckbox.isChecked()
+
+    @property
+    def divisor(self):
+        return self.divisorSpinbox.value()
+
+    def setDivisor(self):
+        self.signalDivisorChanged.emit(self)
+
+    def setReadDivisor(self, divisor):
+        # divisor of the read plan entry - lower if the registers come along with a faster block
+        if divisor is not None and divisor < self.divisor:
+            self.divisorSpinbox.setSuffix(' (read 1/{0})'.format(divisor))
+            self.divisorSpinbox.setToolTip('Read at 1/{0} along with faster curves'.format(divisor))
+        else:
+            self.divisorSpinbox.setSuffix('')
+            self.divisorSpinbox.setToolTip('Sample every n-th poll cycle')
+
+    def attachToAxis(self):
+        self.signalAttachToAxis.emit(self)
+
+    @property
+    def On2ndAxis(self):
+        return self.axisCheckbox.isChecked()
+
+    def appendData(self, timestamps, values):
+        # decoded values - see iHSV_Modbus.BlockDecoder
+        self.buffer.extend(timestamps, values.tolist())
+        gaps = int(np.isnan(values).sum())
+        if gaps:
+            self.gaps += gaps
+            self.label.setToolTip('{0} gaps (failed or late reads)'.format(self.gaps))
+
+    def updatePlotData(self, now):
+        # samples are stored with their acquisition time, the plot shows them relative to now
+        viewBox = self.getViewBox()
+        if viewBox is not None:
+            # render the visible range only - older samples come from the min/max pyramid
+            xMin, xMax = viewBox.viewRange()[0]
+            self.setData(*self.buffer.render(xMin + now, xMax + now))
+        else:
+            self.setData(*self.buffer.render())
+        self.setPos(-now, 0)
+
+    def clearData(self):
+        self.buffer.clear()
+        self.gaps = 0
+        self.label.setToolTip('')
+        self.setData()
+
+    def setHistory(self, history):
+        self.buffer = HistoryBuffer(history)
+        self.clearData()
+
+    def getRegisters(self):
+        return self.registers
+
+
+class PlotWidget(pg.PlotWidget):
+    """ pg.PlotWidget timing its repaints into diagnostics (see iHSV_Diagnostics)
+    """
+
+    def __init__(self, diagnostics=None, **kwargs):
+        super().__init__(**kwargs)
+        self.diagnostics = diagnostics
+
+    def paintEvent(self, event):
+        if self.diagnostics is None:
+            return super().paintEvent(event)
+        with self.diagnostics.time('repaint'):
+            super().paintEvent(event)
@@ -1,5 +1,7 @@
 import serial
 
+from iHSV_Parameters import ParameterDatabase
+
 
 class iHSV:
     supported_motor_versions = {
@@ -25,9333 +27,9 @@ class iHSV:
             'timeout': 0.5
         }
     }
-    motor_parameter = {
-        'v5': {
-            'All Parameter': {
-                'P00-01': {
-                    'Description': 'Control Mode',
-                    'Address': '0x06'
-                },
-                'P00-02': {
-                    'Description': 'Control Mode Signal',
-                    'Address': '0x07'
-                },
-                'P00-03': {
-                    'Description': 'Mode 2',
-                    'Address': '0x08'
-                },
-                'P00-04': {
-                    'Description': 'Motor/Encoder: Line',
-                    'Address': '0x0A'
-                },
-                'P00-05': {
-                    'Description': 'Input offset',
-                    'Address': '0x31'
-                },
-                'P00-06': {
-                    'Description': 'Simulation command weighted coefficient',
-                    'Address': '0x32'
-                },
-                'P00-07': {
-                    'Description': 'Electronic gear: Nominator',
-                    'Address': '0x46'
-                },
-                'P00-08': {
-                    'Description': 'Electronic gear: Denominator',
-                    'Address': '0x47'
-                },
-                'P00-09': {
-                    'Description': 'Pp',
-                    'Address': '0x40'
-                },
-                'P00-10': {
-                    'Description': 'Pd',
-                    'Address': '0x41'
-                },
-                'P00-11': {
-                    'Description': 'Pff',
-                    'Address': '0x42'
-                },
-                'P00-12': {
-                    'Description': 'Pos Filter',
-                    'Address': '0x45'
-                },
-                'P00-13': {
-                    'Description': 'Pos Error',
-                    'Address': '0x48'
-                },
-                'P00-14': {
-                    'Description': 'Vp',
-                    'Address': '0x50'
-                },
-                'P00-15': {
-                    'Description': 'Vi',
-                    'Address': '0x51'
-                },
-                'P00-16': {
-                    'Description': 'Vd',
-                    'Address': '0x52'
-                },
-                'P00-17': {
-                    'Description': 'Aff',
-                    'Address': '0x53'
-                },
-                'P00-18': {
-                    'Description': 'Vel Filter',
-                    'Address': '0x54'
-                },
-                'P00-19': {
-                    'Description': 'Continuous Vel',
-                    'Address': '0x55'
-                },
-                'P00-20': {
-                    'Description': 'Vel Limit',
-                    'Address': '0x56'
-                },
-                'P00-21': {
-                    'Description': 'Acc',
-                    'Address': '0x57'
-                },
-                'P00-22': {
-                    'Description': 'Dec',
-                    'Address': '0x58'
-                },
-                'P00-23': {
-                    'Description': 'Cp',
-                    'Address': '0x60'
-                },
-                'P00-24': {
-                    'Description': 'Ci',
-                    'Address': '0x61'
-                },
-                'P00-25': {
-                    'Description': 'Continuous Current',
-                    'Address': '0x62'
-                },
-                'P00-26': {
-                    'Description': 'Limit Current',
-                    'Address': '0x63'
-                },
-                'P00-27': {
-                    'Description': 'Temp Limit',
-                    'Address': '0x3A'
-                },
-                'P00-28': {
-                    'Description': 'Over Voltage Limit',
-                    'Address': '0x3B'
-                },
-                'P00-29': {
-                    'Description': 'Under Voltage Limit',
-                    'Address': '0x3C'
-                },
-                'P00-30': {
-                    'Description': 'I2T Limit',
-                    'Address': '0x3D'
-                },
-
-            }
-        },
-        'v6': {
-            "P00_Parameter_of_motor_and_driver": {
-                "P00-00": {
-                    "Code": "P00-00",
-                    "Name": "Motor code",
-                    "set": "7",
-                    "set_range": "0-65535",
-                    "Default": "2000",
-                    "Unit": "",
-                    "Set_method": "downtime setting",
-                    "ChangeCondition": "Re power",
-                    "Address": "0x0000",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "The factory has been set up , no need to set up again.\n0:P0-01 to P0-17 make sense\n\n2000: absolute value encoder motor, P0-01- to P0-05 automatically identify by driver.",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "1",
-                    "shutdown_set": "True",
-                    "Keep": "false"
-                },
-                "P00-01": {
-                    "Code": "P00-01",
-                    "Name": "Rated speed of motor",
-                    "set": "3000",
-                    "set_range": "1-6000",
-                    "Default": "0",
-                    "Unit": "rpm",
-                    "Set_method": "downtime setting",
-                    "ChangeCondition": "Re power",
-                    "Address": "0x0001",
-                    "Min": "1",
-                    "Max": "6000",
-                    "Description": "Set range: 1-6000, unit: RPM\n\nThe factory has been set up no need set up again",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "1",
-                    "shutdown_set": "True",
-                    "Keep": "false"
-                },
-                "P00-02": {
-                    "Code": "P00-02",
-                    "Name": "Rated torque of motor",
-                    "set": "0",
-                    "set_range": "0.01-655.35",
-                    "Default": "0",
-                    "Unit": "N.M",
-                    "Set_method": "downtime setting",
-                    "ChangeCondition": "Re power",
-                    "Address": "0x0002",
-                    "Min": "0.01",
-                    "Max": "655.35",
-                    "Description": "Setting range: 0.01-655.35, unit: N.M\n\nAccording to the motor settings, the factory setting has done",
-                    "Symbol": "FALSE",
-                    "decimal_place": "2",
-                    "authority": "10",
-                    "shutdown_set": "True",
-                    "Keep": "false"
-                },
-                "P00-03": {
-                    "Code": "P00-03",
-                    "Name": "Rated current of motor",
-                    "set": "6",
-                    "set_range": "0.01-655.35",
-                    "Default": "0",
-                    "Unit": "A",
-                    "Set_method": "downtime setting",
-                    "ChangeCondition": "Re power",
-                    "Address": "0x0003",
-                    "Min": "0.01",
-                    "Max": "655.35",
-                    "Description": "Setting range: 0.01-655.35, unit: N.M\n\nAccording to the motor settings, the factory setting has done",
-                    "Symbol": "FALSE",
-                    "decimal_place": "2",
-                    "authority": "1",
-                    "shutdown_set": "True",
-                    "Keep": "false"
-                },
-                "P00-04": {
-                    "Code": "P00-04",
-                    "Name": "Motor moment of inertia",
-                    "set": "0,03",
-                    "set_range": "0.01-655.35",
-                    "Default": "0",
-                    "Unit": "kg.cm²",
-                    "Set_method": "downtime setting",
-                    "ChangeCondition": "Re power",
-                    "Address": "0x0004",
-                    "Min": "0.01",
-                    "Max": "655.35",
-                    "Description": "Setting range: 0.01-655.35, unit:kg.cm²\n\nAccording to the motor settings, the factory setting has done",
-                    "Symbol": "FALSE",
-                    "decimal_place": "2",
-                    "authority": "1",
-                    "shutdown_set": "True",
-                    "Keep": "false"
-                },
-                "P00-05": {
-                    "Code": "P00-05",
-                    "Name": "Pole number of motor",
-                    "set": "4",
-                    "set_range": "1-31",
-                    "Default": "0",
-                    "Unit": "Opposite pole",
-                    "Set_method": "downtime setting",
-                    "ChangeCondition": "Re power",
-                    "Address": "0x0005",
-                    "Min": "1",
-                    "Max": "31",
-                    "Description": "Set range: 1-31, unit: opposite pole\nAccording to the motor settings, the factory setting has done",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "1",
-                    "shutdown_set": "True",
-                    "Keep": "false"
-                },
-                "P00-06": {
-                    "Code": "P00-06",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_method": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0006",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "1",
-                    "shutdown_set": "",
-                    "Keep": "true"
-                },
-                "P00-07": {
-                    "Code": "P00-07",
-                    "Name": "Encoder selection",
-                    "set": "0",
-                    "set_range": "0-3",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_method": "downtime setting",
-                    "ChangeCondition": "Re power",
-                    "Address": "0x0007",
-                    "Min": "0",
-                    "Max": "3",
-                    "Description": "Set range: 0-3\n\n0, 1: incremental encoder;\n\n2: single loop absolute encoder;\n\n3: multi circle absolute encoder",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "1",
-                    "shutdown_set": "True",
-                    "Keep": "true"
-                },
-                "P00-08": {
-                    "Code": "P00-08",
-                    "Name": "Provincial line incremental encoder",
-                    "set": "0",
-                    "set_range": "0-1",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_method": "downtime setting",
-                    "ChangeCondition": "Re power",
-                    "Address": "0x0008",
-                    "Min": "0",
-                    "Max": "1",
-                    "Description": "Set range: 0-1\n\n0: non provincial line type\n\n1: provincial line type",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "1",
-                    "shutdown_set": "True",
-                    "Keep": "true"
-                },
-                "P00-09": {
-                    "Code": "P00-09",
-                    "Name": "Absolute encoder type",
-                    "set": "0",
-                    "set_range": "0-1",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_method": "downtime setting",
-                    "ChangeCondition": "Re power",
-                    "Address": "0x0009",
-                    "Min": "0",
-                    "Max": "1",
-                    "Description": "Set range: 0-1\n\n0: Tama Chuan encoder;\n\n1: Nikon encoder",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "1",
-                    "shutdown_set": "True",
-                    "Keep": "true"
-                },
-                "P00-10": {
-                    "Code": "P00-10",
-                    "Name": "Incremental encoder number",
-                    "set": "1000",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "",
-                    "Set_method": "downtime setting",
-                    "ChangeCondition": "Re power",
-                    "Address": "0x000A",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "根据所配电机设置，出厂已设好 According to the matched motor settings, factroy setting has done",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "1",
-                    "shutdown_set": "True",
-                    "Keep": "false"
-                },
-                "P00-11": {
-                    "Code": "P00-11",
-                    "Name": "Incremental encoder Z pulse electric angle",
-                    "set": "300",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "",
-                    "Set_method": "downtime setting",
-                    "ChangeCondition": "Re power",
-                    "Address": "0x000B",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "根据所配电机设置，出厂已设好 According to the matched motor settings, factroy setting has done",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "1",
-                    "shutdown_set": "True",
-                    "Keep": "false"
-                },
-                "P00-12": {
-                    "Code": "P00-12",
-                    "Name": "Initial angle of rotor 1",
-                    "set": "150",
-                    "set_range": "0-360",
-                    "Default": "0",
-                    "Unit": "1°",
-                    "Set_method": "downtime setting",
-                    "ChangeCondition": "Re power",
-                    "Address": "0x000C",
-                    "Min": "0",
-                    "Max": "360",
-                    "Description": "根据所配电机设置，出厂已设好 According to the matched motor settings, factroy setting has done",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "1",
-                    "shutdown_set": "True",
-                    "Keep": "false"
-                },
-                "P00-13": {
-                    "Code": "P00-13",
-                    "Name": "Initial angle of rotor 2",
-                    "set": "270",
-                    "set_range": "0-360",
-                    "Default": "0",
-                    "Unit": "1°",
-                    "Set_method": "downtime setting",
-                    "ChangeCondition": "Re power",
-                    "Address": "0x000D",
-                    "Min": "0",
-                    "Max": "360",
-                    "Description": "根据所配电机设置，出厂已设好 According to the matched motor settings, factroy setting has done",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "1",
-                    "shutdown_set": "True",
-                    "Keep": "false"
-                },
-                "P00-14": {
-                    "Code": "P00-14",
-                    "Name": "Initial angle of rotor 3",
-                    "set": "210",
-                    "set_range": "0-360",
-                    "Default": "0",
-                    "Unit": "1°",
-                    "Set_method": "downtime setting",
-                    "ChangeCondition": "Re power",
-                    "Address": "0x000E",
-                    "Min": "0",
-                    "Max": "360",
-                    "Description": "根据所配电机设置，出厂已设好 According to the matched motor settings, factroy setting has done",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "1",
-                    "shutdown_set": "True",
-                    "Keep": "false"
-                },
-                "P00-15": {
-                    "Code": "P00-15",
-                    "Name": "Initial angle of rotor 4",
-                    "set": "30",
-                    "set_range": "0-360",
-                    "Default": "0",
-                    "Unit": "1°",
-                    "Set_method": "downtime setting",
-                    "ChangeCondition": "Re power",
-                    "Address": "0x000F",
-                    "Min": "0",
-                    "Max": "360",
-                    "Description": "根据所配电机设置，出厂已设好 According to the matched motor settings, factroy setting has done",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "1",
-                    "shutdown_set": "True",
-                    "Keep": "false"
-                },
-                "P00-16": {
-                    "Code": "P00-16",
-                    "Name": "Initial angle of rotor 5",
-                    "set": "90",
-                    "set_range": "0-360",
-                    "Default": "0",
-                    "Unit": "1°",
-                    "Set_method": "downtime setting",
-                    "ChangeCondition": "Re power",
-                    "Address": "0x0010",
-                    "Min": "0",
-                    "Max": "360",
-                    "Description": "根据所配电机设置，出厂已设好 According to the matched motor settings, factroy setting has done",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "1",
-                    "shutdown_set": "True",
-                    "Keep": "false"
-                },
-                "P00-17": {
-                    "Code": "P00-17",
-                    "Name": "Initial angle of rotor 6",
-                    "set": "330",
-                    "set_range": "0-360",
-                    "Default": "0",
-                    "Unit": "1°",
-                    "Set_method": "downtime setting",
-                    "ChangeCondition": "Re power",
-                    "Address": "0x0011",
-                    "Min": "0",
-                    "Max": "360",
-                    "Description": "根据所配电机设置，出厂已设好 According to the matched motor settings, factroy setting has done",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "1",
-                    "shutdown_set": "True",
-                    "Keep": "false"
-                },
-                "P00-18": {
-                    "Code": "P00-18",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_method": "downtime setting",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0012",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "0",
-                    "shutdown_set": "",
-                    "Keep": "true"
-                },
-                "P00-19": {
-                    "Code": "P00-19",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_method": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0013",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "0",
-                    "shutdown_set": "",
-                    "Keep": "true"
-                },
-                "P00-20": {
-                    "Code": "P00-20",
-                    "Name": "Power on interface display settings",
-                    "set": "100",
-                    "set_range": "0-100",
-                    "Default": "100",
-                    "Unit": "---",
-                    "Set_method": "operate setting",
-                    "ChangeCondition": "Re power",
-                    "Address": "0x0014",
-                    "Min": "0",
-                    "Max": "100",
-                    "Description": "Set range: 0-100, default 100\n\nAccording to customer display requirement setting\n\nWhen setting 100, the driver displays the running state when power is on.\n\nOther parameter settings correspond to the serial number of the monitoring items list (the 8.3 cha",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "0",
-                    "shutdown_set": "False",
-                    "Keep": "true"
-                },
-                "P00-21": {
-                    "Code": "P00-21",
-                    "Name": "RS232 communication baud rate",
-                    "set": "2",
-                    "set_range": "0-3",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_method": "downtime setting",
-                    "ChangeCondition": "Re power",
-                    "Address": "0x0015",
-                    "Min": "0",
-                    "Max": "3",
-                    "Description": "Set range: 0-3\n\nBaud rate when selecting communication with PC\n\n0:9600\n\n1:19200\n\n2:57600\n\n3:115200",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "0",
-                    "shutdown_set": "True",
-                    "Keep": "false"
-                },
-                "P00-22": {
-                    "Code": "P00-22",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_method": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0016",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "0",
-                    "shutdown_set": "",
-                    "Keep": "true"
-                },
-                "P00-23": {
-                    "Code": "P00-23",
-                    "Name": "slave address",
-                    "set": "1",
-                    "set_range": "0-255",
-                    "Default": "1",
-                    "Unit": "--",
-                    "Set_method": "downtime setting",
-                    "ChangeCondition": "Re power",
-                    "Address": "0x0017",
-                    "Min": "0",
-                    "Max": "255",
-                    "Description": "Set range: 0-255, default 1\n\nSet up according to equipment requirement",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "0",
-                    "shutdown_set": "True",
-                    "Keep": "false"
-                },
-                "P00-24": {
-                    "Code": "P00-24",
-                    "Name": "Modbus communication baud rate",
-                    "set": "7",
-                    "set_range": "0-7",
-                    "Default": "2",
-                    "Unit": "---",
-                    "Set_method": "downtime setting",
-                    "ChangeCondition": "Re power",
-                    "Address": "0x0018",
-                    "Min": "0",
-                    "Max": "7",
-                    "Description": "Set range：0-7，default 2\n0:2400\n1:4800\n2:9600\n3:19200\n4:38400\n5:57600\n6:115200\n7:25600",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "0",
-                    "shutdown_set": "True",
-                    "Keep": "false"
-                },
-                "P00-25": {
-                    "Code": "P00-25",
-                    "Name": "Check mode",
-                    "set": "1",
-                    "set_range": "0-3",
-                    "Default": "1",
-                    "Unit": "---",
-                    "Set_method": "downtime setting",
-                    "ChangeCondition": "Re power",
-                    "Address": "0x0019",
-                    "Min": "0",
-                    "Max": "3",
-                    "Description": "0: no check, 2 bit stop bit.\n\n1: parity check, 1 bit stop bit.\n\n2: odd check, 1 bit stop bit.\n\n3: no check, 1 bit stop bit.",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "0",
-                    "shutdown_set": "True",
-                    "Keep": "false"
-                },
-                "P00-26": {
-                    "Code": "P00-26",
-                    "Name": "Modbus Communication response delay",
-                    "set": "0",
-                    "set_range": "0-100",
-                    "Default": "0",
-                    "Unit": "1ms",
-                    "Set_method": "operate setting",
-                    "ChangeCondition": "Re power",
-                    "Address": "0x001A",
-                    "Min": "0",
-                    "Max": "100",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "0",
-                    "shutdown_set": "True",
-                    "Keep": "false"
-                },
-                "P00-27": {
-                    "Code": "P00-27",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_method": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x001B",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "0",
-                    "shutdown_set": "True",
-                    "Keep": "true"
-                },
-                "P00-28": {
-                    "Code": "P00-28",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_method": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x001C",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "0",
-                    "shutdown_set": "True",
-                    "Keep": "true"
-                },
-                "P00-29": {
-                    "Code": "P00-29",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_method": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x001D",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "0",
-                    "shutdown_set": "True",
-                    "Keep": "true"
-                },
-                "P00-30": {
-                    "Code": "P00-30",
-                    "Name": "Brake resistor setting",
-                    "set": "0",
-                    "set_range": "0-2",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_method": "downtime setting",
-                    "ChangeCondition": "Re power",
-                    "Address": "0x001E",
-                    "Min": "0",
-                    "Max": "2",
-                    "Description": "Set range: 0-2\n\n0: using internal resistance\n\n1: using external resistors\n\n2: do not use brake resistor",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "0",
-                    "shutdown_set": "True",
-                    "Keep": "true"
-                },
-                "P00-31": {
-                    "Code": "P00-31",
-                    "Name": "External braking resistor power",
-                    "set": "0",
-                    "set_range": "0-65536",
-                    "Default": "0",
-                    "Unit": "10W",
-                    "Set_method": "operate setting",
-                    "ChangeCondition": "Re power",
-                    "Address": "0x001F",
-                    "Min": "0",
-                    "Max": "65536",
-                    "Description": "Set range: 0-65535, unit 10W\n\nDo the correct setting according to the  external braking resistor, if the setting value is 4, the resistance power is 40W",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "0",
-                    "shutdown_set": "False",
-                    "Keep": "true"
-                },
-                "P00-32": {
-                    "Code": "P00-32",
-                    "Name": "External brake resistor value",
-                    "set": "0",
-                    "set_range": "0-1000",
-                    "Default": "0",
-                    "Unit": "1ohm",
-                    "Set_method": "downtime setting",
-                    "ChangeCondition": "Re power",
-                    "Address": "0x0020",
-                    "Min": "0",
-                    "Max": "1000",
-                    "Description": "Set range: 0-1000, ohm.\n\nSet correctly according to the external brake resistor.",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "0",
-                    "shutdown_set": "True",
-                    "Keep": "true"
-                },
-                "P00-33": {
-                    "Code": "P00-33",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_method": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0021",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "0",
-                    "shutdown_set": "True",
-                    "Keep": "true"
-                },
-                "P00-34": {
-                    "Code": "P00-34",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_method": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x0022",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "0",
-                    "shutdown_set": "True",
-                    "Keep": "true"
-                },
-                "P00-35": {
-                    "Code": "P00-35",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_method": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0023",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "0",
-                    "shutdown_set": "True",
-                    "Keep": "true"
-                },
-                "P00-36": {
-                    "Code": "P00-36",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_method": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0024",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "0",
-                    "shutdown_set": "True",
-                    "Keep": "true"
-                },
-                "P00-37": {
-                    "Code": "P00-37",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_method": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0025",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "0",
-                    "shutdown_set": "True",
-                    "Keep": "true"
-                },
-                "P00-38": {
-                    "Code": "P00-38",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_method": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x0026",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "0",
-                    "shutdown_set": "True",
-                    "Keep": "true"
-                },
-                "P00-39": {
-                    "Code": "P00-39",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_method": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0027",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "0",
-                    "shutdown_set": "True",
-                    "Keep": "true"
-                },
-                "P00-40": {
-                    "Code": "P00-40",
-                    "Name": "Over temperature protection settings",
-                    "set": "0",
-                    "set_range": "0-1",
-                    "Default": "1",
-                    "Unit": "1ohm",
-                    "Set_method": "downtime setting",
-                    "ChangeCondition": "Re power",
-                    "Address": "0x0028",
-                    "Min": "0",
-                    "Max": "1",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "0",
-                    "shutdown_set": "True",
-                    "Keep": "true"
-                },
-                "P00-41": {
-                    "Code": "P00-41",
-                    "Name": "Control power failure protection settings",
-                    "set": "1",
-                    "set_range": "0-1",
-                    "Default": "1",
-                    "Unit": "---",
-                    "Set_method": "downtime setting",
-                    "ChangeCondition": "Re power",
-                    "Address": "0x0029",
-                    "Min": "0",
-                    "Max": "1",
-                    "Description": "Set range: 0-1\n\n0: turn off the power failure protection function of the control power supply.\n\n1: turn on the power failure protection function of the control power supply.",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "1",
-                    "shutdown_set": "True",
-                    "Keep": "true"
-                },
-                "P00-42": {
-                    "Code": "P00-42",
-                    "Name": "keep",
-                    "set": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "Set_method": "",
-                    "ChangeCondition": "",
-                    "Address": "0x002A",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "10",
-                    "shutdown_set": "False",
-                    "Keep": "false"
-                },
-                "P00-43": {
-                    "Code": "P00-43",
-                    "Name": "keep",
-                    "set": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "Set_method": "",
-                    "ChangeCondition": "",
-                    "Address": "0x002B",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "10",
-                    "shutdown_set": "False",
-                    "Keep": "true"
-                },
-                "P00-44": {
-                    "Code": "P00-44",
-                    "Name": "keep",
-                    "set": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "Set_method": "",
-                    "ChangeCondition": "",
-                    "Address": "0x002C",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "10",
-                    "shutdown_set": "False",
-                    "Keep": "true"
-                },
-                "P00-45": {
-                    "Code": "P00-45",
-                    "Name": "keep",
-                    "set": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "Set_method": "",
-                    "ChangeCondition": "",
-                    "Address": "0x002D",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "10",
-                    "shutdown_set": "False",
-                    "Keep": "true"
-                },
-                "P00-46": {
-                    "Code": "P00-46",
-                    "Name": "keep",
-                    "set": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "Set_method": "",
-                    "ChangeCondition": "",
-                    "Address": "0x002E",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "10",
-                    "shutdown_set": "False",
-                    "Keep": "true"
-                },
-                "P00-47": {
-                    "Code": "P00-47",
-                    "Name": "keep",
-                    "set": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "Set_method": "",
-                    "ChangeCondition": "",
-                    "Address": "0x002F",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "10",
-                    "shutdown_set": "False",
-                    "Keep": "true"
-                },
-                "P00-48": {
-                    "Code": "P00-48",
-                    "Name": "keep",
-                    "set": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "Set_method": "",
-                    "ChangeCondition": "",
-                    "Address": "0x0030",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "10",
-                    "shutdown_set": "False",
-                    "Keep": "true"
-                },
-                "P00-49": {
-                    "Code": "P00-49",
-                    "Name": "keep",
-                    "set": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "Set_method": "",
-                    "ChangeCondition": "",
-                    "Address": "0x0031",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "10",
-                    "shutdown_set": "False",
-                    "Keep": "true"
-                },
-                "P00-50": {
-                    "Code": "P00-50",
-                    "Name": "Dead time compensation enable",
-                    "set": "0",
-                    "set_range": "0-1",
-                    "Default": "1",
-                    "Unit": "---",
-                    "Set_method": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x0032",
-                    "Min": "0",
-                    "Max": "1",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "10",
-                    "shutdown_set": "True",
-                    "Keep": "false"
-                },
-                "P00-51": {
-                    "Code": "P00-51",
-                    "Name": "Main power turn off monitoring enable",
-                    "set": "0",
-                    "set_range": "0-1",
-                    "Default": "1",
-                    "Unit": "---",
-                    "Set_method": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x0033",
-                    "Min": "0",
-                    "Max": "1",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "10",
-                    "shutdown_set": "False",
-                    "Keep": "false"
-                },
-                "P00-52": {
-                    "Code": "P00-52",
-                    "Name": "Undervoltage alarm enable",
-                    "set": "0",
-                    "set_range": "0-1",
-                    "Default": "1",
-                    "Unit": "---",
-                    "Set_method": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x0034",
-                    "Min": "0",
-                    "Max": "1",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "10",
-                    "shutdown_set": "False",
-                    "Keep": "false"
-                },
-                "P00-53": {
-                    "Code": "P00-53",
-                    "Name": "Lack of phase protection enable energy",
-                    "set": "0",
-                    "set_range": "0-1",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_method": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x0035",
-                    "Min": "0",
-                    "Max": "1",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "10",
-                    "shutdown_set": "False",
-                    "Keep": "false"
-                },
-                "P00-54": {
-                    "Code": "P00-54",
-                    "Name": "DC bus voltage compensation enable",
-                    "set": "0",
-                    "set_range": "0-1",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_method": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x0036",
-                    "Min": "0",
-                    "Max": "1",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "10",
-                    "shutdown_set": "False",
-                    "Keep": "false"
-                },
-                "P00-55": {
-                    "Code": "P00-55",
-                    "Name": "DC bus voltage compensation coefficient",
-                    "set": "0",
-                    "set_range": "0-32767",
-                    "Default": "17300",
-                    "Unit": "---",
-                    "Set_method": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x0037",
-                    "Min": "0",
-                    "Max": "32767",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "10",
-                    "shutdown_set": "False",
-                    "Keep": "false"
-                },
-                "P00-56": {
-                    "Code": "P00-56",
-                    "Name": "Keep",
-                    "set": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "Set_method": "",
-                    "ChangeCondition": "",
-                    "Address": "0x0038",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "10",
-                    "shutdown_set": "False",
-                    "Keep": "true"
-                },
-                "P00-57": {
-                    "Code": "P00-57",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-1",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_method": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x0039",
-                    "Min": "0",
-                    "Max": "1",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "10",
-                    "shutdown_set": "False",
-                    "Keep": "true"
-                },
-                "P00-58": {
-                    "Code": "P00-58",
-                    "Name": "Keep",
-                    "set": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "Set_method": "",
-                    "ChangeCondition": "",
-                    "Address": "0x003A",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "10",
-                    "shutdown_set": "False",
-                    "Keep": "true"
-                },
-                "P00-59": {
-                    "Code": "P00-59",
-                    "Name": "Loading mode",
-                    "set": "",
-                    "set_range": "0-1",
-                    "Default": "1",
-                    "Unit": "",
-                    "Set_method": "",
-                    "ChangeCondition": "",
-                    "Address": "0x003B",
-                    "Min": "0",
-                    "Max": "1",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "10",
-                    "shutdown_set": "True",
-                    "Keep": "false"
-                },
-                "P00-60": {
-                    "Code": "P00-60",
-                    "Name": "PWM cycle",
-                    "set": "0",
-                    "set_range": "1-8092",
-                    "Default": "4999",
-                    "Unit": "---",
-                    "Set_method": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x003C",
-                    "Min": "1",
-                    "Max": "8092",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "10",
-                    "shutdown_set": "True",
-                    "Keep": "false"
-                },
-                "P00-61": {
-                    "Code": "P00-61",
-                    "Name": "PWM loading mode",
-                    "set": "0",
-                    "set_range": "0-1",
-                    "Default": "1",
-                    "Unit": "---",
-                    "Set_method": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x003D",
-                    "Min": "0",
-                    "Max": "1",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "10",
-                    "shutdown_set": "True",
-                    "Keep": "false"
-                },
-                "P00-62": {
-                    "Code": "P00-62",
-                    "Name": "Speed loop sampling frequency",
-                    "set": "0",
-                    "set_range": "1-8",
-                    "Default": "2",
-                    "Unit": "---",
-                    "Set_method": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x003E",
-                    "Min": "1",
-                    "Max": "8",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "10",
-                    "shutdown_set": "True",
-                    "Keep": "false"
-                },
-                "P00-63": {
-                    "Code": "P00-63",
-                    "Name": "Sampling frequency of position loop",
-                    "set": "0",
-                    "set_range": "1-8",
-                    "Default": "4",
-                    "Unit": "---",
-                    "Set_method": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x003F",
-                    "Min": "1",
-                    "Max": "8",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "authority": "10",
-                    "shutdown_set": "True",
-                    "Keep": "false"
-                }
-            },
-            "P01_main_control_parameter": {
-                "P01-00": {
-                    "Code": "P01-00",
-                    "Name": "Keep",
-                    "Setting": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_Method": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x0064",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P01-01": {
-                    "Code": "P01-01",
-                    "Name": "Control mode setting",
-                    "Setting": "0",
-                    "set_range": "0-6",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_Method": "Shutdown setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0065",
-                    "Min": "0",
-                    "Max": "6",
-                    "Description": "Set range: 0-6\n\n0: position control mode\n\n1: speed control mode\n\n2: torque control mode\n\n3: speed and torque control mode. You need to use an external input port in CN1 for switching, and set the selected DI port input port function selection to 5 (control mode switching). Controlling the logical state of the port can switch the control mode.\n\nTerminal effective speed mode\n\nTerminal invalid torque mode\n\n\n\n4: position and speed control mode. You need to use an external input port in CN1 for switching, and set the selected DI port input port function selection to 5 (control mode switching). Controlling the logical state of the port can switch the control mode.\n\nTerminal effective position mode\n\nTerminal invalid speed mode\n\n\n\n5: position and torque control mode. You need to use an external input port in CN1 for switching, and set the selected DI port input port function selection to 5 (control mode switching). Controlling the logical state of the port can switch the control mode.\n\nTerminal effective position mode\n\nTerminal invalid torque mode\n\n\n\n6: full closed loop",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "True",
-                    "Keep": "false"
-                },
-                "P01-02": {
-                    "Code": "P01-02",
-                    "Name": "Real time automatic adjustment mode",
-                    "Setting": "1",
-                    "set_range": "0-3",
-                    "Default": "1",
-                    "Unit": "---",
-                    "Set_Method": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0066",
-                    "Min": "0",
-                    "Max": "3",
-                    "Description": "Set range: 0-2\n\n0: manually adjust rigidity.\n\n1: standard mode automatically adjusts rigidity. In this mode, the parameters P02-00, P02-01, P02-10, P02-11, P02-13, P02-14, P08-20 will be set automatically according to the rigidity level set by P01-03, and manual adjustment of these parameters will not work. The following parameters are set by the user:\n\nP02-03 (speed feed forward gain), P02-04 (speed feed forward smoothing constant).\n\n2: positioning mode automatically adjusts rigidity. In this mode, the parameters P02-00, P02-01, P02-10, P02-11, P02-13, P02-14, P08-20 will be set automatically according to the rigidity level set by P01-03, and manual adjustment of these parameters will not work. The following parameters will be fixed values and cannot be changed.\n\nP02-03 (speed feed forward gain): 30%\n\nP02-04 (speed feed forward smoothing constant): 0.50\n\n3: Automatically adjust the rigidity 2, in this mode, the parameters P02-00, P02-01, P02-10, P02-11, P02-13, will be set automatically according to the rigidity level set by P01-03, P08-20 will be set automatically according to the load inertia set by P01-04, P02-14 set value is 100, manual adjustment of these parameters will not work. The following parameters are set by the user:\n\nP02-03 (speed feed forward gain), P02-04 (speed feed forward smoothing constant).",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "false",
-                    "Keep": "false"
-                },
-                "P01-03": {
-                    "Code": "P01-03",
-                    "Name": "Real time automatic adjustment of rigidity setting",
-                    "Setting": "13",
-                    "set_range": "0-31",
-                    "Default": "13",
-                    "Unit": "---",
-                    "Set_Method": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0067",
-                    "Min": "0",
-                    "Max": "31",
-                    "Description": "Set range: 0-31\n\nBuilt in 32 gain parameters, when P01-02 is set to 1, or 2 time to play a role. It can be called directly according to the actual situation. The greater the setting value, the stronger the rigidity.",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "false",
-                    "Keep": "false"
-                },
-                "P01-04": {
-                    "Code": "P01-04",
-                    "Name": "Moment of inertia ratio",
-                    "Setting": "1",
-                    "set_range": "0-100.00",
-                    "Default": "3",
-                    "Unit": "1 times",
-                    "Set_Method": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0068",
-                    "Min": "0",
-                    "Max": "100.00",
-                    "Description": "Set range: 0-100, unit: times.\n\nSetting the load inertia ratio of the corresponding motor, the setting method is as follows:\n\nP01-04= load inertia / motor moment of inertia\n\nThis inertia ratio can be used to write the parameters after the AF-J-L inertia value is recognized.",
-                    "Symbol": "FALSE",
-                    "decimal_place": "2",
-                    "Permission": "0",
-                    "shutdown_setting": "false",
-                    "Keep": "false"
-                },
-                "P01-05": {
-                    "Code": "P01-05",
-                    "Name": "Keep",
-                    "Setting": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_Method": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0069",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "True",
-                    "Keep": "true"
-                },
-                "P01-06": {
-                    "Code": "P01-06",
-                    "Name": "Keep",
-                    "Setting": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_Method": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x006A",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "True",
-                    "Keep": "true"
-                },
-                "P01-07": {
-                    "Code": "P01-07",
-                    "Name": "Keep",
-                    "Setting": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_Method": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x006B",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "True",
-                    "Keep": "true"
-                },
-                "P01-08": {
-                    "Code": "P01-08",
-                    "Name": "Keep",
-                    "Setting": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_Method": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x006C",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "True",
-                    "Keep": "true"
-                },
-                "P01-09": {
-                    "Code": "P01-09",
-                    "Name": "Keep",
-                    "Setting": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_Method": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x006D",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "True",
-                    "Keep": "true"
-                },
-                "P01-10": {
-                    "Code": "P01-10",
-                    "Name": "Control mode after overshoot",
-                    "Setting": "1",
-                    "set_range": "0-1",
-                    "Default": "1",
-                    "Unit": "---",
-                    "Set_Method": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x006E",
-                    "Min": "0",
-                    "Max": "1",
-                    "Description": "Set range: 0-1\n\n0: after the overpass, the motor is in free state, and only receives the reverse direction signal.\n\n1: after the overpass, the motor is in the locked state, and only receives the reverse direction signal.",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P01-11": {
-                    "Code": "P01-11",
-                    "Name": "Keep",
-                    "Setting": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_Method": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x006F",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P01-12": {
-                    "Code": "P01-12",
-                    "Name": "Keep",
-                    "Setting": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_Method": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0070",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P01-13": {
-                    "Code": "P01-13",
-                    "Name": "Keep",
-                    "Setting": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_Method": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0071",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P01-14": {
-                    "Code": "P01-14",
-                    "Name": "Keep",
-                    "Setting": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_Method": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0072",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P01-15": {
-                    "Code": "P01-15",
-                    "Name": "Keep",
-                    "Setting": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_Method": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0073",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P01-16": {
-                    "Code": "P01-16",
-                    "Name": "Keep",
-                    "Setting": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_Method": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0074",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P01-17": {
-                    "Code": "P01-17",
-                    "Name": "Keep",
-                    "Setting": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_Method": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0075",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P01-18": {
-                    "Code": "P01-18",
-                    "Name": "Keep",
-                    "Setting": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_Method": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0076",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P01-19": {
-                    "Code": "P01-19",
-                    "Name": "Keep",
-                    "Setting": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_Method": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0077",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P01-20": {
-                    "Code": "P01-20",
-                    "Name": "Dynamic brake delay",
-                    "Setting": "50",
-                    "set_range": "0-250",
-                    "Default": "50",
-                    "Unit": "1times",
-                    "Set_Method": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0078",
-                    "Min": "0",
-                    "Max": "250",
-                    "Description": "Set range: 0-150, unit: ms\n\nAction delay time of dynamic brake is satisfied when braking condition is met.",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P01-21": {
-                    "Code": "P01-21",
-                    "Name": "No dynamic brake when main power is turned off.",
-                    "Setting": "1",
-                    "set_range": "0-1",
-                    "Default": "1",
-                    "Unit": "---",
-                    "Set_Method": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0079",
-                    "Min": "0",
-                    "Max": "1",
-                    "Description": "Set range: 0-1\n\n0: using dynamic braking\n\n1: turn off dynamic braking.",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P01-22": {
-                    "Code": "P01-22",
-                    "Name": "No dynamic brake when servo OFF is used",
-                    "Setting": "1",
-                    "set_range": "0-1",
-                    "Default": "1",
-                    "Unit": "---",
-                    "Set_Method": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x007A",
-                    "Min": "0",
-                    "Max": "1",
-                    "Description": "Set range: 0-1\n\n0: using dynamic braking\n\n1: turn off dynamic braking.",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P01-23": {
-                    "Code": "P01-23",
-                    "Name": "No dynamic brake when alarming.",
-                    "Setting": "1",
-                    "set_range": "0-1",
-                    "Default": "1",
-                    "Unit": "---",
-                    "Set_Method": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x007B",
-                    "Min": "0",
-                    "Max": "1",
-                    "Description": "Set range: 0-1\n\n0: using dynamic braking\n\n1: turn off dynamic braking.",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P01-24": {
-                    "Code": "P01-24",
-                    "Name": "No dynamic brake when override.",
-                    "Setting": "1",
-                    "set_range": "0-1",
-                    "Default": "1",
-                    "Unit": "---",
-                    "Set_Method": "",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x007C",
-                    "Min": "0",
-                    "Max": "1",
-                    "Description": "Set range: 0-1\n\n0: using dynamic braking\n\n1: turn off dynamic braking.",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P01-25": {
-                    "Code": "P01-25",
-                    "Name": "Keep",
-                    "Setting": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_Method": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x007D",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P01-26": {
-                    "Code": "P01-26",
-                    "Name": "Keep",
-                    "Setting": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_Method": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x007E",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P01-27": {
-                    "Code": "P01-27",
-                    "Name": "Keep",
-                    "Setting": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_Method": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x007F",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P01-28": {
-                    "Code": "P01-28",
-                    "Name": "Keep",
-                    "Setting": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_Method": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0080",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P01-29": {
-                    "Code": "P01-29",
-                    "Name": "Keep",
-                    "Setting": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_Method": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0081",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P01-30": {
-                    "Code": "P01-30",
-                    "Name": "clasp Brake command - servo OFF delay time (clasp brake opening delay)",
-                    "Setting": "100",
-                    "set_range": "0-255",
-                    "Default": "50",
-                    "Unit": "1ms",
-                    "Set_Method": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0082",
-                    "Min": "0",
-                    "Max": "255",
-                    "Description": "Set range: 0-255, unit: ms\n\nWhen enabled: After executing enabled instructions, after the P01-30 time, the driver will receive the position instructions.\n\nWhen the motor is in a static state, the time from the lock to the non-energized state after the switch-off command is executed.",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "false",
-                    "Keep": "false"
-                },
-                "P01-31": {
-                    "Code": "P01-31",
-                    "Name": "Speed limit value of clasp brake command output",
-                    "Setting": "100",
-                    "set_range": "0-3000",
-                    "Default": "100",
-                    "Unit": "1rpm",
-                    "Set_Method": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0083",
-                    "Min": "0",
-                    "Max": "3000",
-                    "Description": "Set range: 0-3000, unit: RPM\n\nWhen the motor is in revolving state, the motor speed threshold of the brake output is effective. Under this threshold, the lock output instruction is valid, otherwise the lock output instruction will be valid after waiting for P01-32 time.",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "false",
-                    "Keep": "false"
-                },
-                "P01-32": {
-                    "Code": "P01-32",
-                    "Name": "Servo OFF clasp brake command waiting time",
-                    "Setting": "100",
-                    "set_range": "0-255",
-                    "Default": "50",
-                    "Unit": "1ms",
-                    "Set_Method": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0084",
-                    "Min": "0",
-                    "Max": "255",
-                    "Description": "Set range: 0-255, unit: ms\n\nThe longest waiting time of the brake output is when the motor is in rotation.",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "false",
-                    "Keep": "false"
-                },
-                "P01-33": {
-                    "Code": "P01-33",
-                    "Name": "Keep",
-                    "Setting": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_Method": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0085",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P01-34": {
-                    "Code": "P01-34",
-                    "Name": "Keep",
-                    "Setting": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_Method": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0086",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P01-35": {
-                    "Code": "P01-35",
-                    "Name": "Keep",
-                    "Setting": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_Method": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0087",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P01-36": {
-                    "Code": "P01-36",
-                    "Name": "Keep",
-                    "Setting": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_Method": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0088",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P01-37": {
-                    "Code": "P01-37",
-                    "Name": "Keep",
-                    "Setting": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_Method": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0089",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P01-38": {
-                    "Code": "P01-38",
-                    "Name": "Keep",
-                    "Setting": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_Method": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x008A",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P01-39": {
-                    "Code": "P01-39",
-                    "Name": "Keep",
-                    "Setting": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_Method": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x008B",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P01-40": {
-                    "Code": "P01-40",
-                    "Name": "Runaway detection enable",
-                    "Setting": "1",
-                    "set_range": "0-1",
-                    "Default": "1",
-                    "Unit": "---",
-                    "Set_Method": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x008C",
-                    "Min": "0",
-                    "Max": "1",
-                    "Description": "Prevent motor from runaway and abnormal rotation.\n\n0: Guan enables\n\n1: opening and enabling",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P01-41": {
-                    "Code": "P01-41",
-                    "Name": "Keep",
-                    "Setting": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "Set_Method": "",
-                    "ChangeCondition": "",
-                    "Address": "0x008D",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P01-42": {
-                    "Code": "P01-42",
-                    "Name": "Keep",
-                    "Setting": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "Set_Method": "",
-                    "ChangeCondition": "",
-                    "Address": "0x008E",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P01-43": {
-                    "Code": "P01-43",
-                    "Name": "Keep",
-                    "Setting": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "Set_Method": "",
-                    "ChangeCondition": "",
-                    "Address": "0x008F",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P01-44": {
-                    "Code": "P01-44",
-                    "Name": "Keep",
-                    "Setting": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "Set_Method": "",
-                    "ChangeCondition": "",
-                    "Address": "0x0090",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P01-45": {
-                    "Code": "P01-45",
-                    "Name": "Keep",
-                    "Setting": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "Set_Method": "",
-                    "ChangeCondition": "",
-                    "Address": "0x0091",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P01-46": {
-                    "Code": "P01-46",
-                    "Name": "Keep",
-                    "Setting": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "Set_Method": "",
-                    "ChangeCondition": "",
-                    "Address": "0x0092",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P01-47": {
-                    "Code": "P01-47",
-                    "Name": "Keep",
-                    "Setting": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "Set_Method": "",
-                    "ChangeCondition": "",
-                    "Address": "0x0093",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P01-48": {
-                    "Code": "P01-48",
-                    "Name": "Keep",
-                    "Setting": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "Set_Method": "",
-                    "ChangeCondition": "",
-                    "Address": "0x0094",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P01-49": {
-                    "Code": "P01-49",
-                    "Name": "Keep",
-                    "Setting": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "Set_Method": "",
-                    "ChangeCondition": "",
-                    "Address": "0x0095",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P01-50": {
-                    "Code": "P01-50",
-                    "Name": "Servo ON control source",
-                    "Setting": "1",
-                    "set_range": "0-1",
-                    "Default": "1",
-                    "Unit": "---",
-                    "Set_Method": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x0096",
-                    "Min": "0",
-                    "Max": "1",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "10",
-                    "shutdown_setting": "True",
-                    "Keep": "false"
-                },
-                "P01-51": {
-                    "Code": "P01-51",
-                    "Name": "Keep",
-                    "Setting": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "---",
-                    "Set_Method": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x0097",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P01-52": {
-                    "Code": "P01-52",
-                    "Name": "Keep",
-                    "Setting": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "---",
-                    "Set_Method": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x0098",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P01-53": {
-                    "Code": "P01-53",
-                    "Name": "Keep",
-                    "Setting": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "---",
-                    "Set_Method": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x0099",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P01-54": {
-                    "Code": "P01-54",
-                    "Name": "Keep",
-                    "Setting": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "---",
-                    "Set_Method": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x009A",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P01-55": {
-                    "Code": "P01-55",
-                    "Name": "Keep",
-                    "Setting": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "---",
-                    "Set_Method": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x009B",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P01-56": {
-                    "Code": "P01-56",
-                    "Name": "Keep",
-                    "Setting": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "---",
-                    "Set_Method": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x009C",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P01-57": {
-                    "Code": "P01-57",
-                    "Name": "Overload protection threshold",
-                    "Setting": "703",
-                    "set_range": "0-65535",
-                    "Default": "703",
-                    "Unit": "---",
-                    "Set_Method": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x009D",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "10",
-                    "shutdown_setting": "True",
-                    "Keep": "false"
-                },
-                "P01-58": {
-                    "Code": "P01-58",
-                    "Name": "D axis back EMF constant",
-                    "Setting": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_Method": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x009E",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "10",
-                    "shutdown_setting": "True",
-                    "Keep": "false"
-                },
-                "P01-59": {
-                    "Code": "P01-59",
-                    "Name": "Q axis back EMF constant",
-                    "Setting": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_Method": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x009F",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "10",
-                    "shutdown_setting": "True",
-                    "Keep": "false"
-                },
-                "P01-60": {
-                    "Code": "P01-60",
-                    "Name": "Encoder Z pulse enable",
-                    "Setting": "1",
-                    "set_range": "0-1",
-                    "Default": "1",
-                    "Unit": "---",
-                    "Set_Method": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x00A0",
-                    "Min": "0",
-                    "Max": "1",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "10",
-                    "shutdown_setting": "True",
-                    "Keep": "false"
-                },
-                "P01-61": {
-                    "Code": "P01-61",
-                    "Name": "Velocity pulse selection",
-                    "Setting": "0",
-                    "set_range": "0-1",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_Method": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x00A1",
-                    "Min": "0",
-                    "Max": "1",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "10",
-                    "shutdown_setting": "True",
-                    "Keep": "false"
-                },
-                "P01-62": {
-                    "Code": "P01-62",
-                    "Name": "Edge selection for velocity pulses",
-                    "Setting": "0",
-                    "set_range": "0-3",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Set_Method": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x00A2",
-                    "Min": "0",
-                    "Max": "3",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "10",
-                    "shutdown_setting": "True",
-                    "Keep": "false"
-                },
-                "P01-63": {
-                    "Code": "P01-63",
-                    "Name": "Inverting rotary encoder",
-                    "Setting": "1",
-                    "set_range": "0-1",
-                    "Default": "1",
-                    "Unit": "---",
-                    "Set_Method": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x00A3",
-                    "Min": "0",
-                    "Max": "1",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "10",
-                    "shutdown_setting": "True",
-                    "Keep": "false"
-                },
-                "P01-64": {
-                    "Code": "P01-64",
-                    "Name": "Polarity of Z pulse for rotary encoder",
-                    "Setting": "1",
-                    "set_range": "0-1",
-                    "Default": "1",
-                    "Unit": "---",
-                    "Set_Method": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x00A4",
-                    "Min": "0",
-                    "Max": "1",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "10",
-                    "shutdown_setting": "True",
-                    "Keep": "false"
-                },
-                "P01-65": {
-                    "Code": "P01-65",
-                    "Name": "Keep",
-                    "Setting": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "Set_Method": "",
-                    "ChangeCondition": "",
-                    "Address": "0x00A5",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "10",
-                    "shutdown_setting": "True",
-                    "Keep": "true"
-                },
-                "P01-66": {
-                    "Code": "P01-66",
-                    "Name": "Keep",
-                    "Setting": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "Set_Method": "",
-                    "ChangeCondition": "",
-                    "Address": "0x00A6",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "10",
-                    "shutdown_setting": "True",
-                    "Keep": "true"
-                },
-                "P01-67": {
-                    "Code": "P01-67",
-                    "Name": "Keep",
-                    "Setting": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "Set_Method": "",
-                    "ChangeCondition": "",
-                    "Address": "0x00A7",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "10",
-                    "shutdown_setting": "True",
-                    "Keep": "true"
-                },
-                "P01-68": {
-                    "Code": "P01-68",
-                    "Name": "Keep",
-                    "Setting": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "Set_Method": "",
-                    "ChangeCondition": "",
-                    "Address": "0x00A8",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "10",
-                    "shutdown_setting": "True",
-                    "Keep": "true"
-                },
-                "P01-69": {
-                    "Code": "P01-69",
-                    "Name": "Keep",
-                    "Setting": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "Set_Method": "",
-                    "ChangeCondition": "",
-                    "Address": "0x00A9",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "10",
-                    "shutdown_setting": "True",
-                    "Keep": "true"
-                },
-                "P01-70": {
-                    "Code": "P01-70",
-                    "Name": "Velocity filtering",
-                    "Setting": "1",
-                    "set_range": "0-3",
-                    "Default": "1",
-                    "Unit": "",
-                    "Set_Method": "",
-                    "ChangeCondition": "",
-                    "Address": "0x00AA",
-                    "Min": "0",
-                    "Max": "3",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "10",
-                    "shutdown_setting": "True",
-                    "Keep": "false"
-                },
-                "P01-71": {
-                    "Code": "P01-71",
-                    "Name": "Keep",
-                    "Setting": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "Set_Method": "",
-                    "ChangeCondition": "",
-                    "Address": "0x00AB",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "10",
-                    "shutdown_setting": "True",
-                    "Keep": "true"
-                }
-            },
-            "P02_Gain_parameter": {
-                "P02-00": {
-                    "Code": "P02-00",
-                    "Name": "Position control gain 1",
-                    "set": "48",
-                    "set_range": "0-3000.0",
-                    "Default": "48.0",
-                    "Unit": "1/S",
-                    "Setting_method": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x00C8",
-                    "Min": "0",
-                    "Max": "3000.0",
-                    "Description": "Setting range: 0-3000.0, unit: 1/S\n\nThe larger the parameter value, the higher the gain ratio, the greater the stiffness, the smaller the position tracking error and the faster the response. However, excessive vibration and overshoot can be caused by excessive parameters.\n\nThis parameter is for steady state response.",
-                    "Symbol": "FALSE",
-                    "decimal_place": "1",
-                    "Permission": "0",
-                    "shutdown_setting_": "false",
-                    "Keep": "false"
-                },
-                "P02-01": {
-                    "Code": "P02-01",
-                    "Name": "Position control gain 2",
-                    "set": "57",
-                    "set_range": "0-3000.0",
-                    "Default": "57.0",
-                    "Unit": "1/S",
-                    "Setting_method": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x00C9",
-                    "Min": "0",
-                    "Max": "3000.0",
-                    "Description": "Setting range: 0-3000.0, unit: 1/S\n\nThe bigger the proportional gain of the position loop regulator, the bigger the parameter value, the higher the gain ratio, the bigger the stiffness, the smaller the position tracking error, and the faster the response. However, excessive vibration and overshoot can be caused by excessive parameters.\n\nThis parameter is for dynamic response.",
-                    "Symbol": "FALSE",
-                    "decimal_place": "1",
-                    "Permission": "0",
-                    "shutdown_setting_": "false",
-                    "Keep": "false"
-                },
-                "P02-02": {
-                    "Code": "P02-02",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_method": "---",
-                    "ChangeCondition": "Read only",
-                    "Address": "0x00CA",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting_": "false",
-                    "Keep": "true"
-                },
-                "P02-03": {
-                    "Code": "P02-03",
-                    "Name": "Speed feed forward gain",
-                    "set": "30",
-                    "set_range": "0-100.0",
-                    "Default": "30",
-                    "Unit": "0.01",
-                    "Setting_method": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x00CB",
-                    "Min": "0",
-                    "Max": "100.0",
-                    "Description": "Set range: 0-100.0, unit 1%\n\nThe feedforward gain of the speed loop, the larger the parameter value, the smaller the position tracking error of the system, and the faster the response. But the feedforward gain is too large, which makes the position loop of the system unstable and prone to overshoot and vibration.\n\n  Set range: 0-100.0, unit 1%\n\nThe feedforward gain of the speed loop, the larger the parameter value, the smaller the position tracking error of the system, and the faster the response. But the feedforward gain is too large, which makes the position loop of the system unstable and prone to overshoot and vibration.\n\n  Report error",
-                    "Symbol": "FALSE",
-                    "decimal_place": "1",
-                    "Permission": "0",
-                    "shutdown_setting_": "false",
-                    "Keep": "false"
-                },
-                "P02-04": {
-                    "Code": "P02-04",
-                    "Name": "Speed feedforward smoothing constant",
-                    "set": "0,5",
-                    "set_range": "0-64.00",
-                    "Default": "0.5",
-                    "Unit": "1ms",
-                    "Setting_method": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x00CC",
-                    "Min": "0",
-                    "Max": "64.00",
-                    "Description": "Setting range: 0-64.00, unit: ms\n\nThis parameter is used to set the speed loop feed forward filter time constant. The larger the value, the larger the filtering effect, but the larger the phase lag.",
-                    "Symbol": "FALSE",
-                    "decimal_place": "2",
-                    "Permission": "0",
-                    "shutdown_setting_": "false",
-                    "Keep": "false"
-                },
-                "P02-05": {
-                    "Code": "P02-05",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_method": "---",
-                    "ChangeCondition": "Read only",
-                    "Address": "0x00CD",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting_": "True",
-                    "Keep": "true"
-                },
-                "P02-06": {
-                    "Code": "P02-06",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_method": "---",
-                    "ChangeCondition": "Read only",
-                    "Address": "0x00CE",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting_": "True",
-                    "Keep": "true"
-                },
-                "P02-07": {
-                    "Code": "P02-07",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_method": "---",
-                    "ChangeCondition": "Read only",
-                    "Address": "0x00CF",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting_": "True",
-                    "Keep": "true"
-                },
-                "P02-08": {
-                    "Code": "P02-08",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_method": "---",
-                    "ChangeCondition": "Read only",
-                    "Address": "0x00D0",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting_": "True",
-                    "Keep": "true"
-                },
-                "P02-09": {
-                    "Code": "P02-09",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_method": "---",
-                    "ChangeCondition": "Read only",
-                    "Address": "0x00D1",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting_": "True",
-                    "Keep": "true"
-                },
-                "P02-10": {
-                    "Code": "P02-10",
-                    "Name": "Speed proportional gain 1",
-                    "set": "27",
-                    "set_range": "1.0-2000.0",
-                    "Default": "27",
-                    "Unit": "1Hz",
-                    "Setting_method": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x00D2",
-                    "Min": "1.0",
-                    "Max": "2000.0",
-                    "Description": "Setting range: 1.0-2000.0, unit: Hz\n\nThe greater the proportional gain of speed, the greater the servo stiffness, the faster the speed response, but too large is easy to produce vibration and noise.\n\nIf the system does not generate shocks, try to increase the parameter.\n\nThis parameter is for static response.",
-                    "Symbol": "FALSE",
-                    "decimal_place": "1",
-                    "Permission": "0",
-                    "shutdown_setting_": "false",
-                    "Keep": "false"
-                },
-                "P02-11": {
-                    "Code": "P02-11",
-                    "Name": "Velocity integral constant 1",
-                    "set": "21",
-                    "set_range": "0.1-1000.0",
-                    "Default": "10",
-                    "Unit": "1ms",
-                    "Setting_method": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x00D3",
-                    "Min": "0.1",
-                    "Max": "1000.0",
-                    "Description": "Setting range: 1.0-1000.0, unit: ms\n\nThe smaller the setting value is, the faster the integrating speed is, the greater the stiffness is, and the smaller the setting value is, the easier vibration and noise will be produced.\n\nWhen the system does not oscillate, try to reduce the value of this parameter.\n\nThis parameter is for steady state response.",
-                    "Symbol": "FALSE",
-                    "decimal_place": "1",
-                    "Permission": "0",
-                    "shutdown_setting_": "false",
-                    "Keep": "false"
-                },
-                "P02-12": {
-                    "Code": "P02-12",
-                    "Name": "Pseudo differential feedforward control coefficient 1",
-                    "set": "100",
-                    "set_range": "0-100.0",
-                    "Default": "100",
-                    "Unit": "0.01",
-                    "Setting_method": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x00D4",
-                    "Min": "0",
-                    "Max": "100.0",
-                    "Description": "Setting range: 0-100.0, unit: 1%\n\nWhen set to 100.0%, the speed loop adopts PI control, and the dynamic response is fast; when set to 0, the speed loop integral effect is obvious, which can filter low-frequency interference, but the dynamic response is slow.\n\nBy adjusting this coefficient, the velocity loop can have better dynamic response and increase the resistance to low frequency interference.",
-                    "Symbol": "FALSE",
-                    "decimal_place": "1",
-                    "Permission": "0",
-                    "shutdown_setting_": "false",
-                    "Keep": "false"
-                },
-                "P02-13": {
-                    "Code": "P02-13",
-                    "Name": "Speed proportional gain 2",
-                    "set": "27",
-                    "set_range": "1.0-2000.0",
-                    "Default": "27",
-                    "Unit": "1Hz",
-                    "Setting_method": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x00D5",
-                    "Min": "1.0",
-                    "Max": "2000.0",
-                    "Description": "Setting range: 1.0-2000.0, unit: Hz\n\nThe greater the proportional gain of speed, the greater the servo stiffness, the faster the speed response, but too large is easy to produce vibration and noise.\n\nWhen the system does not generate shocks, try to increase the parameter.\n\nThis parameter is for dynamic response.",
-                    "Symbol": "FALSE",
-                    "decimal_place": "1",
-                    "Permission": "0",
-                    "shutdown_setting_": "false",
-                    "Keep": "false"
-                },
-                "P02-14": {
-                    "Code": "P02-14",
-                    "Name": "Velocity integral constant 2",
-                    "set": "1000",
-                    "set_range": "0.1-1000.0",
-                    "Default": "1000",
-                    "Unit": "1ms",
-                    "Setting_method": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x00D6",
-                    "Min": "0.1",
-                    "Max": "1000.0",
-                    "Description": "Setting range: 1.0-1000.0, unit: ms\n\nThe smaller the setting value is, the faster the integrating speed is, the greater the stiffness is, and the smaller the setting value is, the easier vibration and noise will be produced.\n\nWhen the system does not oscillate, try to reduce the value of this parameter.\n\nThis parameter is for dynamic response.",
-                    "Symbol": "FALSE",
-                    "decimal_place": "1",
-                    "Permission": "0",
-                    "shutdown_setting_": "false",
-                    "Keep": "false"
-                },
-                "P02-15": {
-                    "Code": "P02-15",
-                    "Name": "Pseudo differential feedforward control coefficient 2",
-                    "set": "100",
-                    "set_range": "0-100.0",
-                    "Default": "100",
-                    "Unit": "0.01",
-                    "Setting_method": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x00D7",
-                    "Min": "0",
-                    "Max": "100.0",
-                    "Description": "Setting range: 0-100.0, unit: 1%\n\nWhen set to 100.0%, the speed loop adopts PI control, and the dynamic response is fast; when set to 0, the integral effect of the speed loop is obvious, which can filter low-frequency interference, but the dynamic response is slow.\n\nBy adjusting this coefficient, the velocity loop can have better dynamic response and increase the resistance to low frequency interference.",
-                    "Symbol": "FALSE",
-                    "decimal_place": "1",
-                    "Permission": "0",
-                    "shutdown_setting_": "false",
-                    "Keep": "false"
-                },
-                "P02-16": {
-                    "Code": "P02-16",
-                    "Name": "Velocity integral error limit amplitude",
-                    "set": "25000",
-                    "set_range": "0-32767",
-                    "Default": "25000",
-                    "Unit": "---",
-                    "Setting_method": "Shutdown setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x00D8",
-                    "Min": "0",
-                    "Max": "32767",
-                    "Description": "Set range: 0-32767\nSpeed integral error limit value",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting_": "True",
-                    "Keep": "true"
-                },
-                "P02-17": {
-                    "Code": "P02-17",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_method": "---",
-                    "ChangeCondition": "Read only",
-                    "Address": "0x00D9",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting_": "True",
-                    "Keep": "true"
-                },
-                "P02-18": {
-                    "Code": "P02-18",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_method": "---",
-                    "ChangeCondition": "Read only",
-                    "Address": "0x00DA",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting_": "True",
-                    "Keep": "true"
-                },
-                "P02-19": {
-                    "Code": "P02-19",
-                    "Name": "Torque feedforward gain",
-                    "set": "0",
-                    "set_range": "0-30000",
-                    "Default": "0",
-                    "Unit": "0.01",
-                    "Setting_method": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x00DB",
-                    "Min": "0",
-                    "Max": "30000",
-                    "Description": "Set range: 0-30000, unit: 1%\n\nSet the feedforward weighting value of the current loop. The parameter is weighted by the derivative of the speed instruction, and the current loop is added.",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting_": "false",
-                    "Keep": "false"
-                },
-                "P02-20": {
-                    "Code": "P02-20",
-                    "Name": "Torque feedforward smoothing constant",
-                    "set": "0,8",
-                    "set_range": "0-64.0",
-                    "Default": "0.8",
-                    "Unit": "1ms",
-                    "Setting_method": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x00DC",
-                    "Min": "0",
-                    "Max": "64.0",
-                    "Description": "Setting range: 0-64.00, unit: ms\n\nThis parameter is used to set the torque feedforward filter time constant.",
-                    "Symbol": "FALSE",
-                    "decimal_place": "2",
-                    "Permission": "0",
-                    "shutdown_setting_": "false",
-                    "Keep": "false"
-                },
-                "P02-21": {
-                    "Code": "P02-21",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_method": "---",
-                    "ChangeCondition": "Read only",
-                    "Address": "0x00DD",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting_": "false",
-                    "Keep": "true"
-                },
-                "P02-22": {
-                    "Code": "P02-22",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_method": "---",
-                    "ChangeCondition": "Read only",
-                    "Address": "0x00DE",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting_": "false",
-                    "Keep": "true"
-                },
-                "P02-23": {
-                    "Code": "P02-23",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_method": "---",
-                    "ChangeCondition": "Read only",
-                    "Address": "0x00DF",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting_": "false",
-                    "Keep": "true"
-                },
-                "P02-24": {
-                    "Code": "P02-24",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_method": "---",
-                    "ChangeCondition": "Read only",
-                    "Address": "0x00E0",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting_": "false",
-                    "Keep": "true"
-                },
-                "P02-25": {
-                    "Code": "P02-25",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_method": "---",
-                    "ChangeCondition": "Read only",
-                    "Address": "0x00E1",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting_": "false",
-                    "Keep": "true"
-                },
-                "P02-26": {
-                    "Code": "P02-26",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_method": "---",
-                    "ChangeCondition": "Read only",
-                    "Address": "0x00E2",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting_": "false",
-                    "Keep": "true"
-                },
-                "P02-27": {
-                    "Code": "P02-27",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_method": "---",
-                    "ChangeCondition": "Read only",
-                    "Address": "0x00E3",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting_": "false",
-                    "Keep": "true"
-                },
-                "P02-28": {
-                    "Code": "P02-28",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_method": "---",
-                    "ChangeCondition": "Read only",
-                    "Address": "0x00E4",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting_": "false",
-                    "Keep": "true"
-                },
-                "P02-29": {
-                    "Code": "P02-29",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_method": "---",
-                    "ChangeCondition": "Read only",
-                    "Address": "0x00E5",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting_": "false",
-                    "Keep": "true"
-                },
-                "P02-30": {
-                    "Code": "P02-30",
-                    "Name": "Gain switching mode",
-                    "set": "0",
-                    "set_range": "0-10",
-                    "Default": "7",
-                    "Unit": "---",
-                    "Setting_method": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x00E6",
-                    "Min": "0",
-                    "Max": "10",
-                    "Description": "Set range: 0-10\n\nSetting the first and second gain switching conditions\n\n0 fixed as the first gain P02-00, P02-10, P02-11, P02-12\n\n1 fixed second gain P02-01, P02-13, P02-14, P02-15\n\n2 Invalid DI port set to 9 (gain switching input) for DI input switching: First gain is valid: second gain\n\n3 the torque command greater torque command is greater than the threshold (determined by P02-31 and P02-32) when switching to second gain. Less than the threshold, and at the same time exceeding the P02-33 delay setting, switch to the first gain.\n\n4. Switch to the second gain when the change of speed instruction is larger than the threshold (determined by P02-31 and P02-32). Less than the threshold, and at the same time exceeding the P02-33 delay setting, switch to the first gain.\n\n5 speed instruction, large speed instruction is greater than the threshold (determined by P02-31 and P02-32), switching to second gain. Less than the threshold, and at the same time exceeding the P02-33 delay setting, switch to the first gain.\n\n6 position deviation large position deviation greater than the threshold (determined by P02-31 and P02-32) switch to second gain. Less than the threshold, and at the same time exceeding the P02-33 delay setting, switch to the first gain.\n\n7 there is a location instruction that switches to second gain when there is position instruction. When the location instruction ends and the P02-33 delay is set, switch to the first gain.\n\n8 switch to second gain when unfinished positioning is not completed. The location is completed, and at the same time, when the P02-33 delay setting is exceeded, the switch is switched to the first gain.\n\n9 the actual speed is greater than the threshold (determined by P02-31 and P02-32) when switching to second gain. Less than the threshold, and at the same time exceeding the P02-33 delay setting, switch to the first gain.\n\n10 there is a position command + a real speed switch with a position command to second gain. There is no position instruction and the actual speed is less than the threshold (determined by P02-31 and P02-32), and when the P02-33 delay setting is exceeded, the switch to the first gain.",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting_": "false",
-                    "Keep": "false"
-                },
-                "P02-31": {
-                    "Code": "P02-31",
-                    "Name": "Gain switching level",
-                    "set": "800",
-                    "set_range": "0-20000",
-                    "Default": "800",
-                    "Unit": "---",
-                    "Setting_method": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x00E7",
-                    "Min": "0",
-                    "Max": "20000",
-                    "Description": "Set range: 0-20000\n\nThe threshold of gain switching is determined.\n\nTorque unit: 1000bit=25% rated torque\n\nSpeed unit: 1000bit=200 turns to per minute.\n\nLocation unit: 131072bit per lap.",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting_": "false",
-                    "Keep": "false"
-                },
-                "P02-32": {
-                    "Code": "P02-32",
-                    "Name": "Gain switching hysteresis",
-                    "set": "100",
-                    "set_range": "0-20000",
-                    "Default": "100",
-                    "Unit": "---",
-                    "Setting_method": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x00E8",
-                    "Min": "0",
-                    "Max": "20000",
-                    "Description": "Set range: 0-20000\n\nHysteresis level for gain switching\n\nTorque unit: 1000bit=25% rated torque\n\nSpeed unit: 1000bit=200 turns to per minute.\n\nLocation unit: 131072bit per lap.",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting_": "false",
-                    "Keep": "false"
-                },
-                "P02-33": {
-                    "Code": "P02-33",
-                    "Name": "Communication response delay",
-                    "set": "10",
-                    "set_range": "0-1000.0",
-                    "Default": "10",
-                    "Unit": "1ms",
-                    "Setting_method": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x00E9",
-                    "Min": "0",
-                    "Max": "1000.0",
-                    "Description": "Setting range: 0-1000.0, unit: ms\n\nFrom the second gain to the first gain, the trigger condition is satisfied to the actual switching time.",
-                    "Symbol": "FALSE",
-                    "decimal_place": "1",
-                    "Permission": "0",
-                    "shutdown_setting_": "false",
-                    "Keep": "false"
-                },
-                "P02-34": {
-                    "Code": "P02-34",
-                    "Name": "Position gain switching time",
-                    "set": "10",
-                    "set_range": "0-1000.0",
-                    "Default": "10",
-                    "Unit": "1ms",
-                    "Setting_method": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x00EA",
-                    "Min": "0",
-                    "Max": "1000.0",
-                    "Description": "Setting range: 0-1000.0, unit: ms\n\nPosition control gain 1 smooth switching to position control gain 2 time.",
-                    "Symbol": "FALSE",
-                    "decimal_place": "1",
-                    "Permission": "0",
-                    "shutdown_setting_": "false",
-                    "Keep": "false"
-                },
-                "P02-35": {
-                    "Code": "P02-35",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_method": "---",
-                    "ChangeCondition": "Read only",
-                    "Address": "0x00EB",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting_": "false",
-                    "Keep": "true"
-                },
-                "P02-36": {
-                    "Code": "P02-36",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_method": "---",
-                    "ChangeCondition": "Read only",
-                    "Address": "0x00EC",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting_": "false",
-                    "Keep": "true"
-                },
-                "P02-37": {
-                    "Code": "P02-37",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_method": "---",
-                    "ChangeCondition": "Read only",
-                    "Address": "0x00ED",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting_": "false",
-                    "Keep": "true"
-                },
-                "P02-38": {
-                    "Code": "P02-38",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_method": "---",
-                    "ChangeCondition": "Read only",
-                    "Address": "0x00EE",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting_": "false",
-                    "Keep": "true"
-                },
-                "P02-39": {
-                    "Code": "P02-39",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_method": "---",
-                    "ChangeCondition": "Read only",
-                    "Address": "0x00EF",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting_": "false",
-                    "Keep": "true"
-                },
-                "P02-40": {
-                    "Code": "P02-40",
-                    "Name": "Mode switch selection",
-                    "set": "0",
-                    "set_range": "0-4",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_method": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x00F0",
-                    "Min": "0",
-                    "Max": "4",
-                    "Description": "Set range: 0-4\n\nSetting the speed loop PI control and P control conditions\n\n0: torque command torque command is less than P02-41 when setting threshold is PI control, greater than P control.\n\n1: speed instruction speed command is less than P02-41 setting threshold is PI control, greater than P control.\n\n2: acceleration acceleration is less than P02-41. When setting threshold is PI control, greater than P control.\n\nThe position deviation of 3: is less than P02-41. When setting threshold, PI is the control, and P is the control.\n\n4: no mode switch speed, environmental protection and PI control, no longer switching.",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting_": "false",
-                    "Keep": "true"
-                },
-                "P02-41": {
-                    "Code": "P02-41",
-                    "Name": "Mode switch level",
-                    "set": "10000",
-                    "set_range": "0-20000",
-                    "Default": "10000",
-                    "Unit": "---",
-                    "Setting_method": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x00F1",
-                    "Min": "0",
-                    "Max": "20000",
-                    "Description": "Set range: 0-20000\n\nSet the threshold of switching.\n\nTorque unit: 1000bit=25% rated torque\n\nSpeed unit: 1000bit=200 turns to per minute.\n\nLocation unit: 131072bit per lap.",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting_": "false",
-                    "Keep": "false"
-                },
-                "P02-42": {
-                    "Code": "P02-42",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_method": "---",
-                    "ChangeCondition": "Read only",
-                    "Address": "0x00F2",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting_": "false",
-                    "Keep": "true"
-                },
-                "P02-43": {
-                    "Code": "P02-43",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_method": "---",
-                    "ChangeCondition": "Read only",
-                    "Address": "0x00F3",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting_": "false",
-                    "Keep": "true"
-                },
-                "P02-44": {
-                    "Code": "P02-44",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_method": "---",
-                    "ChangeCondition": "Read only",
-                    "Address": "0x00F4",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting_": "false",
-                    "Keep": "true"
-                },
-                "P02-45": {
-                    "Code": "P02-45",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_method": "---",
-                    "ChangeCondition": "Read only",
-                    "Address": "0x00F5",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting_": "false",
-                    "Keep": "true"
-                },
-                "P02-46": {
-                    "Code": "P02-46",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_method": "---",
-                    "ChangeCondition": "Read only",
-                    "Address": "0x00F6",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting_": "false",
-                    "Keep": "true"
-                },
-                "P02-47": {
-                    "Code": "P02-47",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_method": "---",
-                    "ChangeCondition": "Read only",
-                    "Address": "0x00F7",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting_": "false",
-                    "Keep": "true"
-                },
-                "P02-48": {
-                    "Code": "P02-48",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_method": "---",
-                    "ChangeCondition": "Read only",
-                    "Address": "0x00F8",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting_": "false",
-                    "Keep": "true"
-                },
-                "P02-49": {
-                    "Code": "P02-49",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_method": "---",
-                    "ChangeCondition": "Read only",
-                    "Address": "0x00F9",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "0",
-                    "shutdown_setting_": "false",
-                    "Keep": "true"
-                },
-                "P02-50": {
-                    "Code": "P02-50",
-                    "Name": "Torque command added value",
-                    "set": "0",
-                    "set_range": "-100.0-100.0",
-                    "Default": "0",
-                    "Unit": "0.01",
-                    "Setting_method": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x00FA",
-                    "Min": "-100.0",
-                    "Max": "100.0",
-                    "Description": "Setting range: -100.0-100, unit: 1%\n\nThe position control mode is effective. This value is added to the torque setting value for vertical shaft static torque compensation.",
-                    "Symbol": "FALSE",
-                    "decimal_place": "1",
-                    "Permission": "0",
-                    "shutdown_setting_": "false",
-                    "Keep": "false"
-                },
-                "P02-51": {
-                    "Code": "P02-51",
-                    "Name": "Forward torque compensation",
-                    "set": "0",
-                    "set_range": "-100.0-100.0",
-                    "Default": "0",
-                    "Unit": "0.01",
-                    "Setting_method": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x00FB",
-                    "Min": "-100.0",
-                    "Max": "100.0",
-                    "Description": "Setting range: -100.0-100.0, unit: 1%\n\nThe position control mode is effective. Compensation for forward static friction",
-                    "Symbol": "FALSE",
-                    "decimal_place": "1",
-                    "Permission": "0",
-                    "shutdown_setting_": "false",
-                    "Keep": "false"
-                },
-                "P02-52": {
-                    "Code": "P02-52",
-                    "Name": "Reverse torque compensation",
-                    "set": "0",
-                    "set_range": "-100.0-100.0",
-                    "Default": "0",
-                    "Unit": "0.01",
-                    "Setting_method": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x00FC",
-                    "Min": "-100.0",
-                    "Max": "100.0",
-                    "Description": "Setting range: -100.0-100.0, unit: 1%\n\nThe position control mode is effective. Compensation for reverse static friction",
-                    "Symbol": "FALSE",
-                    "decimal_place": "2",
-                    "Permission": "0",
-                    "shutdown_setting_": "false",
-                    "Keep": "false"
-                },
-                "P02-53": {
-                    "Code": "P02-53",
-                    "Name": "Keep",
-                    "set": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "Setting_method": "",
-                    "ChangeCondition": "",
-                    "Address": "0x00FD",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "",
-                    "decimal_place": "",
-                    "Permission": "0",
-                    "shutdown_setting_": "false",
-                    "Keep": "true"
-                },
-                "P02-54": {
-                    "Code": "P02-54",
-                    "Name": "Keep",
-                    "set": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "Setting_method": "",
-                    "ChangeCondition": "",
-                    "Address": "0x00FE",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "",
-                    "decimal_place": "",
-                    "Permission": "0",
-                    "shutdown_setting_": "false",
-                    "Keep": "true"
-                },
-                "P02-55": {
-                    "Code": "P02-55",
-                    "Name": "Keep",
-                    "set": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "Setting_method": "",
-                    "ChangeCondition": "",
-                    "Address": "0x00FF",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "",
-                    "decimal_place": "",
-                    "Permission": "0",
-                    "shutdown_setting_": "false",
-                    "Keep": "true"
-                },
-                "P02-56": {
-                    "Code": "P02-56",
-                    "Name": "Keep",
-                    "set": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "Setting_method": "",
-                    "ChangeCondition": "",
-                    "Address": "0x0100",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "",
-                    "decimal_place": "",
-                    "Permission": "0",
-                    "shutdown_setting_": "false",
-                    "Keep": "true"
-                },
-                "P02-57": {
-                    "Code": "P02-57",
-                    "Name": "Keep",
-                    "set": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "Setting_method": "",
-                    "ChangeCondition": "",
-                    "Address": "0x0101",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "",
-                    "decimal_place": "",
-                    "Permission": "0",
-                    "shutdown_setting_": "false",
-                    "Keep": "true"
-                },
-                "P02-58": {
-                    "Code": "P02-58",
-                    "Name": "Keep",
-                    "set": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "Setting_method": "",
-                    "ChangeCondition": "",
-                    "Address": "0x0102",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "",
-                    "decimal_place": "",
-                    "Permission": "0",
-                    "shutdown_setting_": "false",
-                    "Keep": "true"
-                },
-                "P02-59": {
-                    "Code": "P02-59",
-                    "Name": "Keep",
-                    "set": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "Setting_method": "",
-                    "ChangeCondition": "",
-                    "Address": "0x0103",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "",
-                    "decimal_place": "",
-                    "Permission": "0",
-                    "shutdown_setting_": "false",
-                    "Keep": "true"
-                },
-                "P02-60": {
-                    "Code": "P02-60",
-                    "Name": "Integral error limit amplitude of current loop regulator",
-                    "set": "0",
-                    "set_range": "0-16383",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_method": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x0104",
-                    "Min": "0",
-                    "Max": "16383",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "10",
-                    "shutdown_setting_": "false",
-                    "Keep": "false"
-                },
-                "P02-61": {
-                    "Code": "P02-61",
-                    "Name": "Proportional gain of D axis current loop regulator",
-                    "set": "0",
-                    "set_range": "0-8888",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_method": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x0105",
-                    "Min": "0",
-                    "Max": "8888",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "10",
-                    "shutdown_setting_": "false",
-                    "Keep": "false"
-                },
-                "P02-62": {
-                    "Code": "P02-62",
-                    "Name": "Integral gain of D axis current loop regulator",
-                    "set": "0",
-                    "set_range": "0-8888",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_method": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x0106",
-                    "Min": "0",
-                    "Max": "8888",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "10",
-                    "shutdown_setting_": "false",
-                    "Keep": "false"
-                },
-                "P02-63": {
-                    "Code": "P02-63",
-                    "Name": "Proportional gain of Q axis current loop regulator",
-                    "set": "0",
-                    "set_range": "0-8888",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_method": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x0107",
-                    "Min": "0",
-                    "Max": "8888",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "10",
-                    "shutdown_setting_": "false",
-                    "Keep": "false"
-                },
-                "P02-64": {
-                    "Code": "P02-64",
-                    "Name": "Integral gain of Q axis current loop regulator",
-                    "set": "0",
-                    "set_range": "0-8888",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_method": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x0108",
-                    "Min": "0",
-                    "Max": "8888",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Permission": "10",
-                    "shutdown_setting_": "false",
-                    "Keep": "false"
-                }
-            },
-            "P03_Position_parameters": {
-                "P03-00": {
-                    "Code": "P03-00",
-                    "Name": "Position command source",
-                    "set": "0",
-                    "set_range": "0-1",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "stop setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x012C",
-                    "Min": "0",
-                    "Max": "1",
-                    "Description": "0：Pulse command\n1：Digital given when communication control",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "True",
-                    "Keep": "false"
-                },
-                "P03-01": {
-                    "Code": "P03-01",
-                    "Name": "Command pulse format",
-                    "set": "1",
-                    "set_range": "0-3",
-                    "Default": "1",
-                    "Unit": "---",
-                    "Setting_mode": "stop setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x012D",
-                    "Min": "0",
-                    "Max": "3",
-                    "Description": "0：Quadrature pulse instruction\n1：Signal + pulse instruction\n2 or 3：Double pulse instruction",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "True",
-                    "Keep": "false"
-                },
-                "P03-02": {
-                    "Code": "P03-02",
-                    "Name": "Command pulse input terminal",
-                    "set": "302",
-                    "set_range": "0-1",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "stop setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x012E",
-                    "Min": "0",
-                    "Max": "1",
-                    "Description": "Used to specify the pulse input port in the CN1 port\n0：low speed pulse interface\n1:high speed pulse interface",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "True",
-                    "Keep": "false"
-                },
-                "P03-03": {
-                    "Code": "P03-03",
-                    "Name": "Instruction pulse inversion",
-                    "set": "0",
-                    "set_range": "0-1",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "stop setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x012F",
-                    "Min": "0",
-                    "Max": "1",
-                    "Description": "To adjust the counting direction of the pulse instruction\n0：Normal.\n1：Reverse direction",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "True",
-                    "Keep": "false"
-                },
-                "P03-04": {
-                    "Code": "P03-04",
-                    "Name": "Position pulse  filtration",
-                    "set": "2",
-                    "set_range": "0-3",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0130",
-                    "Min": "0",
-                    "Max": "3",
-                    "Description": "Setting range：0-3，Unit：us\n0：0.1us。\n1：0.4us\n2：0.8us。\n3：1.6us",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "false",
-                    "Keep": "false"
-                },
-                "P03-05": {
-                    "Code": "P03-05",
-                    "Name": "Location completion judgement condition",
-                    "set": "1",
-                    "set_range": "0-2",
-                    "Default": "1",
-                    "Unit": "---",
-                    "Setting_mode": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0131",
-                    "Min": "0",
-                    "Max": "2",
-                    "Description": "0：output when the position deviation is less than the P03-06 set value\n1：When the position is completed and the position deviation is less than P03-06, the output is set.\n2：When the position is completed (filtered) and the position deviation is less than P03-06, the outp...",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "false",
-                    "Keep": "false"
-                },
-                "P03-06": {
-                    "Code": "P03-06",
-                    "Name": "Positioning complete(In-Position)\nrange",
-                    "set": "30",
-                    "set_range": "0-65535",
-                    "Default": "100",
-                    "Unit": "Encoder unit",
-                    "Setting_mode": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0132",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "Set range： 0-65535，Unit：Encoder unit\nThe threshold value used to set the location to complete the output 。When absolute motor is used, the encoder is calculated at 131072bit per loop. Using incremental encoder motor, the loop of encoders  is calculated by encoder line *4.",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "false",
-                    "Keep": "false"
-                },
-                "P03-07": {
-                    "Code": "P03-07",
-                    "Name": "Position feedback format",
-                    "set": "307",
-                    "set_range": "0-1",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "stop setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0133",
-                    "Min": "0",
-                    "Max": "1",
-                    "Description": "Set range：0-1\n0：Incremental format。\n1：Multi loop absolute value format",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "True",
-                    "Keep": "false"
-                },
-                "P03-08": {
-                    "Code": "P03-08",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "---",
-                    "ChangeCondition": "只读",
-                    "Address": "0x0134",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "false",
-                    "Keep": "true"
-                },
-                "P03-09": {
-                    "Code": "P03-09",
-                    "Name": "The number of instruction pulses in the rotation of a motor",
-                    "set": "4000",
-                    "set_range": "0-65535",
-                    "Default": "10000",
-                    "Unit": "Pulse",
-                    "Setting_mode": "operation setting",
-                    "ChangeCondition": "Power-on again",
-                    "Address": "0x0135",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "Set range ： 0-65535    The absolute encoder motor is used to set the number of instructions pulse when a motor spin a circle .When it is set 0, the parameters of P03-10,P03-11 are valid",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "false",
-                    "Keep": "false"
-                },
-                "P03-10": {
-                    "Code": "P03-10",
-                    "Name": "numerator of electronic gear1",
-                    "set": "5",
-                    "set_range": "1-65535",
-                    "Default": "1",
-                    "Unit": "---",
-                    "Setting_mode": "operation setting",
-                    "ChangeCondition": "Power-on again",
-                    "Address": "0x0136",
-                    "Min": "1",
-                    "Max": "65535",
-                    "Description": "When using the absoluted encoder, see 6.1.3Example of electronic gear ratio calculation \nAn incremental calculation formula for electrical gear ratio：\nG = numerator/denominator;\n = C*4/P\nC:Line of encoder ；P: Pulse No.Input per rotation number \nEg：Encoder line is 2500； input pulse No.of per rotation 3200；what is the electrical gear ratio?：\nG= C*4/P = 2500 * 4/ 3200 = 10000/3200 = 25:8\n \n Re：Numerator of 20B encoder is 131072\n   Numerator of 17Z encoder is160000",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "false",
-                    "Keep": "false"
-                },
-                "P03-11": {
-                    "Code": "P03-11",
-                    "Name": "Denominator of electronic gear 1",
-                    "set": "4",
-                    "set_range": "1-65535",
-                    "Default": "1",
-                    "Unit": "---",
-                    "Setting_mode": "operation setting",
-                    "ChangeCondition": "Power-on again",
-                    "Address": "0x0137",
-                    "Min": "1",
-                    "Max": "65535",
-                    "Description": "When using the absoluted encoder, see 6.1.3Example of electronic gear ratio calculation \nAn incremental calculation formula for electrical gear ratio：\nG = numerator/denominator;\n = C*4/P\nC:Line of encoder ；P:输入每转脉冲数 Pulse No.Input per rotation number \nEg：Encoder line is 2500； input pulse No.of per rotation 3200；what is the electrical gear ratio?：\nG= C*4/P = 2500 * 4/ 3200 = 10000/3200 = 25:8\n \n Re：Numerator of 20B encoder is 131072\n   Numerator of 17Z encoder is160000",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "false",
-                    "Keep": "false"
-                },
-                "P03-12": {
-                    "Code": "P03-12",
-                    "Name": "The number of electronic gear 1 is 16 bits high.",
-                    "set": "312",
-                    "set_range": "0-32767",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "operation setting",
-                    "ChangeCondition": "Power-on again",
-                    "Address": "0x0138",
-                    "Min": "0",
-                    "Max": "32767",
-                    "Description": "Set range： 0-32767\nThe use of this parameter can amplify the electronic gear ratio：Numerator＝P03-12*10000+P03-10",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "True",
-                    "Keep": "false"
-                },
-                "P03-13": {
-                    "Code": "P03-13",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0139",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "false",
-                    "Keep": "true"
-                },
-                "P03-14": {
-                    "Code": "P03-14",
-                    "Name": "keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x013A",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "false",
-                    "Keep": "true"
-                },
-                "P03-15": {
-                    "Code": "P03-15",
-                    "Name": "position deviation Setting is too large",
-                    "set": "2000",
-                    "set_range": "0-65535",
-                    "Default": "30000",
-                    "Unit": "Command unit*10",
-                    "Setting_mode": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x013B",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "Setting range： 0-65535，Unit：Command unit*10\nSet the number of pulses allowed for deviation, and it will alarm if it exceeds the set value. \nEg：setting value is 20，When the followed deviation is more than 20*10.The driver will be alarmed AL.501（Position devitation is too large）",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "false",
-                    "Keep": "false"
-                },
-                "P03-16": {
-                    "Code": "P03-16",
-                    "Name": "Time constant of Position command smoothing filter",
-                    "set": "0",
-                    "set_range": "0-1000.0",
-                    "Default": "0",
-                    "Unit": "1ms",
-                    "Setting_mode": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x013C",
-                    "Min": "0",
-                    "Max": "1000.0",
-                    "Description": "Setting range： 1000，Unit：ms\nSetting the time constant of a position instruction smooth filter",
-                    "Symbol": "FALSE",
-                    "decimal_place": "1",
-                    "Right": "0",
-                    "Downtime_setting_": "false",
-                    "Keep": "false"
-                },
-                "P03-17": {
-                    "Code": "P03-17",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x013D",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "false",
-                    "Keep": "true"
-                },
-                "P03-18": {
-                    "Code": "P03-18",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x013E",
-                    "Min": "0",
-                    "Max": "",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "false",
-                    "Keep": "true"
-                },
-                "P03-19": {
-                    "Code": "P03-19",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x013F",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "false",
-                    "Keep": "true"
-                },
-                "P03-20": {
-                    "Code": "P03-20",
-                    "Name": "Position loop feedback source",
-                    "set": "320",
-                    "set_range": "0-1",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0140",
-                    "Min": "0",
-                    "Max": "1",
-                    "Description": "Set the source of position feedback\n0：Encoder\n1：grating",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "false",
-                    "Keep": "false"
-                },
-                "P03-21": {
-                    "Code": "P03-21",
-                    "Name": "Keep",
-                    "set": "1",
-                    "set_range": "0-1",
-                    "Default": "1",
-                    "Unit": "---",
-                    "Setting_mode": "stop setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0141",
-                    "Min": "0",
-                    "Max": "1",
-                    "Description": "Set whether the CN1 port has an encoder frequency division output \n\n0：Close enable\n1：Open enable",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "True",
-                    "Keep": "true"
-                },
-                "P03-22": {
-                    "Code": "P03-22",
-                    "Name": "Numerator of Pulse output division of Incremental encoder",
-                    "set": "322",
-                    "set_range": "1-65535",
-                    "Default": "1",
-                    "Unit": "---",
-                    "Setting_mode": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0142",
-                    "Min": "1",
-                    "Max": "65535",
-                    "Description": "When using the incremental encoder, set the number of output pulses of CN1 port .\nP03-23 need to less than or equal P03-22，Format：\nG= numerator/denominator;\n = (C*4)/(P*4)\nC:line of encoder\nP：\nExpected output A, B per rotation pulse number eg：Line of encoder is 2500，\nA,BPulse No. of Per Rotation when output is 500 G= (C*4)/(P*4)=(2500*4)/(500*4) = 5:1",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "false",
-                    "Keep": "false"
-                },
-                "P03-23": {
-                    "Code": "P03-23",
-                    "Name": "denominator of Pulse output division of Incremental encoder",
-                    "set": "323",
-                    "set_range": "1-65535",
-                    "Default": "1",
-                    "Unit": "---",
-                    "Setting_mode": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0143",
-                    "Min": "1",
-                    "Max": "65535",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "false",
-                    "Keep": "false"
-                },
-                "P03-24": {
-                    "Code": "P03-24",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0144",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "false",
-                    "Keep": "true"
-                },
-                "P03-25": {
-                    "Code": "P03-25",
-                    "Name": "Output pulse No.of one    \nrevolution of the Absolute Encoder",
-                    "set": "325",
-                    "set_range": "0-60000",
-                    "Default": "2500",
-                    "Unit": "---",
-                    "Setting_mode": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0145",
-                    "Min": "0",
-                    "Max": "60000",
-                    "Description": "Setting range：0-60000\nSet the output No.of frequncy A pulse and Frequncy B pulse ,When the aboluted  . \nEg：setting value is 2048，it means when the motor works a loop, the signal A and signal B will output 2048pcs Pulses",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "false",
-                    "Keep": "false"
-                },
-                "P03-26": {
-                    "Code": "P03-26",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0146",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "false",
-                    "Keep": "true"
-                },
-                "P03-27": {
-                    "Code": "P03-27",
-                    "Name": "Keep",
-                    "set": "327",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0147",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "false",
-                    "Keep": "false"
-                },
-                "P03-28": {
-                    "Code": "P03-28",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0148",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "false",
-                    "Keep": "true"
-                },
-                "P03-29": {
-                    "Code": "P03-29",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0149",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "false",
-                    "Keep": "true"
-                },
-                "P03-30": {
-                    "Code": "P03-30",
-                    "Name": "Linear encoder phase setup",
-                    "set": "330",
-                    "set_range": "0-1",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x014A",
-                    "Min": "0",
-                    "Max": "1",
-                    "Description": "Check whether the input A,B phase of grating rules is Opposite or not\n0：right\n1：opposite",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "True",
-                    "Keep": "false"
-                },
-                "P03-31": {
-                    "Code": "P03-31",
-                    "Name": "Polarity of Z pulse in linear encoder",
-                    "set": "331",
-                    "set_range": "0-1",
-                    "Default": "1",
-                    "Unit": "---",
-                    "Setting_mode": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x014B",
-                    "Min": "0",
-                    "Max": "1",
-                    "Description": "Set effective electrical level of the input Z signal for grating rule 0：Low electrical level\n1：high electrical level",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "True",
-                    "Keep": "false"
-                },
-                "P03-32": {
-                    "Code": "P03-32",
-                    "Name": "Keep",
-                    "set": "332",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x014C",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "false",
-                    "Keep": "false"
-                },
-                "P03-33": {
-                    "Code": "P03-33",
-                    "Name": "Keep",
-                    "set": "333",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x014D",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "false",
-                    "Keep": "false"
-                },
-                "P03-34": {
-                    "Code": "P03-34",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x014E",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "false",
-                    "Keep": "true"
-                },
-                "P03-35": {
-                    "Code": "P03-35",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x014F",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "false",
-                    "Keep": "true"
-                },
-                "P03-36": {
-                    "Code": "P03-36",
-                    "Name": "Keep",
-                    "set": "336",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0150",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "false",
-                    "Keep": "false"
-                },
-                "P03-37": {
-                    "Code": "P03-37",
-                    "Name": "Keep",
-                    "set": "337",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0151",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "false",
-                    "Keep": "false"
-                },
-                "P03-38": {
-                    "Code": "P03-38",
-                    "Name": "Keep",
-                    "set": "338",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0152",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "false",
-                    "Keep": "false"
-                },
-                "P03-39": {
-                    "Code": "P03-39",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0153",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "false",
-                    "Keep": "true"
-                },
-                "P03-40": {
-                    "Code": "P03-40",
-                    "Name": "Source of output pulse",
-                    "set": "0",
-                    "set_range": "0-3",
-                    "Default": "1",
-                    "Unit": "---",
-                    "Setting_mode": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0154",
-                    "Min": "0",
-                    "Max": "3",
-                    "Description": "Set the source of the frequency division output signal in the CN1 terminal \n0：motor encoder\n1：grating rule\n2：Pulse output\n3：grating rule",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "True",
-                    "Keep": "true"
-                },
-                "P03-41": {
-                    "Code": "P03-41",
-                    "Name": "keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0155",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "false",
-                    "Keep": "true"
-                },
-                "P03-42": {
-                    "Code": "P03-42",
-                    "Name": "Polarity of output Z pulse",
-                    "set": "342",
-                    "set_range": "0-1",
-                    "Default": "1",
-                    "Unit": "---",
-                    "Setting_mode": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0156",
-                    "Min": "0",
-                    "Max": "1",
-                    "Description": "Set the CN1 terminal divider output signal Z signal effective level.\n\n0: low electronic level\n\n1: high electronic level",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "True",
-                    "Keep": "false"
-                },
-                "P03-43": {
-                    "Code": "P03-43",
-                    "Name": "Keep",
-                    "set": "343",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0157",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "false",
-                    "Keep": "false"
-                },
-                "P03-44": {
-                    "Code": "P03-44",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0158",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "false",
-                    "Keep": "true"
-                },
-                "P03-45": {
-                    "Code": "P03-45",
-                    "Name": "Digital location instruction cache mode",
-                    "set": "0",
-                    "set_range": "0-1",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "stop setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0159",
-                    "Min": "0",
-                    "Max": "1",
-                    "Description": "Setting range： 0-1\n0：                                0-1 No caching (operate immediately)\n1: cache (finish the last data then do the new data)",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "True",
-                    "Keep": "true"
-                },
-                "P03-46": {
-                    "Code": "P03-46",
-                    "Name": "The Max RMP of motor when in Digital position operation",
-                    "set": "1000",
-                    "set_range": "0-6000",
-                    "Default": "1000",
-                    "Unit": "---",
-                    "Setting_mode": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x015A",
-                    "Min": "0",
-                    "Max": "6000",
-                    "Description": "Setting range：0-6000\nSet the motor's maximum speed when in the digital position command situation",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "false",
-                    "Keep": "true"
-                },
-                "P03-47": {
-                    "Code": "P03-47",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x015B",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "",
-                    "Keep": "true"
-                },
-                "P03-48": {
-                    "Code": "P03-48",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x015C",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "",
-                    "Keep": "true"
-                },
-                "P03-49": {
-                    "Code": "P03-49",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x015D",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "",
-                    "Keep": "true"
-                },
-                "P03-50": {
-                    "Code": "P03-50",
-                    "Name": "biaxial sysnchronization Functional enabling",
-                    "set": "0",
-                    "set_range": "0-1",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "stop setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x015E",
-                    "Min": "0",
-                    "Max": "1",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "True",
-                    "Keep": "true"
-                },
-                "P03-51": {
-                    "Code": "P03-51",
-                    "Name": "biaxial sysnchronization function input signal inversion",
-                    "set": "0",
-                    "set_range": "0-1",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "stop setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x015F",
-                    "Min": "0",
-                    "Max": "1",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "True",
-                    "Keep": "true"
-                },
-                "P03-52": {
-                    "Code": "P03-52",
-                    "Name": "Biaxial sysnchronizationOne cycle feedback pulse number of function motor",
-                    "set": "10000",
-                    "set_range": "0-65535",
-                    "Default": "10000",
-                    "Unit": "---",
-                    "Setting_mode": "stop setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0160",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "True",
-                    "Keep": "true"
-                },
-                "P03-53": {
-                    "Code": "P03-53",
-                    "Name": "Biaxial sysnchronization function position deviation is too large.",
-                    "set": "10000",
-                    "set_range": "0-65535",
-                    "Default": "10000",
-                    "Unit": "---",
-                    "Setting_mode": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0161",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "false",
-                    "Keep": "true"
-                },
-                "P03-54": {
-                    "Code": "P03-54",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0162",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "false",
-                    "Keep": "true"
-                },
-                "P03-55": {
-                    "Code": "P03-55",
-                    "Name": "biaxial sysnchronization same moving position proportional gain",
-                    "set": "10",
-                    "set_range": "0-200",
-                    "Default": "10",
-                    "Unit": "---",
-                    "Setting_mode": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0163",
-                    "Min": "0",
-                    "Max": "200",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "false",
-                    "Keep": "true"
-                },
-                "P03-56": {
-                    "Code": "P03-56",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0164",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "false",
-                    "Keep": "true"
-                },
-                "P03-57": {
-                    "Code": "P03-57",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0165",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "false",
-                    "Keep": "true"
-                },
-                "P03-58": {
-                    "Code": "P03-58",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0166",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "false",
-                    "Keep": "true"
-                },
-                "P03-59": {
-                    "Code": "P03-59",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0167",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "false",
-                    "Keep": "true"
-                },
-                "P03-60": {
-                    "Code": "P03-60",
-                    "Name": "Origin back Ena control",
-                    "set": "0",
-                    "set_range": "0-6",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0168",
-                    "Min": "0",
-                    "Max": "6",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "false",
-                    "Keep": "true"
-                },
-                "P03-61": {
-                    "Code": "P03-61",
-                    "Name": "Origin regression model",
-                    "set": "0",
-                    "set_range": "0-9",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0169",
-                    "Min": "0",
-                    "Max": "9",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "false",
-                    "Keep": "true"
-                },
-                "P03-62": {
-                    "Code": "P03-62",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x016A",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "false",
-                    "Keep": "true"
-                },
-                "P03-63": {
-                    "Code": "P03-63",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x016B",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "false",
-                    "Keep": "true"
-                },
-                "P03-64": {
-                    "Code": "P03-64",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x016C",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "false",
-                    "Keep": "true"
-                },
-                "P03-65": {
-                    "Code": "P03-65",
-                    "Name": "Speed  when search for original switch-high speed",
-                    "set": "100",
-                    "set_range": "0-3000",
-                    "Default": "100",
-                    "Unit": "---",
-                    "Setting_mode": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x016D",
-                    "Min": "0",
-                    "Max": "3000",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "True",
-                    "Keep": "true"
-                },
-                "P03-66": {
-                    "Code": "P03-66",
-                    "Name": "Speed of  when search for original switch-low speed",
-                    "set": "10",
-                    "set_range": "0-1000",
-                    "Default": "10",
-                    "Unit": "---",
-                    "Setting_mode": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x016E",
-                    "Min": "0",
-                    "Max": "1000",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "True",
-                    "Keep": "true"
-                },
-                "P03-67": {
-                    "Code": "P03-67",
-                    "Name": "Search origin switch acceleration and deceleration time",
-                    "set": "0",
-                    "set_range": "0-5000",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x016F",
-                    "Min": "0",
-                    "Max": "5000",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "True",
-                    "Keep": "true"
-                },
-                "P03-68": {
-                    "Code": "P03-68",
-                    "Name": "The longest time limit for searching the origin",
-                    "set": "0",
-                    "set_range": "0-10000",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0170",
-                    "Min": "0",
-                    "Max": "10000",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "True",
-                    "Keep": "true"
-                },
-                "P03-69": {
-                    "Code": "P03-69",
-                    "Name": "Mechanical origin offset H",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0171",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "True",
-                    "Keep": "true"
-                },
-                "P03-70": {
-                    "Code": "P03-70",
-                    "Name": "Mechanical origin offset L",
-                    "set": "1000",
-                    "set_range": "0-65535",
-                    "Default": "1000",
-                    "Unit": "---",
-                    "Setting_mode": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0172",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "0",
-                    "Downtime_setting_": "True",
-                    "Keep": "true"
-                },
-                "P03-71": {
-                    "Code": "P03-71",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x0173",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "10",
-                    "Downtime_setting_": "false",
-                    "Keep": "true"
-                },
-                "P03-72": {
-                    "Code": "P03-72",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x0174",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "10",
-                    "Downtime_setting_": "false",
-                    "Keep": "true"
-                },
-                "P03-73": {
-                    "Code": "P03-73",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x0175",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "10",
-                    "Downtime_setting_": "false",
-                    "Keep": "true"
-                },
-                "P03-74": {
-                    "Code": "P03-74",
-                    "Name": "Keep",
-                    "set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_mode": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x0176",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "decimal_place": "0",
-                    "Right": "10",
-                    "Downtime_setting_": "false",
-                    "Keep": "true"
-                }
-            },
-            "P04_Speed_parameters": {
-                "P04-00": {
-                    "Code": "P04-00",
-                    "Name": "Source of rotational\nspeed",
-                    "setting": "1",
-                    "Setting_range": "0-3",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "Shutdown setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0190",
-                    "Min": "0",
-                    "Max": "3",
-                    "Description": "0：External analog instruction\n1：Digital command (parameters)\n2：Digital instruction\n(communication)\n3：Internal multiple sets of\ninstructions",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "True",
-                    "Keep": "false"
-                },
-                "P04-01": {
-                    "Code": "P04-01",
-                    "Name": "Speed analog command inverting",
-                    "setting": "0",
-                    "Setting_range": "0-1",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "Shutdown setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0191",
-                    "Min": "0",
-                    "Max": "1",
-                    "Description": "adjusting the polarity relations of  analog quantities\n0：Normal\n1：Polarity reversal",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "True",
-                    "Keep": "false"
-                },
-                "P04-02": {
-                    "Code": "P04-02",
-                    "Name": "Digital speed command value",
-                    "setting": "0",
-                    "Setting_range": "-6000-6000",
-                    "Default": "0",
-                    "Unit": "1rpm",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0192",
-                    "Min": "-6000",
-                    "Max": "6000",
-                    "Description": "Setting range：-6000－6000，Unit：rpm\nWhen P04-00 is set to 1, P04-02 is the setting value of speed control.",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "false"
-                },
-                "P04-03": {
-                    "Code": "P04-03",
-                    "Name": "Speed zero-clamp function setup",
-                    "setting": "0",
-                    "Setting_range": "0-1",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0193",
-                    "Min": "0",
-                    "Max": "1",
-                    "Description": "0：No position clamping function\n1：has position clamping function\n When in the speed control mode,if meets the following conditions, it enters the lock-in mode.\nA：P04-03 set as 1\nB：Speed instruction absolute value is less than P04-04 setting threshold.\nC：The function of the external input port is set to 10 (zero position) and is in the valid state of input.",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P04-04": {
-                    "Code": "P04-04",
-                    "Name": "Zero speed position clamping speed threshold",
-                    "setting": "30",
-                    "Setting_range": "0-6000",
-                    "Default": "30",
-                    "Unit": "1rpm",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0194",
-                    "Min": "0",
-                    "Max": "6000",
-                    "Description": "Setting ragne ：0-6000，Unit：rpm\nSet the speed instruction threshold for triggering zero speed position clamping function.",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P04-05": {
-                    "Code": "P04-05",
-                    "Name": "Over-speed alarm value",
-                    "setting": "6400",
-                    "Setting_range": "0-6500",
-                    "Default": "6400",
-                    "Unit": "1rpm",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0195",
-                    "Min": "0",
-                    "Max": "6500",
-                    "Description": "Setting range ：0-6500，Unit：rpm\n Set the maximum allowed speed , exceeding the set value  AL.420 overspeed alarm.",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "false"
-                },
-                "P04-06": {
-                    "Code": "P04-06",
-                    "Name": "Positive speed limit value",
-                    "setting": "5000",
-                    "Setting_range": "0-6000",
-                    "Default": "5000",
-                    "Unit": "1rpm",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0196",
-                    "Min": "0",
-                    "Max": "6000",
-                    "Description": "Setting range：0-6000，Unit：rpm\n\nLimit the positive speed of the motor.",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "false"
-                },
-                "P04-07": {
-                    "Code": "P04-07",
-                    "Name": "Negative speed limit value",
-                    "setting": "-5000",
-                    "Setting_range": "-6000-0",
-                    "Default": "-5000",
-                    "Unit": "1rpm",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0197",
-                    "Min": "-6000",
-                    "Max": "0",
-                    "Description": "setting range：0- -6000，Unit：rpm\n\nLimiting motor reverse speed",
-                    "Symbol": "True",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "false"
-                },
-                "P04-08": {
-                    "Code": "P04-08",
-                    "Name": "Keep",
-                    "setting": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x0198",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P04-09": {
-                    "Code": "P04-09",
-                    "Name": "keep",
-                    "setting": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x0199",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P04-10": {
-                    "Code": "P04-10",
-                    "Name": "Zero-speed",
-                    "setting": "2",
-                    "Setting_range": "0-200",
-                    "Default": "2",
-                    "Unit": "1rpm",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x019A",
-                    "Min": "0",
-                    "Max": "200",
-                    "Description": "Set range：0-200.0，Unit：rpm\nSetting the zero speed detection threshold value, if motor speed below the threshold can output  \"motor zero speed output\" signal\n  through the output port",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P04-11": {
-                    "Code": "P04-11",
-                    "Name": "Rotation detection value",
-                    "setting": "30",
-                    "Setting_range": "0-200",
-                    "Default": "30",
-                    "Unit": "1rpm",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x019B",
-                    "Min": "0",
-                    "Max": "200",
-                    "Description": "Set range：0-200.0，Unit：rpm\nSet motor rotation detection threshold, if motor speed is higher than the value can be displayed through the LED panel.",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P04-12": {
-                    "Code": "P04-12",
-                    "Name": "Speed uniform range",
-                    "setting": "30",
-                    "Setting_range": "0-200",
-                    "Default": "30",
-                    "Unit": "1rpm",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x019C",
-                    "Min": "0",
-                    "Max": "200",
-                    "Description": "Set range：0-200.0，Unit：rpm\nSetting the threshold value of the speed consistent signal, when the difference between the motor speed and the command speed is within the threshold value, the \"speed consistent output\" signal can be output through the output port.",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P04-13": {
-                    "Code": "P04-13",
-                    "Name": "Keep",
-                    "setting": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x019D",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P04-14": {
-                    "Code": "P04-14",
-                    "Name": "Acceleration time setup",
-                    "setting": "500",
-                    "Setting_range": "0-10000",
-                    "Default": "0",
-                    "Unit": "1ms/1000rpm",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x019E",
-                    "Min": "0",
-                    "Max": "10000",
-                    "Description": "Set range：0-10000，Unit：1ms/1000rpm\n\nSetting the acceleration of speed control",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "false"
-                },
-                "P04-15": {
-                    "Code": "P04-15",
-                    "Name": "Deceleration time setup",
-                    "setting": "500",
-                    "Setting_range": "0-10000",
-                    "Default": "0",
-                    "Unit": "",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x019F",
-                    "Min": "0",
-                    "Max": "10000",
-                    "Description": "Set range：0-10000，Unit：1ms/1000rpm\nSetting deceleration  in controlling speed",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "false"
-                },
-                "P04-16": {
-                    "Code": "P04-16",
-                    "Name": "keep",
-                    "setting": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x01A0",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P04-17": {
-                    "Code": "P04-17",
-                    "Name": "keep",
-                    "setting": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x01A1",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P04-18": {
-                    "Code": "P04-18",
-                    "Name": "Keep",
-                    "setting": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x01A2",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P04-19": {
-                    "Code": "P04-19",
-                    "Name": "Keep",
-                    "setting": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x01A3",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P04-20": {
-                    "Code": "P04-20",
-                    "Name": "Keep",
-                    "setting": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x01A4",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P04-21": {
-                    "Code": "P04-21",
-                    "Name": "Keep",
-                    "setting": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x01A5",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P04-22": {
-                    "Code": "P04-22",
-                    "Name": "Keep",
-                    "setting": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x01A6",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P04-23": {
-                    "Code": "P04-23",
-                    "Name": "Keep",
-                    "setting": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x01A7",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P04-24": {
-                    "Code": "P04-24",
-                    "Name": "Keep",
-                    "setting": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x01A8",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P04-25": {
-                    "Code": "P04-25",
-                    "Name": "Keep",
-                    "setting": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x01A9",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P04-26": {
-                    "Code": "P04-26",
-                    "Name": "Keep",
-                    "setting": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x01AA",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P04-27": {
-                    "Code": "P04-27",
-                    "Name": "Keep",
-                    "setting": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x01AB",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P04-28": {
-                    "Code": "P04-28",
-                    "Name": "Keep",
-                    "setting": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x01AC",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P04-29": {
-                    "Code": "P04-29",
-                    "Name": "Keep",
-                    "setting": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x01AD",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P04-30": {
-                    "Code": "P04-30",
-                    "Name": "1th Internal setting speed",
-                    "setting": "0",
-                    "Setting_range": "-6000-6000",
-                    "Default": "0",
-                    "Unit": "1rpm",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x01AE",
-                    "Min": "-6000",
-                    "Max": "6000",
-                    "Description": "Set range：-6000—6000，Unit：rpm\nParameters P04-30 to P04-37 respectively set internal speed 1 to internal speed 8 speed.\nThe internal speed switching method is as follows:\nWhen in the speed loop control mode, P04-00 is set at 3.\nThe corresponding input ports  are defined as 13, 14, 15.\nThe switching of internal speed is achieved by setting the input port function to 13, 14, 15 on-off state combination. The switching relationship is shown in the below table \nDI13 DI14 DI15 Action parameters\n0 0 0 P04-30\n1 0 0 P04-31\n0 1 0 P04-32\n1 1 0 P04-33\n0 0 1 P04-34\n1 0 1 P04-35\n0 1 1 P04-36\n1 1 1 P04-37",
-                    "Symbol": "True",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P04-31": {
-                    "Code": "P04-31",
-                    "Name": "Internal setting speed 2",
-                    "setting": "0",
-                    "Setting_range": "-6000-6000",
-                    "Default": "0",
-                    "Unit": "1rpm",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x01AF",
-                    "Min": "-6000",
-                    "Max": "6000",
-                    "Description": "Set range：-6000—6000，Unit：rpm\nParameters P04-30 to P04-37 respectively set internal speed 1 to internal speed 8 speed.\nThe internal speed switching method is as follows:\nWhen in the speed loop control mode, P04-00 is set at 3.\nThe corresponding input ports  are defined as 13, 14, 15.\nThe switching of internal speed is achieved by setting the input port function to 13, 14, 15 on-off state combination. The switching relationship is shown in the below table \nDI13 DI14 DI15 作用参数\n0 0 0 P04-30\n1 0 0 P04-31\n0 1 0 P04-32\n1 1 0 P04-33\n0 0 1 P04-34\n1 0 1 P04-35\n0 1 1 P04-36\n1 1 1 P04-37",
-                    "Symbol": "True",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P04-32": {
-                    "Code": "P04-32",
-                    "Name": "Internal setting speed 3",
-                    "setting": "0",
-                    "Setting_range": "-6000-6000",
-                    "Default": "0",
-                    "Unit": "1rpm",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x01B0",
-                    "Min": "-6000",
-                    "Max": "6000",
-                    "Description": "设定范围：-6000—6000，单位：rpm\nParameters P04-30 to P04-37 respectively set internal speed 1 to internal speed 8 speed.\nThe internal speed switching method is as follows:\nWhen in the speed loop control mode, P04-00 is set at 3.\nThe corresponding input ports  are defined as 13, 14, 15.\nThe switching of internal speed is achieved by setting the input port function to 13, 14, 15 on-off state combination. The switching relationship is shown in the below table \nDI13 DI14 DI15 作用参数\n0 0 0 P04-30\n1 0 0 P04-31\n0 1 0 P04-32\n1 1 0 P04-33\n0 0 1 P04-34\n1 0 1 P04-35\n0 1 1 P04-36\n1 1 1 P04-37",
-                    "Symbol": "True",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P04-33": {
-                    "Code": "P04-33",
-                    "Name": "Internal setting speed 4",
-                    "setting": "0",
-                    "Setting_range": "-6000-6000",
-                    "Default": "0",
-                    "Unit": "1rpm",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x01B1",
-                    "Min": "-6000",
-                    "Max": "6000",
-                    "Description": "Set range ：-6000—6000，Unit：rpm\nParameters P04-30 to P04-37 respectively set internal speed 1 to internal speed 8 speed.\nThe internal speed switching method is as follows:\nWhen in the speed loop control mode, P04-00 is set at 3.\nThe corresponding input ports  are defined as 13, 14, 15.\nThe switching of internal speed is achieved by setting the input port function to 13, 14, 15 on-off state combination. The switching relationship is shown in the below table \nDI13 DI14 DI15 Action parameters\n0 0 0 P04-30\n1 0 0 P04-31\n0 1 0 P04-32\n1 1 0 P04-33\n0 0 1 P04-34\n1 0 1 P04-35\n0 1 1 P04-36\n1 1 1 P04-37",
-                    "Symbol": "True",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P04-34": {
-                    "Code": "P04-34",
-                    "Name": "Internal setting speed 5",
-                    "setting": "0",
-                    "Setting_range": "-6000-6000",
-                    "Default": "0",
-                    "Unit": "1rpm",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x01B2",
-                    "Min": "-6000",
-                    "Max": "6000",
-                    "Description": "Set range：-6000—6000，Unit：rpm\n参数P04-30至P04-37分别设定内部转速1到内部转速8的转速\n内部转速切换实现方法如下:\n当速度环控制时，P04-00设3，\n相应的输入端口功能定义为13、14、15\n内部转速的切换是通过输入端口功能设定为13、14、15通断状态组合来实现内部转速的切换，切换关系如下表所示\nDI13 DI14 DI15 作用参数\n0 0 0 P04-30\n1 0 0 P04-31\n0 1 0 P04-32\n1 1 0 P04-33\n0 0 1 P04-34\n1 0 1 P04-35\n0 1 1 P04-36\n1 1 1 P04-37",
-                    "Symbol": "True",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P04-35": {
-                    "Code": "P04-35",
-                    "Name": "Internal setting speed 6",
-                    "setting": "0",
-                    "Setting_range": "-6000-6000",
-                    "Default": "0",
-                    "Unit": "1rpm",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x01B3",
-                    "Min": "-6000",
-                    "Max": "6000",
-                    "Description": "Set range ：-6000—6000，Unit：rpm\nParameters P04-30 to P04-37 respectively set internal speed 1 to internal speed 8 speed.\nThe internal speed switching method is as follows:\nWhen in the speed loop control mode, P04-00 is set at 3.\nThe corresponding input ports  are defined as 13, 14, 15.\nThe switching of internal speed is achieved by setting the input port function to 13, 14, 15 on-off state combination. The switching relationship is shown in the below table \nDI13 DI14 DI15 作用参数\n0 0 0 P04-30\n1 0 0 P04-31\n0 1 0 P04-32\n1 1 0 P04-33\n0 0 1 P04-34\n1 0 1 P04-35\n0 1 1 P04-36\n1 1 1 P04-37",
-                    "Symbol": "True",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P04-36": {
-                    "Code": "P04-36",
-                    "Name": "Internal setting speed 7",
-                    "setting": "0",
-                    "Setting_range": "-6000-6000",
-                    "Default": "0",
-                    "Unit": "1rpm",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x01B4",
-                    "Min": "-6000",
-                    "Max": "6000",
-                    "Description": "Set range：-6000—6000，Unit：rpm\nParameters P04-30 to P04-37 respectively set internal speed 1 to internal speed 8 speed.\nThe internal speed switching method is as follows:\nWhen in the speed loop control mode, P04-00 is set at 3.\nThe corresponding input ports  are defined as 13, 14, 15.\nThe switching of internal speed is achieved by setting the input port function to 13, 14, 15 on-off state combination. The switching relationship is shown in the below table \nDI13 DI14 DI15 Action parameters\n0 0 0 P04-30\n1 0 0 P04-31\n0 1 0 P04-32\n1 1 0 P04-33\n0 0 1 P04-34\n1 0 1 P04-35\n0 1 1 P04-36\n1 1 1 P04-37",
-                    "Symbol": "True",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P04-37": {
-                    "Code": "P04-37",
-                    "Name": "Internal setting speed 8",
-                    "setting": "0",
-                    "Setting_range": "-6000-6000",
-                    "Default": "0",
-                    "Unit": "1rpm",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x01B5",
-                    "Min": "-6000",
-                    "Max": "6000",
-                    "Description": "Set range：-6000—6000，Unit：rpm\nParameters P04-30 to P04-37 respectively set internal speed 1 to internal speed 8 speed.\nThe internal speed switching method is as follows:\nWhen in the speed loop control mode, P04-00 is set at 3.\nThe corresponding input ports  are defined as 13, 14, 15.\nThe switching of internal speed is achieved by setting the input port function to 13, 14, 15 on-off state combination. The switching relationship is shown in the below table \nDI13 DI14 DI15 作用参数\n0 0 0 P04-30\n1 0 0 P04-31\n0 1 0 P04-32\n1 1 0 P04-33\n0 0 1 P04-34\n1 0 1 P04-35\n0 1 1 P04-36\n1 1 1 P04-37",
-                    "Symbol": "True",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P04-38": {
-                    "Code": "P04-38",
-                    "Name": "Keep",
-                    "setting": "0",
-                    "Setting_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "Setting_way": "",
-                    "ChangeCondition": "",
-                    "Address": "0x01B6",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P04-39": {
-                    "Code": "P04-39",
-                    "Name": "Keep",
-                    "setting": "0",
-                    "Setting_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "Setting_way": "",
-                    "ChangeCondition": "",
-                    "Address": "0x01B7",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P04-40": {
-                    "Code": "P04-40",
-                    "Name": "Keep",
-                    "setting": "0",
-                    "Setting_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "Setting_way": "",
-                    "ChangeCondition": "",
-                    "Address": "0x01B8",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P04-41": {
-                    "Code": "P04-41",
-                    "Name": "Keep",
-                    "setting": "0",
-                    "Setting_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "Setting_way": "",
-                    "ChangeCondition": "",
-                    "Address": "0x01B9",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P04-42": {
-                    "Code": "P04-42",
-                    "Name": "Keep",
-                    "setting": "0",
-                    "Setting_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "Setting_way": "",
-                    "ChangeCondition": "",
-                    "Address": "0x01BA",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P04-43": {
-                    "Code": "P04-43",
-                    "Name": "Keep",
-                    "setting": "0",
-                    "Setting_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "Setting_way": "",
-                    "ChangeCondition": "",
-                    "Address": "0x01BB",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P04-44": {
-                    "Code": "P04-44",
-                    "Name": "Keep",
-                    "setting": "0",
-                    "Setting_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "Setting_way": "",
-                    "ChangeCondition": "",
-                    "Address": "0x01BC",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P04-45": {
-                    "Code": "P04-45",
-                    "Name": "Keep",
-                    "setting": "0",
-                    "Setting_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "Setting_way": "",
-                    "ChangeCondition": "",
-                    "Address": "0x01BD",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P04-46": {
-                    "Code": "P04-46",
-                    "Name": "Keep",
-                    "setting": "0",
-                    "Setting_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "Setting_way": "",
-                    "ChangeCondition": "",
-                    "Address": "0x01BE",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P04-47": {
-                    "Code": "P04-47",
-                    "Name": "Keep",
-                    "setting": "0",
-                    "Setting_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "Setting_way": "",
-                    "ChangeCondition": "",
-                    "Address": "0x01BF",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P04-48": {
-                    "Code": "P04-48",
-                    "Name": "Keep",
-                    "setting": "0",
-                    "Setting_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "Setting_way": "",
-                    "ChangeCondition": "",
-                    "Address": "0x01C0",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P04-49": {
-                    "Code": "P04-49",
-                    "Name": "Keep",
-                    "setting": "0",
-                    "Setting_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "Setting_way": "",
-                    "ChangeCondition": "",
-                    "Address": "0x01C1",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P04-50": {
-                    "Code": "P04-50",
-                    "Name": "Keep",
-                    "setting": "0",
-                    "Setting_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "Setting_way": "",
-                    "ChangeCondition": "",
-                    "Address": "0x01C2",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P04-51": {
-                    "Code": "P04-51",
-                    "Name": "Motor zero speed detection delay",
-                    "setting": "0",
-                    "Setting_range": "0-100",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x01C3",
-                    "Min": "0",
-                    "Max": "100",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "10",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P04-52": {
-                    "Code": "P04-52",
-                    "Name": "Instruction pulse zero speed detection delay",
-                    "setting": "0",
-                    "Setting_range": "0-100",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x01C4",
-                    "Min": "0",
-                    "Max": "100",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "10",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P04-53": {
-                    "Code": "P04-53",
-                    "Name": "Internal speed measurement comparison and switching threshold",
-                    "setting": "0",
-                    "Setting_range": "0-32767",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x01C5",
-                    "Min": "0",
-                    "Max": "32767",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "10",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                }
-            },
-            "P05_Torque_parameters": {
-                "P05-00": {
-                    "Code": "P05-00",
-                    "Name": "Torque command source",
-                    "setting": "0",
-                    "set_range": "0-3",
-                    "Default": "0",
-                    "Unit": "---",
-                    "setting_way": "Shutdown setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x01F4",
-                    "Min": "0",
-                    "Max": "3",
-                    "Description": "0: external analog instruction (speed limit amplitude set by P05-02)\n\n1: digital instruction (speed limit amplitude set by P05-02)\n\n2: external analog instruction (speed limit amplitude determined by speed analog instruction).\n\n3: digital instruction (speed limit amplitude determined by speed analog instruction).",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "True",
-                    "Keep": "true"
-                },
-                "P05-01": {
-                    "Code": "P05-01",
-                    "Name": "Torque command analog quantity inverse",
-                    "setting": "0",
-                    "set_range": "0-1",
-                    "Default": "0",
-                    "Unit": "---",
-                    "setting_way": "Shutdown setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x01F5",
-                    "Min": "0",
-                    "Max": "1",
-                    "Description": "Used to adjust torque direction\n\n0: normal\n\n1: direction reversal",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "True",
-                    "Keep": "true"
-                },
-                "P05-02": {
-                    "Code": "P05-02",
-                    "Name": "Torque mode speed limiter set value",
-                    "setting": "1500",
-                    "set_range": "0-6000",
-                    "Default": "1500",
-                    "Unit": "1rpm",
-                    "setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x01F6",
-                    "Min": "0",
-                    "Max": "6000",
-                    "Description": "Set range: 0- maximum speed, unit: RPM\n\nSetting the maximum speed of motor in torque mode to prevent mechanical damage caused by high speed of motor in no-load condition\n\nTorque control mode effective",
-                    "Symbol": "True",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P05-03": {
-                    "Code": "P05-03",
-                    "Name": "Keep",
-                    "setting": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "setting_way": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x01F7",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P05-04": {
-                    "Code": "P05-04",
-                    "Name": "Keep",
-                    "setting": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "setting_way": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x01F8",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P05-05": {
-                    "Code": "P05-05",
-                    "Name": "Torque limiting setting source",
-                    "setting": "0",
-                    "set_range": "0-1",
-                    "Default": "0",
-                    "Unit": "---",
-                    "setting_way": "Shutdown setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x01F9",
-                    "Min": "0",
-                    "Max": "1",
-                    "Description": "Source for adjusting torque limiting amplitude\n\n0: internal digital quantity (set by P05-10, P05-11 or P05-12, P05-13)\n\n1: external analog (T-REF input from external analog input). In this mode, the amplitude of the positive and negative directions is the same.",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "True",
-                    "Keep": "true"
-                },
-                "P05-06": {
-                    "Code": "P05-06",
-                    "Name": "Torque limit detection output delay",
-                    "setting": "0",
-                    "set_range": "0-10000",
-                    "Default": "0",
-                    "Unit": "ms",
-                    "setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x01FA",
-                    "Min": "0",
-                    "Max": "10000",
-                    "Description": "Set range: 0-10000, unit: ms\n\nSet DO port output torque limit to detect delay time of output signal.",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P05-07": {
-                    "Code": "P05-07",
-                    "Name": "keep",
-                    "setting": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "setting_way": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x01FB",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P05-08": {
-                    "Code": "P05-08",
-                    "Name": "keep",
-                    "setting": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "setting_way": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x01FC",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P05-09": {
-                    "Code": "P05-09",
-                    "Name": "keep",
-                    "setting": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "setting_way": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x01FD",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P05-10": {
-                    "Code": "P05-10",
-                    "Name": "Internal forward torque limiting amplitude",
-                    "setting": "200",
-                    "set_range": "0-300.0",
-                    "Default": "200.0",
-                    "Unit": "",
-                    "setting_way": "operation setting",
-                    "ChangeCondition": "immediate",
-                    "Address": "0x01FE",
-                    "Min": "0",
-                    "Max": "300.0",
-                    "Description": "Setting range: 0-300.0, unit: 1%\n\nLimit the positive output of motor, 100 indicates 1 times torque, 300 indicates 3 times torque.\n\nWhen the torque output reaches the limit value, the output signal can be detected through the output torque limit of the DO port.",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "1",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "false"
-                },
-                "P05-11": {
-                    "Code": "P05-11",
-                    "Name": "Internal reverse torque limiting amplitude",
-                    "setting": "-200",
-                    "set_range": "-300.0-0",
-                    "Default": "-200.0",
-                    "Unit": "",
-                    "setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x01FF",
-                    "Min": "-300.0",
-                    "Max": "0",
-                    "Description": "Setting range: 0-300.0, unit: 1%\n\nLimit motor reverse output, 100 represents 1 times torque, 300 indicates 3 times torque.\n\nWhen the torque output reaches the limit value, the output signal can be detected through the output torque limit of the DO port.",
-                    "Symbol": "True",
-                    "Demical_Place": "1",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "false"
-                },
-                "P05-12": {
-                    "Code": "P05-12",
-                    "Name": "External positive torque limiting amplitude",
-                    "setting": "100.0",
-                    "set_range": "0-300.0",
-                    "Default": "100.0",
-                    "Unit": "",
-                    "setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0200",
-                    "Min": "0",
-                    "Max": "300.0",
-                    "Description": "Setting range: 0-300.0, unit: 1%\n\nThis function needs to be switched using an external input port in CN1, and the selected DI port input port function selection is set to 7 (forward side external torque limit). Controlling the logical state of the port can switch the control mode.\n\n\n\nTerminal logic    torque limit amplitude\n\nEffective    external limiting amplitude P05-12\n\nInvalid     internal limiting amplitude P05-10\n\n\n\nIf the DI function is not allocated, the default torque limit of the system is P05-10.\n\nWhen the torque output reaches the limit value, the output signal can be detected through the output torque limit of the DO port.",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "1",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P05-13": {
-                    "Code": "P05-13",
-                    "Name": "External reverse torque limit amplitude",
-                    "setting": "-100.0",
-                    "set_range": "-300.0-0",
-                    "Default": "-100.0",
-                    "Unit": "",
-                    "setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0201",
-                    "Min": "-300.0",
-                    "Max": "0",
-                    "Description": "Setting range: 0-300.0, unit: 1%\n\nThis function needs to be switched using an external input port in CN1, and the selected DI port input port function selection is set to 8 (Reverse Side External Torque Limit). Controlling the logical state of the port can switch the control mode.\n\n\n\nTerminal   logic torque limit amplitude\n\nEffective   external limiting amplitude P05-13\n\nInvalid   internal limiting amplitude P05-11\n\n\n\nIf the DI function is not allocated, the default torque limit of the system is P05-11.\n\nWhen the torque output reaches the limit value, the output signal can be detected through the output torque limit of the DO port.\nReport errors",
-                    "Symbol": "True",
-                    "Demical_Place": "1",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P05-14": {
-                    "Code": "P05-14",
-                    "Name": "Keep",
-                    "setting": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "setting_way": "",
-                    "ChangeCondition": "",
-                    "Address": "0x0202",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "",
-                    "Demical_Place": "",
-                    "Permission": "0",
-                    "Shutdown_setting": "",
-                    "Keep": "true"
-                },
-                "P05-15": {
-                    "Code": "P05-15",
-                    "Name": "Keep",
-                    "setting": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "setting_way": "",
-                    "ChangeCondition": "",
-                    "Address": "0x0203",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "",
-                    "Demical_Place": "",
-                    "Permission": "0",
-                    "Shutdown_setting": "",
-                    "Keep": "true"
-                },
-                "P05-16": {
-                    "Code": "P05-16",
-                    "Name": "Keep",
-                    "setting": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "setting_way": "",
-                    "ChangeCondition": "",
-                    "Address": "0x0204",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "",
-                    "Demical_Place": "",
-                    "Permission": "0",
-                    "Shutdown_setting": "",
-                    "Keep": "true"
-                },
-                "P05-17": {
-                    "Code": "P05-17",
-                    "Name": "Keep",
-                    "setting": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "setting_way": "",
-                    "ChangeCondition": "",
-                    "Address": "0x0205",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "",
-                    "Demical_Place": "",
-                    "Permission": "0",
-                    "Shutdown_setting": "",
-                    "Keep": "true"
-                },
-                "P05-18": {
-                    "Code": "P05-18",
-                    "Name": "Keep",
-                    "setting": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "setting_way": "",
-                    "ChangeCondition": "",
-                    "Address": "0x0206",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "",
-                    "Demical_Place": "",
-                    "Permission": "0",
-                    "Shutdown_setting": "",
-                    "Keep": "true"
-                },
-                "P05-19": {
-                    "Code": "P05-19",
-                    "Name": "Keep",
-                    "setting": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "setting_way": "",
-                    "ChangeCondition": "",
-                    "Address": "0x0207",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "",
-                    "Demical_Place": "",
-                    "Permission": "0",
-                    "Shutdown_setting": "",
-                    "Keep": "true"
-                },
-                "P05-20": {
-                    "Code": "P05-20",
-                    "Name": "Keep",
-                    "setting": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "setting_way": "",
-                    "ChangeCondition": "",
-                    "Address": "0x0208",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "",
-                    "Demical_Place": "",
-                    "Permission": "0",
-                    "Shutdown_setting": "",
-                    "Keep": "true"
-                },
-                "P05-21": {
-                    "Code": "P05-21",
-                    "Name": "Keep",
-                    "setting": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "setting_way": "",
-                    "ChangeCondition": "",
-                    "Address": "0x0209",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "",
-                    "Demical_Place": "",
-                    "Permission": "0",
-                    "Shutdown_setting": "",
-                    "Keep": "true"
-                },
-                "P05-22": {
-                    "Code": "P05-22",
-                    "Name": "Keep",
-                    "setting": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "setting_way": "",
-                    "ChangeCondition": "",
-                    "Address": "0x020A",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "",
-                    "Demical_Place": "",
-                    "Permission": "0",
-                    "Shutdown_setting": "",
-                    "Keep": "true"
-                },
-                "P05-23": {
-                    "Code": "P05-23",
-                    "Name": "Keep",
-                    "setting": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "setting_way": "",
-                    "ChangeCondition": "",
-                    "Address": "0x020B",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "",
-                    "Demical_Place": "",
-                    "Permission": "0",
-                    "Shutdown_setting": "",
-                    "Keep": "true"
-                },
-                "P05-24": {
-                    "Code": "P05-24",
-                    "Name": "Keep",
-                    "setting": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "setting_way": "",
-                    "ChangeCondition": "",
-                    "Address": "0x020C",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "",
-                    "Demical_Place": "",
-                    "Permission": "0",
-                    "Shutdown_setting": "",
-                    "Keep": "true"
-                },
-                "P05-25": {
-                    "Code": "P05-25",
-                    "Name": "Keep",
-                    "setting": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "setting_way": "",
-                    "ChangeCondition": "",
-                    "Address": "0x020D",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "",
-                    "Demical_Place": "",
-                    "Permission": "0",
-                    "Shutdown_setting": "",
-                    "Keep": "true"
-                },
-                "P05-26": {
-                    "Code": "P05-26",
-                    "Name": "Keep",
-                    "setting": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "setting_way": "",
-                    "ChangeCondition": "",
-                    "Address": "0x020E",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "",
-                    "Demical_Place": "",
-                    "Permission": "0",
-                    "Shutdown_setting": "",
-                    "Keep": "true"
-                },
-                "P05-27": {
-                    "Code": "P05-27",
-                    "Name": "Keep",
-                    "setting": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "setting_way": "",
-                    "ChangeCondition": "",
-                    "Address": "0x020F",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "",
-                    "Demical_Place": "",
-                    "Permission": "0",
-                    "Shutdown_setting": "",
-                    "Keep": "true"
-                },
-                "P05-28": {
-                    "Code": "P05-28",
-                    "Name": "Keep",
-                    "setting": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "setting_way": "",
-                    "ChangeCondition": "",
-                    "Address": "0x0210",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "",
-                    "Demical_Place": "",
-                    "Permission": "0",
-                    "Shutdown_setting": "",
-                    "Keep": "true"
-                },
-                "P05-29": {
-                    "Code": "P05-29",
-                    "Name": "Keep",
-                    "setting": "",
-                    "set_range": "-",
-                    "Default": "",
-                    "Unit": "",
-                    "setting_way": "",
-                    "ChangeCondition": "",
-                    "Address": "0x0211",
-                    "Min": "",
-                    "Max": "",
-                    "Description": "",
-                    "Symbol": "",
-                    "Demical_Place": "",
-                    "Permission": "0",
-                    "Shutdown_setting": "",
-                    "Keep": "true"
-                },
-                "P05-30": {
-                    "Code": "P05-30",
-                    "Name": "U phase current offset",
-                    "setting": "0",
-                    "set_range": "-512-512",
-                    "Default": "0",
-                    "Unit": "---",
-                    "setting_way": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x0212",
-                    "Min": "-512",
-                    "Max": "512",
-                    "Description": "---",
-                    "Symbol": "True",
-                    "Demical_Place": "0",
-                    "Permission": "10",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P05-31": {
-                    "Code": "P05-31",
-                    "Name": "WPhase current offset",
-                    "setting": "0",
-                    "set_range": "-512-512",
-                    "Default": "0",
-                    "Unit": "---",
-                    "setting_way": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x0213",
-                    "Min": "-512",
-                    "Max": "512",
-                    "Description": "---",
-                    "Symbol": "True",
-                    "Demical_Place": "0",
-                    "Permission": "10",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                }
-            },
-            "P06_IO_parameters": {
-                "P06-00": {
-                    "Code": "P06-00",
-                    "Name": "DI1 input port effective electrical level",
-                    "Set": "1",
-                    "set_range": "0-4",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "REpower",
-                    "Address": "0x0258",
-                    "Min": "0",
-                    "Max": "4",
-                    "Description": "Set range: 0-4, factory settings: 0\n\nSet the valid input of the DI1 input port of CN1.\n\n0: low level active (optical coupler).\n\n1: stands for high level efficiency (optocoupler cut-off).\n\n2: rising edge effective\n\n3: falling edge effective\n\n4: rising and falling edge are all effective.",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "false"
-                },
-                "P06-01": {
-                    "Code": "P06-01",
-                    "Name": "DI1 input port function selection (servo ON)",
-                    "Set": "1",
-                    "set_range": "0-24",
-                    "Default": "1",
-                    "Unit": "---",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "REpower",
-                    "Address": "0x0259",
-                    "Min": "0",
-                    "Max": "24",
-                    "Description": "Set range: 0-18, factory settings: 1\n\nSet the function of CN1's DI1 input port.\n\n0: pins invalid\n\n1: servo ON\n\n2: alarm clearance\n\n3: forward overshoot signal input\n\n4: reverse overshoot signal input\n\n5: control mode switching\n\n6:P action instruction input\n\n7: positive external torque limitation.\n\n8: reverse side torque limit.\n\n9: gain switching input\n\n10: zero position fixed input\n\n11: instruction pulse prohibit input\n\n12: encoder absolute value data input\n\n13: internal setting speed switching input 1\n\n14: internal setting speed switching input 2\n\n15: internal setting speed switching input 3\n\n16: location command zero input\n\n17: magnetic pole detection input\n\n18: instruction pulse input multiplying switching input\n\n19: Longmen mobile enabling\n\n20: Longmen counterpoint zero clearing signal\n\n21: origin switch signal\n\n22: origin return to start signal\n\n23: speed analog command direction input\n\n24: torque analog instruction direction input",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P06-02": {
-                    "Code": "P06-02",
-                    "Name": "Effective level of DI2 input port",
-                    "Set": "0",
-                    "set_range": "0-4",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "REpower",
-                    "Address": "0x025A",
-                    "Min": "0",
-                    "Max": "4",
-                    "Description": "Set range: 0-4, factory settings: 0\n\nSet the valid input of the DI1 input port of CN1.\n\n0: low level active (optical coupler).\n\n1: stands for high level efficiency (optocoupler cut-off).\n\n2: rising edge effective\n\n3: falling edge effective\n\n4: rising and falling edge are all effective.",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P06-03": {
-                    "Code": "P06-03",
-                    "Name": "DI2 input port function selection (alarm clear)",
-                    "Set": "2",
-                    "set_range": "0-24",
-                    "Default": "2",
-                    "Unit": "---",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "REpower",
-                    "Address": "0x025B",
-                    "Min": "0",
-                    "Max": "24",
-                    "Description": "设定范围：0-18，出厂设置：1\n设定CN1的DI1输入端口的功能\n0：管脚无效 \n1：伺服ON\n2：报警清除\n3：正向超程信号输入\n4：反向超程信号输入\n5：控制模式切换\n6：P动作指令输入\n7：正转侧外部转矩限制\n8：反转侧外部转矩限制\n9：增益切换输入\n10：零位固定输入\n11：指令脉冲禁止输入\n12：编码器绝对值数据要求输入\n13：内部设定速度切换输入1\n14：内部设定速度切换输入2\n15：内部设定速度切换输入3\n16：位置命令清零输入\n17：磁极检出输入\n18：指令脉冲输入倍率切换输入\n19：龙门同动使能\n20：龙门对位清零信号\n21：原点开关信号\n22：原点复归启动信号\n23：速度模拟指令方向输入\n24：转矩模拟指令方向输入",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P06-04": {
-                    "Code": "P06-04",
-                    "Name": "Effective level  of DI3 input port",
-                    "Set": "0",
-                    "set_range": "0-4",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "REpower",
-                    "Address": "0x025C",
-                    "Min": "0",
-                    "Max": "4",
-                    "Description": "Set range: 0-4, factory settings: 0\n\nSet the valid input of the DI1 input port of CN1.\n\n0: low level active (optical coupler).\n\n1: stands for high level efficiency (optocoupler cut-off).\n\n2: rising edge effective\n\n3: falling edge effective\n\n4: rising and falling edge are all effective.",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P06-05": {
-                    "Code": "P06-05",
-                    "Name": "Function selection of DI3 input port (forward overshoot)",
-                    "Set": "3",
-                    "set_range": "0-24",
-                    "Default": "3",
-                    "Unit": "---",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "REpower",
-                    "Address": "0x025D",
-                    "Min": "0",
-                    "Max": "24",
-                    "Description": "设定范围：0-18，出厂设置：1\n设定CN1的DI1输入端口的功能\n0：管脚无效 \n1：伺服ON\n2：报警清除\n3：正向超程信号输入\n4：反向超程信号输入\n5：控制模式切换\n6：P动作指令输入\n7：正转侧外部转矩限制\n8：反转侧外部转矩限制\n9：增益切换输入\n10：零位固定输入\n11：指令脉冲禁止输入\n12：编码器绝对值数据要求输入\n13：内部设定速度切换输入1\n14：内部设定速度切换输入2\n15：内部设定速度切换输入3\n16：位置命令清零输入\n17：磁极检出输入\n18：指令脉冲输入倍率切换输入\n19：龙门同动使能\n20：龙门对位清零信号\n21：原点开关信号\n22：原点复归启动信号\n23：速度模拟指令方向输入\n24：转矩模拟指令方向输入",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P06-06": {
-                    "Code": "P06-06",
-                    "Name": "DI4 input port effective level",
-                    "Set": "0",
-                    "set_range": "0-4",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "REpower",
-                    "Address": "0x025E",
-                    "Min": "0",
-                    "Max": "4",
-                    "Description": "Set range: 0-4, factory settings: 0\n\nSet the valid input of the DI1 input port of CN1.\n\n0: low level active (optical coupler).\n\n1: stands for high level efficiency (optocoupler cut-off).\n\n2: rising edge effective\n\n3: falling edge effective\n\n4: rising and falling edge are all effective.",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P06-07": {
-                    "Code": "P06-07",
-                    "Name": "DI4 input port function selection (reverse overrun)",
-                    "Set": "4",
-                    "set_range": "0-24",
-                    "Default": "4",
-                    "Unit": "---",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "REpower",
-                    "Address": "0x025F",
-                    "Min": "0",
-                    "Max": "24",
-                    "Description": "Set range: 0-18, factory settings: 1\n\nSet the function of CN1's DI1 input port.\n\n0: pins invalid\n\n1: servo ON\n\n2: alarm clearance\n\n3: forward overshoot signal input\n\n4: reverse overshoot signal input\n\n5: control mode switching\n\n6:P action instruction input\n\n7: positive external torque limitation.\n\n8: reverse side torque limit.\n\n9: gain switching input\n\n10: zero position fixed input\n\n11: instruction pulse prohibit input\n\n12: encoder absolute value data input\n\n13: internal setting speed switching input 1\n\n14: internal setting speed switching input 2\n\n15: internal setting speed switching input 3\n\n16: location command zero input\n\n17: magnetic pole detection input\n\n18: instruction pulse input multiplying switching input\n\n19: Longmen mobile enabling\n\n20: Longmen counterpoint zero clearing signal\n\n21: origin switch signal\n\n22: origin return to start signal\n\n23: speed analog command direction input\n\n24: torque analog instruction direction input",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P06-08": {
-                    "Code": "P06-08",
-                    "Name": "DI5 input port effective level",
-                    "Set": "0",
-                    "set_range": "0-4",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "REpower",
-                    "Address": "0x0260",
-                    "Min": "0",
-                    "Max": "4",
-                    "Description": "Set range: 0-4, factory settings: 0\n\nSet the valid input of the DI1 input port of CN1.\n\n0: low level active (optical coupler).\n\n1: stands for high level efficiency (optocoupler cut-off).\n\n2: rising edge effective\n\n3: falling edge effective\n\n4: rising and falling edge are all effective.",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P06-09": {
-                    "Code": "P06-09",
-                    "Name": "DI5 input port function selection (positive external torque limit)",
-                    "Set": "7",
-                    "set_range": "0-24",
-                    "Default": "7",
-                    "Unit": "---",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "REpower",
-                    "Address": "0x0261",
-                    "Min": "0",
-                    "Max": "24",
-                    "Description": "Set range: 0-18, factory settings: 1\n\nSet the function of CN1's DI1 input port.\n\n0: pins invalid\n\n1: servo ON\n\n2: alarm clearance\n\n3: forward overshoot signal input\n\n4: reverse overshoot signal input\n\n5: control mode switching\n\n6:P action instruction input\n\n7: positive external torque limitation.\n\n8: reverse side torque limit.\n\n9: gain switching input\n\n10: zero position fixed input\n\n11: instruction pulse prohibit input\n\n12: encoder absolute value data input\n\n13: internal setting speed switching input 1\n\n14: internal setting speed switching input 2\n\n15: internal setting speed switching input 3\n\n16: location command zero input\n\n17: magnetic pole detection input\n\n18: instruction pulse input multiplying switching input\n\n19: Longmen mobile enabling\n\n20: Longmen counterpoint zero clearing signal\n\n21: origin switch signal\n\n22: origin return to start signal\n\n23: speed analog command direction input\n\n24: torque analog instruction direction input",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P06-10": {
-                    "Code": "P06-10",
-                    "Name": "DI6 input port effective level",
-                    "Set": "0",
-                    "set_range": "0-4",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "REpower",
-                    "Address": "0x0262",
-                    "Min": "0",
-                    "Max": "4",
-                    "Description": "Set range: 0-4, factory settings: 0\n\nSet the valid input of the DI1 input port of CN1.\n\n0: low level active (optical coupler).\n\n1: stands for high level efficiency (optocoupler cut-off).\n\n2: rising edge effective\n\n3: falling edge effective\n\n4: rising and falling edge are all effective.",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P06-11": {
-                    "Code": "P06-11",
-                    "Name": "DI6 input port function selection (reverse side external torque limit)",
-                    "Set": "8",
-                    "set_range": "0-24",
-                    "Default": "8",
-                    "Unit": "---",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "REpower",
-                    "Address": "0x0263",
-                    "Min": "0",
-                    "Max": "24",
-                    "Description": "Set range: 0-18, factory settings: 1\n\nSet the function of CN1's DI1 input port.\n\n0: pins invalid\n\n1: servo ON\n\n2: alarm clearance\n\n3: forward overshoot signal input\n\n4: reverse overshoot signal input\n\n5: control mode switching\n\n6:P action instruction input\n\n7: positive external torque limitation.\n\n8: reverse side torque limit.\n\n9: gain switching input\n\n10: zero position fixed input\n\n11: instruction pulse prohibit input\n\n12: encoder absolute value data input\n\n13: internal setting speed switching input 1\n\n14: internal setting speed switching input 2\n\n15: internal setting speed switching input 3\n\n16: location command zero input\n\n17: magnetic pole detection input\n\n18: instruction pulse input multiplying switching input\n\n19: Longmen mobile enabling\n\n20: Longmen counterpoint zero clearing signal\n\n21: origin switch signal\n\n22: origin return to start signal\n\n23: speed analog command direction input\n\n24: torque analog instruction direction input",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P06-12": {
-                    "Code": "P06-12",
-                    "Name": "DI7 input port effective level",
-                    "Set": "0",
-                    "set_range": "0-4",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "REpower",
-                    "Address": "0x0264",
-                    "Min": "0",
-                    "Max": "4",
-                    "Description": "Set range: 0-4, factory settings: 0\n\nSet the valid input of the DI1 input port of CN1.\n\n0: low level active (optical coupler).\n\n1: stands for high level efficiency (optocoupler cut-off).\n\n2: rising edge effective\n\n3: falling edge effective\n\n4: rising and falling edge are all effective.",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P06-13": {
-                    "Code": "P06-13",
-                    "Name": "DI7 input port function selection (control mode switching)",
-                    "Set": "5",
-                    "set_range": "0-24",
-                    "Default": "5",
-                    "Unit": "---",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "REpower",
-                    "Address": "0x0265",
-                    "Min": "0",
-                    "Max": "24",
-                    "Description": "Set range: 0-18, factory settings: 1\n\nSet the function of CN1's DI1 input port.\n\n0: pins invalid\n\n1: servo ON\n\n2: alarm clearance\n\n3: forward overshoot signal input\n\n4: reverse overshoot signal input\n\n5: control mode switching\n\n6:P action instruction input\n\n7: positive external torque limitation.\n\n8: reverse side torque limit.\n\n9: gain switching input\n\n10: zero position fixed input\n\n11: instruction pulse prohibit input\n\n12: encoder absolute value data input\n\n13: internal setting speed switching input 1\n\n14: internal setting speed switching input 2\n\n15: internal setting speed switching input 3\n\n16: location command zero input\n\n17: magnetic pole detection input\n\n18: instruction pulse input multiplying switching input\n\n19: Longmen mobile enabling\n\n20: Longmen counterpoint zero clearing signal\n\n21: origin switch signal\n\n22: origin return to start signal\n\n23: speed analog command direction input\n\n24: torque analog instruction direction input",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P06-14": {
-                    "Code": "P06-14",
-                    "Name": "Keep",
-                    "Set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "只读",
-                    "Address": "0x0266",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P06-15": {
-                    "Code": "P06-15",
-                    "Name": "Keep",
-                    "Set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "只读",
-                    "Address": "0x0267",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P06-16": {
-                    "Code": "P06-16",
-                    "Name": "Effective level of DI8 input port",
-                    "Set": "0",
-                    "set_range": "0-4",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "REpower",
-                    "Address": "0x0268",
-                    "Min": "0",
-                    "Max": "4",
-                    "Description": "Set range: 0-4, factory settings: 0\n\nSet the valid input of the DI1 input port of CN1.\n\n0: low level active (optical coupler).\n\n1: stands for high level efficiency (optocoupler cut-off).\n\n2: rising edge effective\n\n3: falling edge effective\n\n4: rising and falling edge are all effective.",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P06-17": {
-                    "Code": "P06-17",
-                    "Name": "Function selection of DI8 input port",
-                    "Set": "16",
-                    "set_range": "0-24",
-                    "Default": "16",
-                    "Unit": "---",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "REpower",
-                    "Address": "0x0269",
-                    "Min": "0",
-                    "Max": "24",
-                    "Description": "Set range: 0-18, factory settings: 1\n\nSet the function of CN1's DI1 input port.\n\n0: pins invalid\n\n1: servo ON\n\n2: alarm clearance\n\n3: forward overshoot signal input\n\n4: reverse overshoot signal input\n\n5: control mode switching\n\n6:P action instruction input\n\n7: positive external torque limitation.\n\n8: reverse side torque limit.\n\n9: gain switching input\n\n10: zero position fixed input\n\n11: instruction pulse prohibit input\n\n12: encoder absolute value data input\n\n13: internal setting speed switching input 1\n\n14: internal setting speed switching input 2\n\n15: internal setting speed switching input 3\n\n16: location command zero input\n\n17: magnetic pole detection input\n\n18: instruction pulse input multiplying switching input\n\n19: Longmen mobile enabling\n\n20: Longmen counterpoint zero clearing signal\n\n21: origin switch signal\n\n22: origin return to start signal\n\n23: speed analog command direction input\n\n24: torque analog instruction direction input",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P06-18": {
-                    "Code": "P06-18",
-                    "Name": "Keep",
-                    "Set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x026A",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P06-19": {
-                    "Code": "P06-19",
-                    "Name": "Keep",
-                    "Set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x026B",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P06-20": {
-                    "Code": "P06-20",
-                    "Name": "DO1 output port effective level",
-                    "Set": "1",
-                    "set_range": "0-1",
-                    "Default": "1",
-                    "Unit": "---",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "REpower",
-                    "Address": "0x026C",
-                    "Min": "0",
-                    "Max": "1",
-                    "Description": "Set range: 0-1, factory settings: 1\n\n0: when the state is valid, optocoupler cut-off.\n\n1: when the state is valid, the optical coupler turns on.",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "false"
-                },
-                "P06-21": {
-                    "Code": "P06-21",
-                    "Name": "DO1 output port function selection (servo ready)",
-                    "Set": "3",
-                    "set_range": "0-3",
-                    "Default": "3",
-                    "Unit": "---",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "REpower",
-                    "Address": "0x026D",
-                    "Min": "0",
-                    "Max": "3",
-                    "Description": "Set range: 0-11, factory settings: 3\n\n0: pins invalid\n\n1: alarm output\n\n2: brake opening output\n\n3: servo ready output\n\n4: positioning and output.\n\n5: positioning close to output\n\n6: speed consistent output\n\n7: Motor zero speed output\n\n8: torque limit detection output\n\n9: speed limit detection output\n\n10: warning output\n\n11: instruction pulse input rate switching output.\n\n12: origin regression completes output.\n\n13: Electrical origin regression completes output.",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P06-22": {
-                    "Code": "P06-22",
-                    "Name": "DO2 output port effective level",
-                    "Set": "1",
-                    "set_range": "0-1",
-                    "Default": "1",
-                    "Unit": "---",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "REpower",
-                    "Address": "0x026E",
-                    "Min": "0",
-                    "Max": "1",
-                    "Description": "Set range: 0-1, factory settings: 1\n\n0: when the state is valid, optocoupler cut-off.\n\n1: when the state is valid, the optical coupler turns on.",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "false"
-                },
-                "P06-23": {
-                    "Code": "P06-23",
-                    "Name": "Function selection of DO2 output port  (brand-type brake open)",
-                    "Set": "2",
-                    "set_range": "0-2",
-                    "Default": "2",
-                    "Unit": "---",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "REpower",
-                    "Address": "0x026F",
-                    "Min": "0",
-                    "Max": "2",
-                    "Description": "Set range: 0-11, factory settings: 3\n\n0: pins invalid\n\n1: alarm output\n\n2: brake opening output\n\n3: servo ready output\n\n4: positioning and output.\n\n5: positioning close to output\n\n6: speed consistent output\n\n7: Motor zero speed output\n\n8: torque limit detection output\n\n9: speed limit detection output\n\n10: warning output\n\n11: instruction pulse input rate switching output.\n\n12: origin regression completes output.\n\n13: Electrical origin regression completes output.",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P06-24": {
-                    "Code": "P06-24",
-                    "Name": "DO3 output port effective level",
-                    "Set": "1",
-                    "set_range": "0-1",
-                    "Default": "1",
-                    "Unit": "---",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "REpower",
-                    "Address": "0x0270",
-                    "Min": "0",
-                    "Max": "1",
-                    "Description": "Set range: 0-1, factory settings: 1\n\n0: when the state is valid, optocoupler cut-off.\n\n1: when the state is valid, the optical coupler turns on.",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P06-25": {
-                    "Code": "P06-25",
-                    "Name": "DO3 output port function selection (alarm output)",
-                    "Set": "1",
-                    "set_range": "0-1",
-                    "Default": "1",
-                    "Unit": "---",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "REpower",
-                    "Address": "0x0271",
-                    "Min": "0",
-                    "Max": "1",
-                    "Description": "Set range: 0-11, factory settings: 3\n\n0: pins invalid\n\n1: alarm output\n\n2: brake opening output\n\n3: servo ready output\n\n4: positioning and output.\n\n5: positioning close to output\n\n6: speed consistent output\n\n7: Motor zero speed output\n\n8: torque limit detection output\n\n9: speed limit detection output\n\n10: warning output\n\n11: instruction pulse input rate switching output.\n\n12: origin regression completes output.\n\n13: Electrical origin regression completes output.",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P06-26": {
-                    "Code": "P06-26",
-                    "Name": "DO4 output port effective level",
-                    "Set": "1",
-                    "set_range": "0-1",
-                    "Default": "1",
-                    "Unit": "---",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "REpower",
-                    "Address": "0x0272",
-                    "Min": "0",
-                    "Max": "1",
-                    "Description": "Set range: 0-1, factory settings: 1\n\n0: when the state is valid, optocoupler cut-off.\n\n1: when the state is valid, the optical coupler turns on.",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P06-27": {
-                    "Code": "P06-27",
-                    "Name": "DO4 output port function selection (location complete)",
-                    "Set": "4",
-                    "set_range": "0-4",
-                    "Default": "4",
-                    "Unit": "---",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "REpower",
-                    "Address": "0x0273",
-                    "Min": "0",
-                    "Max": "4",
-                    "Description": "Set range: 0-11, factory settings: 3\n\n0: pins invalid\n\n1: alarm output\n\n2: brake opening output\n\n3: servo ready output\n\n4: positioning and output.\n\n5: positioning close to output\n\n6: speed consistent output\n\n7: Motor zero speed output\n\n8: torque limit detection output\n\n9: speed limit detection output\n\n10: warning output\n\n11: instruction pulse input rate switching output.\n\n12: origin regression completes output.\n\n13: Electrical origin regression completes output.",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P06-28": {
-                    "Code": "P06-28",
-                    "Name": "DO5 output port effective level",
-                    "Set": "1",
-                    "set_range": "0-1",
-                    "Default": "1",
-                    "Unit": "---",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "REpower",
-                    "Address": "0x0274",
-                    "Min": "0",
-                    "Max": "1",
-                    "Description": "Set range: 0-1, factory settings: 1\n\n0: when the state is valid, optocoupler cut-off.\n\n1: when the state is valid, the optical coupler turns on.",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P06-29": {
-                    "Code": "P06-29",
-                    "Name": "DO5 output port function selection (torque limit detection)",
-                    "Set": "8",
-                    "set_range": "0-8",
-                    "Default": "8",
-                    "Unit": "---",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "REpower",
-                    "Address": "0x0275",
-                    "Min": "0",
-                    "Max": "8",
-                    "Description": "Set range: 0-11, factory settings: 3\n\n0: pins invalid\n\n1: alarm output\n\n2: brake opening output\n\n3: servo ready output\n\n4: positioning and output.\n\n5: positioning close to output\n\n6: speed consistent output\n\n7: Motor zero speed output\n\n8: torque limit detection output\n\n9: speed limit detection output\n\n10: warning output\n\n11: instruction pulse input rate switching output.\n\n12: origin regression completes output.\n\n13: Electrical origin regression completes output.",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P06-30": {
-                    "Code": "P06-30",
-                    "Name": "read only",
-                    "Set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0276",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P06-31": {
-                    "Code": "P06-31",
-                    "Name": "read only",
-                    "Set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0277",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P06-32": {
-                    "Code": "P06-32",
-                    "Name": "read only",
-                    "Set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0278",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P06-33": {
-                    "Code": "P06-33",
-                    "Name": "read only",
-                    "Set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0279",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P06-34": {
-                    "Code": "P06-34",
-                    "Name": "read only",
-                    "Set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x027A",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P06-35": {
-                    "Code": "P06-35",
-                    "Name": "read only",
-                    "Set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x027B",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P06-36": {
-                    "Code": "P06-36",
-                    "Name": "read only",
-                    "Set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x027C",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P06-37": {
-                    "Code": "P06-37",
-                    "Name": "read only",
-                    "Set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x027D",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P06-38": {
-                    "Code": "P06-38",
-                    "Name": "read only",
-                    "Set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x027E",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P06-39": {
-                    "Code": "P06-39",
-                    "Name": "read only",
-                    "Set": "0",
-                    "set_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x027F",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P06-40": {
-                    "Code": "P06-40",
-                    "Name": "Speed analog command input gain",
-                    "Set": "300",
-                    "set_range": "10-2000",
-                    "Default": "300",
-                    "Unit": "1rpm/V",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0280",
-                    "Min": "10",
-                    "Max": "2000",
-                    "Description": "Set range: 10-2000, unit 1rpm/V\n\nSet the coefficients between analog input and speed control instructions for CN1 input.\n\nExample: 500 represents 500 revolutions per minute for each V.",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P06-41": {
-                    "Code": "P06-41",
-                    "Name": "Speed simulation command filtering constant",
-                    "Set": "0.8",
-                    "set_range": "0-65535",
-                    "Default": "0.8",
-                    "Unit": "1ms",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0281",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "Set range: 0 to 6. 4, unit: ms\n\nSet the analog instruction filter time coefficient of CN1 input.",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "1",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P06-42": {
-                    "Code": "P06-42",
-                    "Name": "Speed analog instruction offset",
-                    "Set": "0",
-                    "set_range": "-10.000-10.000",
-                    "Default": "0",
-                    "Unit": "1V",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0282",
-                    "Min": "-10.000",
-                    "Max": "10.000",
-                    "Description": "Set range: - 10 000 - 10 000, unit V\n\nSet the zero offset of analog input for CN1 input.",
-                    "Symbol": "true",
-                    "Demical_Place": "3",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P06-43": {
-                    "Code": "P06-43",
-                    "Name": "Torque analog command gain",
-                    "Set": "10",
-                    "set_range": "0.0-100.0",
-                    "Default": "10",
-                    "Unit": "%",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0283",
-                    "Min": "0.0",
-                    "Max": "100.0",
-                    "Description": "Set range: 0 to 100. 0, unit 1%\n\nSet the coefficients between analog input and speed control instructions for CN1 input.\n\nFor example: 30 represents 30% rated torque per V.",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "1",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P06-44": {
-                    "Code": "P06-44",
-                    "Name": "Torque analog instruction filter constant",
-                    "Set": "0.8",
-                    "set_range": "0-64.00",
-                    "Default": "0.8",
-                    "Unit": "1ms",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0284",
-                    "Min": "0",
-                    "Max": "64.00",
-                    "Description": "Set range: 0 to 6. 4, unit: ms\n\nSet the analog instruction filter time coefficient of CN1 input.",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "2",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P06-45": {
-                    "Code": "P06-45",
-                    "Name": "Torque analog instruction offset",
-                    "Set": "0",
-                    "set_range": "-10.000-10.000",
-                    "Default": "0",
-                    "Unit": "1V",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0285",
-                    "Min": "-10.000",
-                    "Max": "10.000",
-                    "Description": "Set range: - 10 000 - 10 000, unit V\n\nSet the zero offset of analog input for CN1 input.",
-                    "Symbol": "true",
-                    "Demical_Place": "3",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P06-46": {
-                    "Code": "P06-46",
-                    "Name": "Speed simulation instruction dead zone",
-                    "Set": "0",
-                    "set_range": "0-10.000",
-                    "Default": "0",
-                    "Unit": "1V",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0286",
-                    "Min": "0",
-                    "Max": "10.000",
-                    "Description": "Set range: 0 to 10 000, unit V\n\nSet the dead-time voltage of the speed analog command, and the system defaults to zero when the analog is given in the range of positive and negative values.",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "3",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                },
-                "P06-47": {
-                    "Code": "P06-47",
-                    "Name": "Torque analog instruction dead zone",
-                    "Set": "0",
-                    "set_range": "0-10.000",
-                    "Default": "0",
-                    "Unit": "1V",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0287",
-                    "Min": "0",
-                    "Max": "10.000",
-                    "Description": "Set range: 0 to 10 000, unit V\n\nSetting the dead-time voltage of the torque analog command, the system defaults to zero when the analog is given within the range of positive and negative values.",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "3",
-                    "Permission": "0",
-                    "Shutdown_setting": "false",
-                    "Keep": "true"
-                }
-            },
-            "P08_advanced_function_parameter": {
-                "P08-00": {
-                    "Code": "P08-00",
-                    "Name": "Keep",
-                    "setting": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x0320",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "true"
-                },
-                "P08-01": {
-                    "Code": "P08-01",
-                    "Name": "Load rotation convention recognition mode",
-                    "setting": "0",
-                    "Setting_range": "0-1",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0321",
-                    "Min": "0",
-                    "Max": "1",
-                    "Description": "Set range: 0-1\n\n0: effective\n\n1: null and void",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "true"
-                },
-                "P08-02": {
-                    "Code": "P08-02",
-                    "Name": "Inertia identification maximum speed",
-                    "setting": "800",
-                    "Setting_range": "100-2000",
-                    "Default": "800",
-                    "Unit": "1rpm",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0322",
-                    "Min": "100",
-                    "Max": "2000",
-                    "Description": "Set range: 100-2000, unit: RPM\n\nWhen the off-line inertia is identified, the maximum speed of the motor is obtained.",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "true"
-                },
-                "P08-03": {
-                    "Code": "P08-03",
-                    "Name": "Inertia identification acceleration and deceleration time",
-                    "setting": "100",
-                    "Setting_range": "20-800",
-                    "Default": "100",
-                    "Unit": "1ms",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0323",
-                    "Min": "20",
-                    "Max": "800",
-                    "Description": "Set range: 20-800, unit: ms\n\nWhen the off-line inertia is identified, the acceleration and deceleration time of the motor",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "true"
-                },
-                "P08-04": {
-                    "Code": "P08-04",
-                    "Name": "Waiting time after completion of single inertia identification",
-                    "setting": "1000",
-                    "Setting_range": "50-10000",
-                    "Default": "1000",
-                    "Unit": "1ms",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0324",
-                    "Min": "50",
-                    "Max": "10000",
-                    "Description": "Set range: 50-10000, unit: ms\n\nWhen off-line inertia is identified, waiting time after completion of single inertia identification is completed.",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "true"
-                },
-                "P08-05": {
-                    "Code": "P08-05",
-                    "Name": "The number of motor turns required to complete single inertia.",
-                    "setting": "1.33",
-                    "Setting_range": "0-655.35",
-                    "Default": "1.33",
-                    "Unit": "圈",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0325",
-                    "Min": "0",
-                    "Max": "655.35",
-                    "Description": "This parameter is the number of turning circles automatically generated according to the setting conditions of P08-02, P08-03 and P08-04.",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "2",
-                    "Permission": "0",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "true"
-                },
-                "P08-06": {
-                    "Code": "P08-06",
-                    "Name": "Keep",
-                    "setting": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0326",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "true"
-                },
-                "P08-07": {
-                    "Code": "P08-07",
-                    "Name": "Keep",
-                    "setting": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0327",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "true"
-                },
-                "P08-08": {
-                    "Code": "P08-08",
-                    "Name": "Keep",
-                    "setting": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0328",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "true"
-                },
-                "P08-09": {
-                    "Code": "P08-09",
-                    "Name": "Keep",
-                    "setting": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0329",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "true"
-                },
-                "P08-10": {
-                    "Code": "P08-10",
-                    "Name": "Keep",
-                    "setting": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x032A",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "true"
-                },
-                "P08-11": {
-                    "Code": "P08-11",
-                    "Name": "Adaptive notch filter mode selection",
-                    "setting": "0",
-                    "Setting_range": "0-4",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x032B",
-                    "Min": "0",
-                    "Max": "4",
-                    "Description": "Set range: 0-4\n\nSet range: 0-4\n\nThird, fourth notch filter parameters are no longer automatically updated, save as the current value. But allow manual input.\n\n1:1 adaptive notch filter is effective. Third notch filter parameters can be updated automatical",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "true"
-                },
-                "P08-12": {
-                    "Code": "P08-12",
-                    "Name": "Keep",
-                    "setting": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x032C",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "true"
-                },
-                "P08-13": {
-                    "Code": "P08-13",
-                    "Name": "Adaptive notch filter vibration detection threshold",
-                    "setting": "4",
-                    "Setting_range": "1-7",
-                    "Default": "4",
-                    "Unit": "---",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x032D",
-                    "Min": "1",
-                    "Max": "7",
-                    "Description": "This parameter sets the sensitivity of adaptive notch filter to detect vibration. The smaller the parameter, the more sensitive the sensitivity is.",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "true"
-                },
-                "P08-14": {
-                    "Code": "P08-14",
-                    "Name": "Keep",
-                    "setting": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x032E",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "true"
-                },
-                "P08-15": {
-                    "Code": "P08-15",
-                    "Name": "Keep",
-                    "setting": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x032F",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "true"
-                },
-                "P08-16": {
-                    "Code": "P08-16",
-                    "Name": "Keep",
-                    "setting": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0330",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "true"
-                },
-                "P08-17": {
-                    "Code": "P08-17",
-                    "Name": "Keep",
-                    "setting": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0331",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "1",
-                    "Permission": "0",
-                    "Shutdown_setting": "faLSE",
-                    "Keep": "true"
-                },
-                "P08-18": {
-                    "Code": "P08-18",
-                    "Name": "Keep",
-                    "setting": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0332",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "true"
-                },
-                "P08-19": {
-                    "Code": "P08-19",
-                    "Name": "Feedback speed lowpass filter constant",
-                    "setting": "0,8",
-                    "Setting_range": "0-25.00",
-                    "Default": "0.8",
-                    "Unit": "1ms",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0333",
-                    "Min": "0",
-                    "Max": "25.00",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "2",
-                    "Permission": "0",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "false"
-                },
-                "P08-20": {
-                    "Code": "P08-20",
-                    "Name": "Torque command filtering constant",
-                    "setting": "0,84",
-                    "Setting_range": "0-25.00",
-                    "Default": "0.8",
-                    "Unit": "1ms",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0334",
-                    "Min": "0",
-                    "Max": "25.00",
-                    "Description": "Setting range: 0-25.00, unit: ms\n\nTorque command filter time constant. When the motor starts screaming, it can be set up appropriately.",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "2",
-                    "Permission": "0",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "false"
-                },
-                "P08-21": {
-                    "Code": "P08-21",
-                    "Name": "Keep",
-                    "setting": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0335",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "true"
-                },
-                "P08-22": {
-                    "Code": "P08-22",
-                    "Name": "Keep",
-                    "setting": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0336",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "true"
-                },
-                "P08-23": {
-                    "Code": "P08-23",
-                    "Name": "Keep",
-                    "setting": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0337",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "true"
-                },
-                "P08-24": {
-                    "Code": "P08-24",
-                    "Name": "Keep",
-                    "setting": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x0338",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "true"
-                },
-                "P08-25": {
-                    "Code": "P08-25",
-                    "Name": "Disturbance torque compensation gain",
-                    "setting": "0",
-                    "Setting_range": "0-100.0",
-                    "Default": "0",
-                    "Unit": "％",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0339",
-                    "Min": "0",
-                    "Max": "100.0",
-                    "Description": "Setting range: 0-100.0\n\nThe disturbance torque observation is worth the gain coefficient. The greater the value, the stronger the ability to resist disturbance torque, but the action noise may also increase.",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "1",
-                    "Permission": "0",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "false"
-                },
-                "P08-26": {
-                    "Code": "P08-26",
-                    "Name": "Disturbance torque filtering time constant",
-                    "setting": "0,8",
-                    "Setting_range": "0-25.0",
-                    "Default": "0.8",
-                    "Unit": "1ms",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x033A",
-                    "Min": "0",
-                    "Max": "25.0",
-                    "Description": "Setting range: 0-25.00, unit: ms\n\nThe larger the numerical value, the stronger the filtering effect and suppressing the action noise. However, excessive phase leads to phase delay, which affects the effect of disturbance torque suppression.",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "2",
-                    "Permission": "0",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "false"
-                },
-                "P08-27": {
-                    "Code": "P08-27",
-                    "Name": "Keep",
-                    "setting": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x033B",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "true"
-                },
-                "P08-28": {
-                    "Code": "P08-28",
-                    "Name": "Keep",
-                    "setting": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x033C",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "true"
-                },
-                "P08-29": {
-                    "Code": "P08-29",
-                    "Name": "Keep",
-                    "setting": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "read only",
-                    "Address": "0x033D",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "true"
-                },
-                "P08-30": {
-                    "Code": "P08-30",
-                    "Name": "Notch filter 1 frequency",
-                    "setting": "5000",
-                    "Setting_range": "50-5000",
-                    "Default": "5000",
-                    "Unit": "HZ",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x033E",
-                    "Min": "50",
-                    "Max": "5000",
-                    "Description": "Set range: 50-5000, unit: Hz\n\nCentral frequency of notch filter 1\n\nThe notch filter is invalid when set to 5000.",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "true"
-                },
-                "P08-31": {
-                    "Code": "P08-31",
-                    "Name": "Notch filter 1 width",
-                    "setting": "2",
-                    "Setting_range": "0-20",
-                    "Default": "2",
-                    "Unit": "---",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x033F",
-                    "Min": "0",
-                    "Max": "20",
-                    "Description": "Set range: 0-20\n\nNotch width rating of notch filter 1\n\nRatio of width to center frequency",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "true"
-                },
-                "P08-32": {
-                    "Code": "P08-32",
-                    "Name": "Notch filter 1 depth",
-                    "setting": "0",
-                    "Setting_range": "0-99",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0340",
-                    "Min": "0",
-                    "Max": "99",
-                    "Description": "Set range: 0-99\n\nNotch depth level of notch filter 1\n\nThe ratio relationship between the input and output of the notch center frequency.\n\nThe larger the parameter, the smaller the notch depth and the weaker the effect.",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "true"
-                },
-                "P08-33": {
-                    "Code": "P08-33",
-                    "Name": "Notch filter 2 frequency",
-                    "setting": "5000",
-                    "Setting_range": "50-5000",
-                    "Default": "5000",
-                    "Unit": "HZ",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0341",
-                    "Min": "50",
-                    "Max": "5000",
-                    "Description": "Set range: 50-5000, unit: Hz\n\nCentral frequency of notch filter 1\n\nThe notch filter is invalid when set to 5000.",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "true"
-                },
-                "P08-34": {
-                    "Code": "P08-34",
-                    "Name": "Notch filter 2 width",
-                    "setting": "2",
-                    "Setting_range": "0-20",
-                    "Default": "2",
-                    "Unit": "---",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0342",
-                    "Min": "0",
-                    "Max": "20",
-                    "Description": "Set range: 0-20\n\nNotch width rating of notch filter 1\n\nRatio of width to center frequency",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "true"
-                },
-                "P08-35": {
-                    "Code": "P08-35",
-                    "Name": "Notch filter 2 depth",
-                    "setting": "0",
-                    "Setting_range": "0-99",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0343",
-                    "Min": "0",
-                    "Max": "99",
-                    "Description": "Set range: 0-99\n\nNotch depth level of notch filter 1\n\nThe ratio relationship between the input and output of the notch center frequency.\n\nThe larger the parameter, the smaller the notch depth and the weaker the effect.",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "true"
-                },
-                "P08-36": {
-                    "Code": "P08-36",
-                    "Name": "Notch filter 3 frequency",
-                    "setting": "5000",
-                    "Setting_range": "50-5000",
-                    "Default": "5000",
-                    "Unit": "HZ",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0344",
-                    "Min": "50",
-                    "Max": "5000",
-                    "Description": "Set range: 50-5000, unit: Hz\n\nCentral frequency of notch filter 1\n\nThe notch filter is invalid when set to 5000.",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "true"
-                },
-                "P08-37": {
-                    "Code": "P08-37",
-                    "Name": "Notch filter 3 width",
-                    "setting": "2",
-                    "Setting_range": "0-20",
-                    "Default": "2",
-                    "Unit": "---",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0345",
-                    "Min": "0",
-                    "Max": "20",
-                    "Description": "Set range: 0-20\n\nNotch width rating of notch filter 1\n\nRatio of width to center frequency",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "true"
-                },
-                "P08-38": {
-                    "Code": "P08-38",
-                    "Name": "Notch filter 3 depth",
-                    "setting": "0",
-                    "Setting_range": "0-99",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0346",
-                    "Min": "0",
-                    "Max": "99",
-                    "Description": "Set range: 0-99\n\nNotch depth level of notch filter 1\n\nThe ratio relationship between the input and output of the notch center frequency.\n\nThe larger the parameter, the smaller the notch depth and the weaker the effect.",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "true"
-                },
-                "P08-39": {
-                    "Code": "P08-39",
-                    "Name": "Notch filter 4 frequency",
-                    "setting": "5000",
-                    "Setting_range": "50-5000",
-                    "Default": "5000",
-                    "Unit": "HZ",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0347",
-                    "Min": "50",
-                    "Max": "5000",
-                    "Description": "Set range: 50-5000, unit: Hz\n\nCentral frequency of notch filter 1\n\nThe notch filter is invalid when set to 5000.",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "true"
-                },
-                "P08-40": {
-                    "Code": "P08-40",
-                    "Name": "Notch filter 4 width",
-                    "setting": "2",
-                    "Setting_range": "0-20",
-                    "Default": "2",
-                    "Unit": "---",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0348",
-                    "Min": "0",
-                    "Max": "20",
-                    "Description": "Set range: 0-20\n\nNotch width rating of notch filter 1\n\nRatio of width to center frequency",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "true"
-                },
-                "P08-41": {
-                    "Code": "P08-41",
-                    "Name": "Notch filter 4 depth",
-                    "setting": "0",
-                    "Setting_range": "0-99",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "operation setting",
-                    "ChangeCondition": "Immediate",
-                    "Address": "0x0349",
-                    "Min": "0",
-                    "Max": "99",
-                    "Description": "Set range: 0-99\n\nNotch depth level of notch filter 1\n\nThe ratio relationship between the input and output of the notch center frequency.\n\nThe larger the parameter, the smaller the notch depth and the weaker the effect.",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "0",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "true"
-                }
-            },
-            "P10_Factory_parameter": {
-                "P10-00": {
-                    "Code": "P10-00",
-                    "Name": "keep",
-                    "Set": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x03E8",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "10",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "TRUE"
-                },
-                "P10-01": {
-                    "Code": "P10-01",
-                    "Name": "keep",
-                    "Set": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x03E9",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "10",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "TRUE"
-                },
-                "P10-02": {
-                    "Code": "P10-02",
-                    "Name": "keep",
-                    "Set": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x03EA",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "10",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "TRUE"
-                },
-                "P10-03": {
-                    "Code": "P10-03",
-                    "Name": "keep",
-                    "Set": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x03EB",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "10",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "TRUE"
-                },
-                "P10-04": {
-                    "Code": "P10-04",
-                    "Name": "keep",
-                    "Set": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x03EC",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "10",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "TRUE"
-                },
-                "P10-05": {
-                    "Code": "P10-05",
-                    "Name": "keep",
-                    "Set": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x03ED",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "10",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "TRUE"
-                },
-                "P10-06": {
-                    "Code": "P10-06",
-                    "Name": "keep",
-                    "Set": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x03EE",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "10",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "TRUE"
-                },
-                "P10-07": {
-                    "Code": "P10-07",
-                    "Name": "keep",
-                    "Set": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x03EF",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "10",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "TRUE"
-                },
-                "P10-08": {
-                    "Code": "P10-08",
-                    "Name": "keep",
-                    "Set": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x03F0",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "10",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "TRUE"
-                },
-                "P10-09": {
-                    "Code": "P10-09",
-                    "Name": "keep",
-                    "Set": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x03F1",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "10",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "TRUE"
-                },
-                "P10-10": {
-                    "Code": "P10-10",
-                    "Name": "keep",
-                    "Set": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x03F2",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "10",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "TRUE"
-                },
-                "P10-11": {
-                    "Code": "P10-11",
-                    "Name": "keep",
-                    "Set": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x03F3",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "10",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "TRUE"
-                },
-                "P10-12": {
-                    "Code": "P10-12",
-                    "Name": "keep",
-                    "Set": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x03F4",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "10",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "TRUE"
-                },
-                "P10-13": {
-                    "Code": "P10-13",
-                    "Name": "keep",
-                    "Set": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x03F5",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "10",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "TRUE"
-                },
-                "P10-14": {
-                    "Code": "P10-14",
-                    "Name": "keep",
-                    "Set": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x03F6",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "10",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "TRUE"
-                },
-                "P10-15": {
-                    "Code": "P10-15",
-                    "Name": "keep",
-                    "Set": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x03F7",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "10",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "TRUE"
-                },
-                "P10-16": {
-                    "Code": "P10-16",
-                    "Name": "keep",
-                    "Set": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x03F8",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "10",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "TRUE"
-                },
-                "P10-17": {
-                    "Code": "P10-17",
-                    "Name": "keep",
-                    "Set": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x03F9",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "10",
-                    "Shutdown_setting": "faLSE",
-                    "Keep": "TRUE"
-                },
-                "P10-18": {
-                    "Code": "P10-18",
-                    "Name": "servo model",
-                    "Set": "0",
-                    "Setting_range": "0-10",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x03FA",
-                    "Min": "0",
-                    "Max": "10",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "10",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "true"
-                },
-                "P10-19": {
-                    "Code": "P10-19",
-                    "Name": "keep",
-                    "Set": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x03FB",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "10",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "TRUE"
-                },
-                "P10-20": {
-                    "Code": "P10-20",
-                    "Name": "Total performance period lower 16",
-                    "Set": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x03FC",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "10",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "TRUE"
-                },
-                "P10-21": {
-                    "Code": "P10-21",
-                    "Name": "Total performance period up 16",
-                    "Set": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x03FD",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "10",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "true"
-                },
-                "P10-22": {
-                    "Code": "P10-22",
-                    "Name": "0perating authorization",
-                    "Set": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x03FE",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "10",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "true"
-                },
-                "P10-23": {
-                    "Code": "P10-23",
-                    "Name": "Parameter version",
-                    "Set": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x03FF",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "10",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "true"
-                },
-                "P10-24": {
-                    "Code": "P10-24",
-                    "Name": "keep",
-                    "Set": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x0400",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "10",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "TRUE"
-                },
-                "P10-25": {
-                    "Code": "P10-25",
-                    "Name": "keep",
-                    "Set": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x0401",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "10",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "TRUE"
-                },
-                "P10-26": {
-                    "Code": "P10-26",
-                    "Name": "keep",
-                    "Set": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x0402",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "10",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "TRUE"
-                },
-                "P10-27": {
-                    "Code": "P10-27",
-                    "Name": "keep",
-                    "Set": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x0403",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "10",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "TRUE"
-                },
-                "P10-28": {
-                    "Code": "P10-28",
-                    "Name": "keep",
-                    "Set": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x0404",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "10",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "TRUE"
-                },
-                "P10-29": {
-                    "Code": "P10-29",
-                    "Name": "keep",
-                    "Set": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x0405",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "10",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "TRUE"
-                },
-                "P10-30": {
-                    "Code": "P10-30",
-                    "Name": "keep",
-                    "Set": "0",
-                    "Setting_range": "0-65535",
-                    "Default": "0",
-                    "Unit": "---",
-                    "Setting_way": "---",
-                    "ChangeCondition": "---",
-                    "Address": "0x0406",
-                    "Min": "0",
-                    "Max": "65535",
-                    "Description": "---",
-                    "Symbol": "FALSE",
-                    "Demical_Place": "0",
-                    "Permission": "10",
-                    "Shutdown_setting": "FALSE",
-                    "Keep": "TRUE"
-                }
-            },
-        }
-    }
     selected_motor_parameter = {
         # definition of parameter which will be read out (and displayed in the table)
-        # possible parameters are the keys of <motor_parameter>
+        # possible parameters are the keys of <motor_parameter> (see iHSV_ParameterTable)
         # order of the tuple is used as order for the table
         'v5': (
             'Address',
@@ -9407,7 +85,8 @@ class iHSV:
             raise ValueError('Motor Version not supported')
 
         self.rs232 = self.rs232_settings[self.mv]
-        self.parameter = self.motor_parameter[self.mv]
+        # loaded on first use
+        self.parameter = ParameterDatabase(self.mv)
         self.liveData = self.motor_live_data[self.mv]
 
     def get_supported_motor_versions(self):
@@ -9420,30 +99,23 @@ class iHSV:
         return self.liveData
 
     def get_parameter_group_list(self):
-        return list(self.parameter.keys())
+        return self.parameter.get_groups()
 
     def get_parameter_list(self, group_list):
         """ Returns a list of all parameters from a parameter group list
+
+        The parameter dicts are shared - do not modify them.
         """
         pars_list = []
         for group in group_list:
-            for pars in self.parameter[group].values():
-                par_dict = {}
-                for par in pars:
-                    if par == 'Address':
-                        par_dict[par] = int(pars[par], 16)
-                    if par == 'Value':
-                        par_dict[par] = None
-                    if par == 'decimal_place':
-                        try:
-                            int(pars[par])
-                            par_dict[par] = pars[par]
-                        except ValueError:
-                            par_dict[par] = "0"
-                    else:
-                        par_dict[par] = pars[par]
-                pars_list.append(par_dict)
+            pars_list.extend(self.parameter.get_group(group))
         return pars_list
 
+    def get_parameter(self, address):
+        return self.parameter.get_parameter(address)
+
+    def get_parameter_by_code(self, code):
+        return self.parameter.get_parameter_by_code(code)
+
     def get_selected_motor_parameter(self):
         return self.selected_motor_parameter[self.mv]
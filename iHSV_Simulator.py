@@ -0,0 +1,432 @@
+#
+# iHSV Servo Tool
+# Copyright (C) 2018 Robert Budde
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+# Simulated iHSV drive - serves the live data and parameter registers of a motor version over
+# modbus rtu, backed by a simple model of a position controlled servo axis.
+#
+# In process: use SIMULATOR_PORT as comport (see iHSV_Modbus.open_bus), the responses
+# arrive after the time they would need on the wire at the configured baudrate.
+# Pseudo terminal (posix): "python iHSV_Simulator.py --motor v5" prints a device to connect to
+# (some kernels reject parity settings - even parity of v6 - on pseudo terminals).
+
+import argparse
+import math
+import os
+import random
+import select
+import struct
+import sys
+import threading
+import time
+
+import serial
+
+from iHSV_Properties import iHSV
+from iHSV_Parameters import ParameterDatabase
+from iHSV_Modbus import RtuTiming, crc16
+
+
+SIMULATOR_PORT = 'simulator'
+
+# response time of the simulated drive
+TURNAROUND = 0.002
+
+COUNTS_PER_REV = {'v5': 4000, 'v6': 131072}
+
+# parameter code: model attribute - tuning these changes the simulated response
+MODEL_PARAMETERS = {
+    'v5': {},
+    'v6': {
+        'P01-04': 'inertia_ratio',
+        'P02-00': 'position_gain',
+        'P02-03': 'feed_forward',
+        'P02-10': 'velocity_gain',
+    },
+}
+
+# live data name: model signal
+LIVE_SIGNALS = {
+    'Pos Cmd': 'pos_cmd',
+    'Real Pos': 'pos',
+    'Pos Feedback': 'pos',
+    'Pos Error': 'pos_error',
+    'Vel Cmd [Rpm]': 'vel_cmd',
+    'Vel Cmd [rpm]': 'vel_cmd',
+    'Real Vel [Rpm]': 'vel',
+    'Vel Feedback [rpm]': 'vel',
+    'Vel Error [Rpm]': 'vel_error',
+    'Torque Current Cmd': 'torque_cmd_permille',
+    'Real Torque Current': 'torque_permille',
+    'Torque Cmd [%]': 'torque_cmd_percent',
+    'Torque Feedback [%]': 'torque_percent',
+}
+
+# register read by the tool to check if the drive responds
+PROBE_REGISTER = 0x80
+
+
+class MotorModel:
+    """ Position controlled servo axis following back and forth moves
+
+    P position loop with velocity feed forward, PI velocity loop, torque limit and current loop
+    lag, driving the motor inertia plus a load (load_ratio times the motor inertia) with viscous
+    and coulomb friction. Positions in revolutions, velocities in rev/s, torques relative to
+    the rated torque.
+    """
+
+    def __init__(self, counts_per_rev, dt=0.00025):
+        self.counts_per_rev = counts_per_rev
+        self.dt = dt
+        # controller settings (tunable through the drive's parameters)
+        self.position_gain = 48.0       # 1/s
+        self.velocity_gain = 27.0       # Hz
+        self.feed_forward = 30.0        # %
+        self.inertia_ratio = 3.0        # load / motor inertia as set on the drive
+        # plant
+        self.load_ratio = 3.0           # actual load / motor inertia
+        self.motor_inertia = 1 / 2000.0  # rated torque accelerates the bare motor with 2000 rev/s^2
+        self.viscous = 0.001
+        self.coulomb = 0.02
+        self.torque_limit = 3.0
+        self.current_lag = 0.0005
+        # move profile: distance (rev), duration and dwell (s)
+        self.distance = 10.0
+        self.move_time = 1.0
+        self.dwell_time = 0.5
+
+        # seeded - the feedback noise is the same in every run
+        self.random = random.Random(0)
+        self.t = 0.0
+        self.pos = 0.0
+        self.vel = 0.0
+        self.integral = 0.0
+        self.torque = 0.0
+        self.torque_cmd = 0.0
+        self.pos_cmd, self.vel_cmd_ff = self.profile(0.0)
+        self.vel_cmd = 0.0
+
+    def profile(self, t):
+        # (position, velocity) of a smooth move out, a dwell, a move back and a dwell
+        cycle = 2 * (self.move_time + self.dwell_time)
+        tau = t % cycle
+        direction = 1
+        start = 0.0
+        if tau >= cycle / 2:
+            tau -= cycle / 2
+            direction = -1
+            start = self.distance
+        if tau >= self.move_time:
+            return start + direction * self.distance, 0.0
+        s = (1 - math.cos(math.pi * tau / self.move_time)) / 2
+        v = math.pi / (2 * self.move_time) * math.sin(math.pi * tau / self.move_time)
+        return start + direction * self.distance * s, direction * self.distance * v
+
+    def step(self):
+        self.t += self.dt
+        self.pos_cmd, self.vel_cmd_ff = self.profile(self.t)
+
+        # position loop
+        self.vel_cmd = self.position_gain * (self.pos_cmd - self.pos) + self.feed_forward / 100 * self.vel_cmd_ff
+        # velocity loop, integral time 4 / (2 pi f) - scaled with the inertia the drive assumes
+        omega = 2 * math.pi * self.velocity_gain
+        error = self.vel_cmd - self.vel
+        inertia = self.motor_inertia * (1 + self.inertia_ratio)
+        torque_cmd = inertia * omega * (error + self.integral * omega / 4)
+        if abs(torque_cmd) < self.torque_limit:
+            # no integration while saturated
+            self.integral += error * self.dt
+        self.torque_cmd = max(-self.torque_limit, min(self.torque_limit, torque_cmd))
+        self.torque += (self.torque_cmd - self.torque) * self.dt / (self.current_lag + self.dt)
+
+        friction = self.viscous * self.vel + (math.copysign(self.coulomb, self.vel) if self.vel else 0.0)
+        self.vel += (self.torque - friction) / (self.motor_inertia * (1 + self.load_ratio)) * self.dt
+        self.pos += self.vel * self.dt
+
+    def advance(self, t):
+        if t - self.t > 1.0:
+            # not polled for a while - continue from the current command, settled
+            self.t = t
+            self.pos, self.vel = self.profile(t)
+            self.integral = 0.0
+        while self.t < t:
+            self.step()
+
+    def signals(self):
+        counts = self.counts_per_rev
+        return {
+            'pos_cmd': round(self.pos_cmd * counts),
+            'pos': round(self.pos * counts),
+            'pos_error': round(self.pos_cmd * counts) - round(self.pos * counts),
+            'vel_cmd': round(self.vel_cmd * 60),
+            'vel': round(self.vel * 60),
+            'vel_error': round((self.vel_cmd - self.vel) * 60),
+            'torque_cmd_permille': round(self.torque_cmd * 1000),
+            'torque_permille': round(self.torque * 1000 + self.random.gauss(0, 3)),
+            'torque_cmd_percent': round(self.torque_cmd * 100),
+            'torque_percent': round(self.torque * 100 + self.random.gauss(0, 0.3)),
+        }
+
+
+class SimulatedDrive:
+    """ Holding registers of one drive - parameters (with their defaults) and live data from a MotorModel
+    """
+
+    def __init__(self, motor_version, start=None):
+        self.ihsv = iHSV(motor_version)
+        self.model = MotorModel(COUNTS_PER_REV[motor_version])
+        self.start = time.perf_counter() if start is None else start
+        self.lock = threading.Lock()
+
+        # address: (code, decimal places)
+        self.parameters = {}
+        self.registers = {PROBE_REGISTER: 0}
+        database = ParameterDatabase(motor_version)
+        for group in database.get_groups():
+            for parameter in database.get_group(group):
+                address = int(parameter['Address'], 16)
+                decimal = int(parameter.get('decimal_place', 0))
+                self.parameters[address] = (parameter.get('Code'), decimal)
+                try:
+                    self.registers[address] = round(float(parameter.get('Default', 0)) * 10 ** decimal) & 0xFFFF
+                except ValueError:
+                    self.registers[address] = 0
+        self.model_parameters = MODEL_PARAMETERS[motor_version]
+        for address in self.parameters:
+            self._apply(address)
+
+        # register: (signal, word index, words, signed)
+        self.live = {}
+        for regs, signed, name in self.ihsv.get_live_data_list():
+            for i, reg in enumerate(regs):
+                self.live[reg] = (LIVE_SIGNALS[name], i, len(regs), signed)
+
+    def _apply(self, address):
+        code, decimal = self.parameters[address]
+        attribute = self.model_parameters.get(code)
+        if attribute is not None and self.registers[address]:
+            setattr(self.model, attribute, self.registers[address] / 10 ** decimal)
+
+    def read(self, start, count):
+        """ Returns the register values - registers which are neither parameters nor live data read as 0
+        """
+        with self.lock:
+            self.model.advance(time.perf_counter() - self.start)
+            signals = self.model.signals()
+            values = []
+            for reg in range(start, start + count):
+                if reg in self.live:
+                    signal, index, words, signed = self.live[reg]
+                    value = signals[signal] & (0xFFFFFFFF if words == 2 else 0xFFFF)
+                    values.append(value >> 16 if words == 2 and index == 0 else value & 0xFFFF)
+                else:
+                    values.append(self.registers.get(reg, 0))
+            return values
+
+    def write(self, start, values):
+        with self.lock:
+            if any(reg not in self.parameters for reg in range(start, start + len(values))):
+                return False
+            for reg, value in zip(range(start, start + len(values)), values):
+                self.registers[reg] = value
+                self._apply(reg)
+            return True
+
+
+class SimulatedBus:
+    """ Answers modbus rtu requests for any number of simulated drives (created on first request)
+
+    Supports reading (function 3, 4) and writing (6, 16) holding registers. Requests with a bad
+    crc or for other slaves are not answered, writes to unknown registers are rejected with
+    exception 2, reading more than 125 registers too.
+    With an error_rate, that share of the responses is lost or garbled (one bit flipped) on the line.
+    """
+
+    def __init__(self, motor_version, slaves=None, error_rate=0.0):
+        self.motor_version = motor_version
+        self.slaves = slaves
+        self.error_rate = error_rate
+        self.random = random.Random(0)
+        self.drives = {}
+        self.start = time.perf_counter()
+
+    def drive(self, slave):
+        if slave not in self.drives:
+            self.drives[slave] = SimulatedDrive(self.motor_version, self.start)
+        return self.drives[slave]
+
+    def handle(self, request):
+        """ Returns the response to a request frame as the master receives it - None if there is none
+        """
+        response = self.respond(request)
+        if response and self.error_rate and self.random.random() < self.error_rate:
+            if self.random.random() < 0.5:
+                return None
+            bit = self.random.randrange(8 * len(response))
+            response = bytearray(response)
+            response[bit // 8] ^= 1 << bit % 8
+            response = bytes(response)
+        return response
+
+    def respond(self, request):
+        if len(request) < 4 or crc16(request[:-2]) != request[-2:]:
+            return None
+        slave, function = request[0], request[1]
+        if slave == 0 or (self.slaves is not None and slave not in self.slaves):
+            return None
+        drive = self.drive(slave)
+
+        if function in (3, 4) and len(request) == 8:
+            start, count = struct.unpack('>HH', request[2:6])
+            if not 1 <= count <= 125:
+                return self._exception(slave, function, 2)
+            values = drive.read(start, count)
+            response = struct.pack('>BBB', slave, function, 2 * count) + struct.pack('>%dH' % count, *values)
+        elif function == 6 and len(request) == 8:
+            start, value = struct.unpack('>HH', request[2:6])
+            if not drive.write(start, [value]):
+                return self._exception(slave, function, 2)
+            response = request[:6]
+        elif function == 16 and len(request) >= 9:
+            start, count = struct.unpack('>HH', request[2:6])
+            values = struct.unpack('>%dH' % count, request[7:7 + 2 * count])
+            if not drive.write(start, values):
+                return self._exception(slave, function, 2)
+            response = request[:6]
+        else:
+            return self._exception(slave, function, 1)
+        return response + crc16(response)
+
+    def _exception(self, slave, function, code):
+        response = struct.pack('>BBB', slave, function | 0x80, code)
+        return response + crc16(response)
+
+
+class SimulatedSerial:
+    """ Serial port object (as used by iHSV_Modbus.RtuTransport) connected to a SimulatedBus
+
+    A response can be read once the request and the response would have been transferred at the
+    configured baudrate plus the drive's turnaround - without a response, read() waits for the timeout.
+    """
+
+    def __init__(self, bus, port=SIMULATOR_PORT, turnaround=TURNAROUND):
+        self.bus = bus
+        self.port = port
+        self.turnaround = turnaround
+        self.baudrate = 57600
+        self.bytesize = 8
+        self.parity = serial.PARITY_NONE
+        self.stopbits = 1
+        self.timeout = 0.5
+        self.write_timeout = 2.0
+        self.is_open = True
+        self._response = b''
+        self._ready = 0.0
+
+    def open(self):
+        self.is_open = True
+
+    def isOpen(self):
+        return self.is_open
+
+    def close(self):
+        self.is_open = False
+
+    def write(self, data):
+        if not self.is_open:
+            raise serial.SerialException('Port is closed')
+        char = RtuTiming(self.baudrate, self.bytesize, self.parity, self.stopbits).char_time
+        response = self.bus.handle(bytes(data)) or b''
+        self._response = response
+        self._ready = time.perf_counter() + len(data) * char + (self.turnaround + len(response) * char if response else 0)
+        return len(data)
+
+    def read(self, size=1):
+        if not self.is_open:
+            raise serial.SerialException('Port is closed')
+        now = time.perf_counter()
+        deadline = now + (self.timeout if self.timeout is not None else 1e9)
+        if self._response and len(self._response) >= size:
+            time.sleep(max(0.0, self._ready - now))
+        else:
+            # not enough data - like a real port, wait for the timeout
+            time.sleep(max(0.0, deadline - now))
+        data, self._response = self._response[:size], self._response[size:]
+        return data
+
+    def reset_input_buffer(self):
+        self._response = b''
+
+    def reset_output_buffer(self):
+        pass
+
+    def flush(self):
+        pass
+
+
+_buses = {}
+
+
+def simulated_port(motor_version):
+    """ Returns the simulated serial port of a motor version - all drives using it share one bus
+    """
+    if motor_version not in _buses:
+        _buses[motor_version] = SimulatedSerial(SimulatedBus(motor_version))
+    return _buses[motor_version]
+
+
+def serve_pty(bus, rs232, turnaround=TURNAROUND):
+    """ Serves a SimulatedBus on a pseudo terminal - prints its device name, runs until interrupted
+    """
+    import tty
+
+    master, slave = os.openpty()
+    tty.setraw(slave)
+    print(os.ttyname(slave), flush=True)
+    timing = RtuTiming.from_settings(rs232)
+    char = timing.char_time
+    request = b''
+    while True:
+        # a frame ends with the inter-frame silence
+        readable, _, _ = select.select([master], [], [], timing.silence if request else None)
+        if readable:
+            request += os.read(master, 256)
+            continue
+        response = bus.handle(request)
+        if response:
+            time.sleep(len(request) * char + turnaround + len(response) * char)
+            os.write(master, response)
+        request = b''
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Simulated iHSV drive on a pseudo terminal')
+    parser.add_argument('--motor', default='v5', choices=sorted(iHSV.supported_motor_versions.values()),
+                        help='motor version (default: %(default)s)')
+    parser.add_argument('--slaves', help='comma separated slave addresses to answer (default: all)')
+    parser.add_argument('--error-rate', type=float, default=0.0,
+                        help='share of the responses lost or garbled on the line (default: %(default)s)')
+    args = parser.parse_args(argv)
+    slaves = None if args.slaves is None else {int(slave) for slave in args.slaves.split(',')}
+    try:
+        serve_pty(SimulatedBus(args.motor, slaves, args.error_rate), iHSV(args.motor).rs232)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,63 @@
+#
+# iHSV Servo Tool
+# Copyright (C) 2018 Robert Budde
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+# Tests of the acquisition thread - python -m pytest (or python -m unittest)
+
+import threading
+import time
+import unittest
+
+from iHSV_Acquisition import AcquisitionWorker
+from iHSV_Modbus import NoResponseError
+
+
+class AcquisitionWorkerTest(unittest.TestCase):
+
+    def test_gaps(self):
+        # the 3rd read fails, the 6th one is late
+        reads = []
+        done = threading.Event()
+
+        def read_registers(start, count):
+            reads.append(start)
+            if len(reads) == 3:
+                raise NoResponseError('No answer')
+            if len(reads) == 6:
+                time.sleep(0.1)
+            if len(reads) == 8:
+                done.set()
+            return [len(reads)] * count
+
+        worker = AcquisitionWorker(read_registers, [(0x10, 1)], period=0.01, adaptive=False)
+        worker.start()
+        self.assertTrue(done.wait(5))
+        worker.stop()
+        samples = worker.get_samples()
+        values = [values and values[0] for _, _, values in samples]
+
+        # a gap where the read failed
+        failed = values.index(None)
+        self.assertEqual(values[failed - 1:failed + 2], [2, None, 4])
+        self.assertEqual(worker.errors, 1)
+        # a gap halfway between the late sample and the one before
+        late = values.index(6)
+        self.assertIsNone(values[late - 1])
+        self.assertAlmostEqual(samples[late - 1][0], (samples[late - 2][0] + samples[late][0]) / 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
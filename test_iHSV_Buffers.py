@@ -0,0 +1,83 @@
+#
+# iHSV Servo Tool
+# Copyright (C) 2018 Robert Budde
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+# Tests of the curve buffers - python -m pytest (or python -m unittest)
+
+import unittest
+
+import numpy as np
+
+from iHSV_Buffers import HistoryBuffer, RingBuffer
+
+
+class RingBufferTest(unittest.TestCase):
+
+    def test_append(self):
+        buffer = RingBuffer(3)
+        self.assertEqual(buffer.view().tolist(), [])
+        for value in range(5):
+            buffer.append(value)
+        # oldest to newest, the first ones overwritten
+        self.assertEqual(len(buffer), 3)
+        self.assertEqual(buffer.view().tolist(), [2, 3, 4])
+
+    def test_extend(self):
+        buffer = RingBuffer(4)
+        buffer.extend([1, 2, 3])
+        # wraps around
+        buffer.extend([4, 5])
+        self.assertEqual(buffer.view().tolist(), [2, 3, 4, 5])
+        # more than fits - only the last ones are kept
+        buffer.extend(range(10))
+        self.assertEqual(buffer.view().tolist(), [6, 7, 8, 9])
+
+    def test_clear(self):
+        buffer = RingBuffer(2)
+        buffer.extend([1, 2])
+        buffer.clear()
+        buffer.append(3)
+        self.assertEqual(buffer.view().tolist(), [3])
+
+
+class HistoryBufferTest(unittest.TestCase):
+
+    def test_render_visible_raw_samples(self):
+        buffer = HistoryBuffer(100)
+        buffer.extend(range(10), range(10))
+        # plus one sample on each side
+        t, y = buffer.render(3.5, 6.5)
+        self.assertEqual(t.tolist(), [3, 4, 5, 6, 7])
+        self.assertEqual(y.tolist(), [3, 4, 5, 6, 7])
+        self.assertEqual(buffer.render()[1].tolist(), list(range(10)))
+
+    def test_zoomed_out(self):
+        buffer = HistoryBuffer(100000, recent=1000, max_points=400)
+        values = np.zeros(100000)
+        values[5000] = 1000
+        values[7000:8000] = np.nan
+        buffer.extend(np.arange(100000) * 0.01, values)
+        self.assertEqual(len(buffer), 100000)
+        t, y = buffer.render(0, 1000)
+        # the min/max pyramid - spikes kept, gaps stay gaps
+        self.assertLessEqual(len(y), 400 + 1000)
+        self.assertEqual(np.nanmax(y), 1000)
+        self.assertTrue(np.isnan(y).any())
+        self.assertTrue(np.all(np.diff(t) >= 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+#
+# iHSV Servo Tool
+# Copyright (C) 2018 Robert Budde
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+# Tests of capture files - python -m pytest (or python -m unittest)
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import serial
+
+from iHSV_Capture import CaptureReader, CaptureWriter
+from iHSV_Modbus import RtuTiming, compile_read_plan
+
+
+class CaptureTest(unittest.TestCase):
+
+    live_data = [([0x10], True, 'a'), ([0x11, 0x12], False, 'b')]
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, 'test.ihsvcap')
+        timing = RtuTiming(57600, 8, serial.PARITY_NONE, 1)
+        self.plan = compile_read_plan([(name, regs, signed) for regs, signed, name in self.live_data], timing)
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def record(self, samples, failed=(), max_rows=2000000):
+        # one poll cycle every 10 ms, channel a = sample, b = 2 * sample
+        writer = CaptureWriter(self.path, 'v5', self.live_data, self.plan, chunk=64)
+        for i, sample in enumerate(samples):
+            if i in failed:
+                writer.append([(None, None)])
+            else:
+                writer.append([(writer.start + i * 0.01, [sample & 0xFFFF, (2 * sample >> 16) & 0xFFFF, 2 * sample & 0xFFFF])])
+        writer.close()
+        return CaptureReader(self.path, max_rows=max_rows)
+
+    def test_round_trip(self):
+        reader = self.record([1, -2, 3, 4], failed=[2])
+        self.assertEqual(len(reader), 4)
+        self.assertEqual(reader.motor_version, 'v5')
+        t0, t1 = reader.time_range()
+        self.assertAlmostEqual(t0, 0.0)
+        self.assertAlmostEqual(t1, 0.03)
+        t, y = reader.window('a', -1, 1)
+        # the failed read is a gap at the time it was due
+        np.testing.assert_allclose(t, [0.0, 0.01, 0.02, 0.03])
+        np.testing.assert_array_equal(y, [1, -2, np.nan, 4])
+        t, y = reader.window('b', -1, 1)
+        np.testing.assert_array_equal(y, [2, -4, np.nan, 8])
+
+
+    def test_spikes_are_kept_when_zoomed_out(self):
+        samples = [0] * 5000
+        samples[1234] = 1000
+        samples[4321] = -1000
+        # decoded in several chunks
+        reader = self.record(samples, max_rows=1000)
+        # decoded window - and the envelope of the whole capture
+        for max_points in (40, 8):
+            t, y = reader.window('a', -1, 100, max_points=max_points)
+            self.assertLessEqual(len(y), max_points)
+            self.assertEqual((y.min(), y.max()), (-1000, 1000))
+            self.assertTrue(np.all(np.diff(t) >= 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
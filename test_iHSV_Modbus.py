@@ -0,0 +1,213 @@
+#
+# iHSV Servo Tool
+# Copyright (C) 2018 Robert Budde
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+# Tests of the modbus rtu framing, read planning, decoding and batched reads - python -m pytest (or python -m unittest)
+
+import unittest
+
+import numpy as np
+import serial
+
+from iHSV_Modbus import (BlockDecoder, CrcError, IllegalRequestError, IncompleteResponseError, NoResponseError, ResponseParser,
+                         RtuTiming, SlaveDeviceBusyError, UnexpectedResponseError, compile_read_plan, crc16, plan_reads, read_request,
+                         read_registers_batched, write_request)
+
+
+def frame(*data):
+    data = bytes(data)
+    return data + crc16(data)
+
+
+class Crc16Test(unittest.TestCase):
+
+    def test_known_frame(self):
+        # read one register at 0 from slave 1 - the example of the modbus specification
+        self.assertEqual(crc16(bytes([0x01, 0x03, 0x00, 0x00, 0x00, 0x01])), bytes([0x84, 0x0A]))
+
+    def test_requests(self):
+        self.assertEqual(read_request(1, 0, 1), bytes([0x01, 0x03, 0x00, 0x00, 0x00, 0x01, 0x84, 0x0A]))
+        self.assertEqual(write_request(2, 0x0102, -1)[:6], bytes([0x02, 0x06, 0x01, 0x02, 0xFF, 0xFF]))
+
+
+class ResponseParserTest(unittest.TestCase):
+
+    def test_read_response_in_pieces(self):
+        parser = ResponseParser(read_request(1, 0x85, 2))
+        self.assertEqual(parser.missing, 5)
+        response = frame(0x01, 0x03, 0x04, 0x12, 0x34, 0xFF, 0xFE)
+        parser.feed(response[:5])
+        self.assertEqual(parser.missing, 4)
+        parser.feed(response[5:])
+        self.assertEqual(parser.missing, 0)
+        self.assertEqual(parser.result(), [0x1234, 0xFFFE])
+
+    def test_write_response(self):
+        request = write_request(1, 0x06, 3)
+        parser = ResponseParser(request)
+        parser.feed(request)
+        self.assertEqual(parser.missing, 0)
+        self.assertIsNone(parser.result())
+
+    def test_exception_response(self):
+        parser = ResponseParser(read_request(1, 0x85, 10))
+        parser.feed(frame(0x01, 0x83, 0x02))
+        # complete without waiting for the length of a read response
+        self.assertEqual(parser.missing, 0)
+        self.assertRaises(IllegalRequestError, parser.result)
+
+        parser = ResponseParser(write_request(1, 0x06, 3))
+        parser.feed(frame(0x01, 0x86, 0x06))
+        self.assertRaises(SlaveDeviceBusyError, parser.result)
+
+    def test_no_response(self):
+        self.assertRaises(NoResponseError, ResponseParser(read_request(1, 0x85, 1)).result)
+
+    def test_short_response(self):
+        parser = ResponseParser(read_request(1, 0x85, 2))
+        parser.feed(frame(0x01, 0x03, 0x04, 0x12, 0x34, 0xFF, 0xFE)[:6])
+        self.assertEqual(parser.missing, 3)
+        self.assertRaises(IncompleteResponseError, parser.result)
+
+    def test_garbled_response(self):
+        response = bytearray(frame(0x01, 0x03, 0x02, 0x12, 0x34))
+        response[3] ^= 0x10
+        parser = ResponseParser(read_request(1, 0x85, 1))
+        parser.feed(bytes(response))
+        self.assertRaises(CrcError, parser.result)
+
+    def test_unexpected_response(self):
+        parser = ResponseParser(read_request(1, 0x85, 1))
+        parser.feed(frame(0x02, 0x03, 0x02, 0x12, 0x34))
+        self.assertRaises(UnexpectedResponseError, parser.result)
+
+        parser = ResponseParser(write_request(1, 0x06, 3))
+        parser.feed(frame(0x01, 0x06, 0x00, 0x06, 0x00, 0x04))
+        self.assertRaises(UnexpectedResponseError, parser.result)
+
+
+class PlanTest(unittest.TestCase):
+
+    def setUp(self):
+        self.timing = RtuTiming(57600, 8, serial.PARITY_NONE, 1)
+
+    def test_small_gaps_are_read_along(self):
+        self.assertEqual(plan_reads([0x10, 0x12], self.timing), [(0x10, 3)])
+
+    def test_large_gaps_are_split(self):
+        self.assertEqual(plan_reads([0x10, 0x80], self.timing), [(0x10, 1), (0x80, 1)])
+
+    def test_max_count(self):
+        self.assertEqual(plan_reads(range(5), self.timing, max_count=2), [(0, 2), (2, 2), (4, 1)])
+
+    def test_spans_are_not_split(self):
+        self.assertEqual(plan_reads([(0, 1), 2], self.timing, max_count=2), [(0, 2), (2, 1)])
+        self.assertRaises(ValueError, plan_reads, [(0, 2)], self.timing, max_count=2)
+
+
+class CompileReadPlanTest(unittest.TestCase):
+
+    def setUp(self):
+        self.timing = RtuTiming(57600, 8, serial.PARITY_NONE, 1)
+
+    def test_slow_channel_in_fast_block(self):
+        channels = [('a', [0x10, 0x11], False, 1), ('b', [0x12], True, 5), ('c', [0x13], False, 1)]
+        plan = compile_read_plan(channels, self.timing)
+        self.assertEqual(len(plan), 1)
+        self.assertEqual([key for _, key in plan[0][2]], ['a', 'c', 'b'])
+        self.assertEqual(plan[0][4], 1)
+
+    def test_slow_channel_next_to_fast_block(self):
+        # a register more every cycle is cheaper than a request of its own in one cycle
+        channels = [('a', [0x10, 0x11], False, 1), ('b', [0x12], True, 10)]
+        plan = compile_read_plan(channels, self.timing)
+        self.assertEqual([(entry[0], entry[1], entry[4]) for entry in plan], [(0x10, 3, 1)])
+        self.assertEqual(plan[0][3].decode([1, 2, 0xFFFF]).tolist(), [0x10002, -1])
+
+    def test_slow_block(self):
+        channels = [('a', [0x10], False, 1), ('b', [0x80], False, 4)]
+        plan = compile_read_plan(channels, self.timing)
+        self.assertEqual([(entry[0], entry[1], entry[4]) for entry in plan], [(0x10, 1, 1), (0x80, 1, 4)])
+
+    def test_slow_reads_are_spread(self):
+        channels = [('a', [0x10], False, 2), ('b', [0x80], False, 2)]
+        plan = compile_read_plan(channels, self.timing)
+        self.assertEqual(sorted(entry[5] for entry in plan), [0, 1])
+
+
+class BlockDecoderTest(unittest.TestCase):
+
+    def test_decode(self):
+        decoder = BlockDecoder([(0, 1, False), (1, 1, True), (2, 2, False)])
+        words = [0xFFFF, 0xFFFF, 0xFFFF, 0xFFFE]
+        self.assertEqual(decoder.decode(words).tolist(), [65535, -1, -2])
+        # high word first
+        self.assertEqual(decoder.decode([0, 0, 0x0001, 0x0002])[2], 0x10002)
+
+    def test_decode_many(self):
+        decoder = BlockDecoder([(1, 1, True)])
+        values = decoder.decode(np.array([[0, 1], [0, 0x8000]]))
+        self.assertEqual(values.tolist(), [[1], [-32768]])
+
+
+class ScriptedBus:
+    """ Bus answering reads from a dict of registers, raising the exceptions put in instead of values
+    """
+
+    def __init__(self, registers):
+        self.registers = registers
+        self.requests = []
+
+    def read_registers(self, start, count):
+        self.requests.append((start, count))
+        for reg in range(start, start + count):
+            if isinstance(self.registers[reg], Exception):
+                raise self.registers[reg]
+        return [self.registers[reg] for reg in range(start, start + count)]
+
+    def read_register(self, reg):
+        return self.read_registers(reg, 1)[0]
+
+
+class ReadRegistersBatchedTest(unittest.TestCase):
+
+    def test_blocks(self):
+        bus = ScriptedBus({0: 1, 1: 2, 5: 3})
+        self.assertEqual(read_registers_batched(bus, [5, 0, 1]), {0: 1, 1: 2, 5: 3})
+        self.assertEqual(bus.requests, [(0, 2), (5, 1)])
+
+    def test_rejected_block_is_read_per_register(self):
+        bus = ScriptedBus({0: 1, 1: IllegalRequestError(), 2: 3})
+        self.assertEqual(read_registers_batched(bus, [0, 1, 2]), {0: 1, 1: None, 2: 3})
+
+    def test_timeout_fails_the_block(self):
+        bus = ScriptedBus({0: 1, 1: NoResponseError(), 2: 3, 5: 4})
+        self.assertEqual(read_registers_batched(bus, [0, 1, 2, 5]), {0: None, 1: None, 2: None, 5: 4})
+        self.assertEqual(bus.requests, [(0, 3), (5, 1)])
+
+    def test_port_error_aborts(self):
+        bus = ScriptedBus({0: serial.SerialException(), 5: 4})
+        self.assertEqual(read_registers_batched(bus, [0, 5]), {0: None, 5: None})
+        self.assertEqual(bus.requests, [(0, 1)])
+
+    def test_cancel(self):
+        bus = ScriptedBus({0: 1, 5: 2})
+        values = read_registers_batched(bus, [0, 5], cancelled=lambda: len(bus.requests) == 1)
+        self.assertEqual(values, {0: 1, 5: None})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+#
+# iHSV Servo Tool
+# Copyright (C) 2018 Robert Budde
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+# Tests of the parameter cache - python -m pytest (or python -m unittest)
+
+import unittest
+
+from iHSV_Parameters import ParameterCache
+
+
+class ParameterCacheTest(unittest.TestCase):
+
+    def test_update(self):
+        cache = ParameterCache()
+        self.assertEqual(cache.stale([1, 2]), [1, 2])
+        # failed reads are not cached
+        cache.update({1: 64536, 2: None})
+        self.assertEqual(cache.get(1), 64536)
+        self.assertIsNone(cache.get(2))
+        self.assertEqual(cache.stale([1, 2]), [2])
+
+    def test_invalidate(self):
+        cache = ParameterCache()
+        cache.update({1: 10, 2: 20})
+        cache.invalidate([1])
+        self.assertEqual(cache.stale([1, 2]), [1])
+        # the value is still shown until it is read again
+        self.assertEqual(cache.get(1), 10)
+        cache.invalidate()
+        self.assertEqual(cache.stale([1, 2]), [1, 2])
+
+    def test_max_age(self):
+        cache = ParameterCache(max_age=60)
+        cache.update({1: 10, 2: 20})
+        # read a minute and a half ago
+        cache.entries[1][1] -= 90
+        self.assertTrue(cache.is_stale(1))
+        self.assertFalse(cache.is_stale(2))
+        self.assertGreater(cache.age(1), 60)
+
+    def test_clear(self):
+        cache = ParameterCache()
+        cache.update({1: 10})
+        cache.clear()
+        self.assertIsNone(cache.get(1))
+        self.assertIsNone(cache.age(1))
+
+
+if __name__ == '__main__':
+    unittest.main()